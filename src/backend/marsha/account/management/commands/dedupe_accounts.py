@@ -19,6 +19,17 @@ class Command(BaseCommand):
         """Add arguments to the command."""
         parser.add_argument("--email", type=str, help="Email to dedupe")
         parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of duplicate groups merged concurrently",
+        )
+        parser.add_argument(
+            "--journal",
+            type=str,
+            help="File journaling the groups merged, to resume an interrupted run",
+        )
 
     def handle(self, *args, **options):
         """Handle command."""
@@ -26,4 +37,9 @@ class Command(BaseCommand):
         if dry_run:
             logger.info("[DRY-RUN] No changes will be made.")
 
-        dedupe_accounts(options["email"], dry_run)
+        dedupe_accounts(
+            options["email"],
+            dry_run,
+            workers=options["workers"],
+            journal=options["journal"],
+        )
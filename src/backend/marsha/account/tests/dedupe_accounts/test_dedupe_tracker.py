@@ -437,3 +437,36 @@ class DedupeTrackerTest(TestCase):
         self.tracker.mark_transferred_portability_requests(user, 3)
 
         self.assertEqual(self.tracker.transferred_portability_requests[user.email], 4)
+
+    def test_merge(self):
+        """Test merge adds the operations tracked by another tracker."""
+        self.tracker.track_organization_uid_migration("org-1", "org-2")
+        self.tracker.mark_account_for_deletion("org-1:first@test.com")
+        self.tracker.transferred_created_videos["first@test.com"] = 1
+        other = DedupeTracker()
+        other.track_organization_uid_migration("org-2", "org-3")
+        other.track_same_account_migration(
+            "second@test.com", "org-2:second@test.com", "org-3:second@test.com"
+        )
+        other.mark_account_for_deletion("org-2:second@test.com")
+        other.mark_user_for_deletion("second")
+        other.transferred_created_videos["second@test.com"] = 2
+
+        self.tracker.merge(other)
+
+        self.assertEqual(
+            self.tracker.organization_uid_migrations, {"org-1": ["org-2", "org-3"]}
+        )
+        self.assertEqual(
+            self.tracker.same_account_migrations,
+            {"second@test.com": ["org-2:second@test.com", "org-3:second@test.com"]},
+        )
+        self.assertEqual(
+            self.tracker.deleted_sso_accounts,
+            ["org-1:first@test.com", "org-2:second@test.com"],
+        )
+        self.assertEqual(self.tracker.deleted_user_accounts, ["second"])
+        self.assertEqual(
+            self.tracker.transferred_created_videos,
+            {"first@test.com": 1, "second@test.com": 2},
+        )
@@ -1,9 +1,12 @@
 """Tests for the UserDeduplicator class."""
 
+import json
+import os
+import tempfile
 from unittest.mock import Mock
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 
 from social_django.models import UserSocialAuth
 
@@ -719,3 +722,106 @@ class UserDeduplicatorTest(TestCase):
         self.deduplicator.deduplicate(email)
 
         self.assertEqual(len(self.deduplicator.tracker.deleted_user_accounts), 1)
+
+    def test_plan(self):
+        """Test plan loads all the duplicate groups at once, ordered by join date."""
+        first = PlaylistAccessFactory(user__email="first@test.com").user
+        first_duplicate = PlaylistAccessFactory(user__email="first@test.com").user
+        second = PlaylistAccessFactory(user__email="second@test.com").user
+        second_duplicates = [
+            PlaylistAccessFactory(user__email="second@test.com").user
+            for _ in range(2)
+        ]
+        PlaylistAccessFactory(user__email="unique@test.com")
+        PlaylistAccessFactory(user__email="")
+        PlaylistAccessFactory(user__email="")
+
+        # The duplicate emails, then all their users
+        with self.assertNumQueries(2):
+            plan = self.deduplicator.plan()
+
+        self.assertEqual(
+            plan,
+            [
+                ("first@test.com", first, [first_duplicate]),
+                ("second@test.com", second, second_duplicates),
+            ],
+        )
+
+    def test_transfer_playlists_set_based(self):
+        """Test transfer_playlists does not query each playlist access."""
+        original_user = UserFactory()
+        duplicate_user = UserFactory()
+        shared_playlist = PlaylistFactory()
+        PlaylistAccessFactory(user=original_user, playlist=shared_playlist)
+        PlaylistAccessFactory(user=duplicate_user, playlist=shared_playlist)
+        moved_accesses = PlaylistAccessFactory.create_batch(3, user=duplicate_user)
+
+        with self.assertNumQueries(4):
+            self.deduplicator.transfer_playlists(original_user, duplicate_user)
+
+        self.assertEqual(
+            set(original_user.playlist_accesses.values_list("id", flat=True)),
+            {
+                *[access.id for access in moved_accesses],
+                *original_user.playlist_accesses.filter(
+                    playlist=shared_playlist
+                ).values_list("id", flat=True),
+            },
+        )
+        self.assertFalse(duplicate_user.playlist_accesses.exists())
+        for access in moved_accesses:
+            access.playlist.refresh_from_db()
+            self.assertEqual(access.playlist.created_by, original_user)
+
+    def test_deduplicate_journal(self):
+        """Test deduplicate journals the groups merged and skips them when resumed."""
+        for email in ["first@test.com", "second@test.com"]:
+            PlaylistAccessFactory(user__email=email)
+            PlaylistAccessFactory(user__email=email)
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = os.path.join(directory, "journal.jsonl")
+            with open(journal, "w", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps({"email": "first@test.com"}) + "\n")
+
+            deduplicator = UserDeduplicator(journal=journal)
+            deduplicator.deduplicate()
+
+            with open(journal, encoding="utf-8") as journal_file:
+                entries = [json.loads(line) for line in journal_file]
+
+        self.assertEqual(User.objects.filter(email="first@test.com").count(), 2)
+        self.assertEqual(User.objects.filter(email="second@test.com").count(), 1)
+        self.assertEqual(
+            [entry["email"] for entry in entries],
+            ["first@test.com", "second@test.com"],
+        )
+        self.assertEqual(
+            entries[1]["original_user"],
+            str(User.objects.get(email="second@test.com").id),
+        )
+        self.assertEqual(len(deduplicator.tracker.deleted_user_accounts), 1)
+
+
+class UserDeduplicatorWorkersTest(TransactionTestCase):
+    """Test suite for UserDeduplicator merging groups concurrently."""
+
+    def test_deduplicate_workers(self):
+        """Test deduplicate merges independent groups in concurrent transactions."""
+        emails = [f"user{index}@test.com" for index in range(4)]
+        originals = {}
+        for email in emails:
+            originals[email] = PlaylistAccessFactory(user__email=email).user
+            PlaylistAccessFactory(user__email=email)
+            PlaylistAccessFactory(user__email=email)
+
+        deduplicator = UserDeduplicator(workers=2)
+        deduplicator.deduplicate()
+
+        for email in emails:
+            self.assertEqual(
+                list(User.objects.filter(email=email)), [originals[email]]
+            )
+            self.assertEqual(originals[email].playlist_accesses.count(), 3)
+        self.assertEqual(len(deduplicator.tracker.deleted_user_accounts), 8)
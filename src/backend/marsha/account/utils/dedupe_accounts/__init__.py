@@ -3,7 +3,7 @@
 from marsha.account.utils.dedupe_accounts.user_deduplicator import UserDeduplicator
 
 
-def dedupe_accounts(duplicate_email=None, dry_run=False):
+def dedupe_accounts(duplicate_email=None, dry_run=False, workers=1, journal=None):
     """Deduplicate accounts."""
-    deduplicator = UserDeduplicator(dry_run=dry_run)
+    deduplicator = UserDeduplicator(dry_run=dry_run, workers=workers, journal=journal)
     return deduplicator.deduplicate(duplicate_email)
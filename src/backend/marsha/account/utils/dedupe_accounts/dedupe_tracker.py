@@ -140,6 +140,37 @@ class DedupeTracker:  # pylint: disable=too-many-instance-attributes
             self.transferred_portability_requests[user.email] = 0
         self.transferred_portability_requests[user.email] += count
 
+    def merge(self, other):
+        """Merge the operations tracked by another tracker, e.g. of another group."""
+        for original_org_uid, new_org_uids in other.organization_uid_migrations.items():
+            for new_org_uid in new_org_uids:
+                self.track_organization_uid_migration(original_org_uid, new_org_uid)
+
+        for name in ("deleted_sso_accounts", "deleted_user_accounts"):
+            getattr(self, name).extend(getattr(other, name))
+
+        for name in (
+            "same_account_migrations",
+            "different_account_merges",
+            "transferred_organizations",
+            "transferred_lti_associations",
+        ):
+            getattr(self, name).update(getattr(other, name))
+
+        for name in (
+            "transferred_lti_passports",
+            "transferred_consumersite_accesses",
+            "transferred_playlist_accesses",
+            "transferred_created_playlists",
+            "transferred_created_videos",
+            "transferred_created_documents",
+            "transferred_created_markdown_documents",
+            "transferred_portability_requests",
+        ):
+            counts = getattr(self, name)
+            for email, count in getattr(other, name).items():
+                counts[email] = counts.get(email, 0) + count
+
     def log_results(self, dry_run=False):
         """Log deduplication results."""
         logger.info("-" * 80)
@@ -1,21 +1,40 @@
 """Handles user account deduplication logic."""
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+import json
 import logging
+import os
 
 from django.contrib.auth import get_user_model
+from django.db import connection, transaction
 from django.db.models import Count
 
 from marsha.account.utils.dedupe_accounts.dedupe_tracker import DedupeTracker
+from marsha.core.models import Playlist
 
 
 logger = logging.getLogger(__name__)
 
 
 class UserDeduplicator:  # pylint: disable=too-many-public-methods
-    """Handles user deduplication logic."""
+    """
+    Handles user deduplication logic.
 
-    def __init__(self, dry_run=False):
+    The merges of all the duplicate groups are planned up front, then each group of
+    users sharing an email is merged in its own transaction, the relations of each
+    duplicate user being transferred with set-based updates and deletes. Groups are
+    independent and merged concurrently by `workers` threads.
+
+    When a `journal` path is given, the groups merged are appended to it as JSON lines
+    and the groups it already holds are skipped, an interrupted run resumes where it
+    stopped.
+    """
+
+    def __init__(self, dry_run=False, workers=1, journal=None):
         self.dry_run = dry_run
+        self.workers = workers
+        self.journal = journal
         self.tracker = DedupeTracker()
 
     @staticmethod
@@ -48,14 +67,14 @@ class UserDeduplicator:  # pylint: disable=too-many-public-methods
     def transfer_playlists(self, original_user, duplicate_user):
         """Transfer playlists from duplicate user to original user."""
         if not self.dry_run:
-            for playlist_access in duplicate_user.playlist_accesses.all():
-                playlist_access.playlist.created_by = original_user
-                playlist_access.playlist.save()
-                if playlist_access.playlist not in original_user.playlists.all():
-                    playlist_access.user = original_user
-                    playlist_access.save()
-                else:
-                    playlist_access.delete()
+            Playlist.objects.filter(
+                id__in=duplicate_user.playlist_accesses.values("playlist_id")
+            ).update(created_by=original_user)
+            duplicate_user.playlist_accesses.exclude(
+                playlist_id__in=original_user.playlist_accesses.values("playlist_id")
+            ).update(user=original_user)
+            # The accesses left are to playlists the original user already accesses
+            duplicate_user.playlist_accesses.all().delete()
 
     def transfer_organizations(self, original_user, duplicate_user):
         """Transfer organizations from duplicate user to original user."""
@@ -67,13 +86,11 @@ class UserDeduplicator:  # pylint: disable=too-many-public-methods
             self.tracker.mark_transferred_orgs(original_user, new_organizations)
 
             if not self.dry_run:
-                for organization_access in duplicate_user.organization_accesses.all():
-                    if (
-                        organization_access.organization
-                        not in original_user.organization_set.all()
-                    ):
-                        organization_access.user = original_user
-                        organization_access.save()
+                duplicate_user.organization_accesses.exclude(
+                    organization_id__in=original_user.organization_accesses.values(
+                        "organization_id"
+                    )
+                ).update(user=original_user)
 
     def transfer_lti_associations(self, original_user, duplicate_user):
         """Transfer LTI associations from duplicate user to original user."""
@@ -278,26 +295,98 @@ class UserDeduplicator:  # pylint: disable=too-many-public-methods
                 new_org_uid,
             )
 
-    def deduplicate(self, duplicate_email=None):
-        """Execute the deduplication process."""
+    def plan(self, duplicate_email=None):
+        """
+        Plan the merges of all the duplicate groups.
+
+        Returns
+        -------
+        list
+            A tuple for each email shared by several users, holding the email, the
+            original user, first to have joined, and the duplicate users. All the
+            users are loaded in a single query.
+        """
         User = get_user_model()  # pylint: disable=invalid-name
-        duplicates = self.get_duplicate_emails(duplicate_email)
-
-        processed = 0
-        total = len(duplicates)
+        emails = [
+            duplicate["email"]
+            for duplicate in self.get_duplicate_emails(duplicate_email)
+            if duplicate["email"]
+        ]
+        done_emails = self.read_journal()
+        users = User.objects.filter(
+            email__in=[email for email in emails if email not in done_emails]
+        ).order_by("email", "date_joined")
+
+        plan = []
+        for email, group in groupby(users, key=lambda user: user.email):
+            original_user, *duplicate_users = group
+            if duplicate_users:
+                plan.append((email, original_user, duplicate_users))
+        return plan
+
+    def read_journal(self):
+        """Return the emails of the groups already merged according to the journal."""
+        if not self.journal or not os.path.exists(self.journal):
+            return set()
+
+        with open(self.journal, encoding="utf-8") as journal:
+            return {json.loads(line)["email"] for line in journal if line.strip()}
+
+    def write_journal(self, email, original_user, duplicate_users):
+        """Append a group merged to the journal."""
+        if not self.journal or self.dry_run:
+            return
 
-        for duplicate in duplicates:
-            email = duplicate["email"]
-            if not email:
-                continue
+        with open(self.journal, "a", encoding="utf-8") as journal:
+            journal.write(
+                json.dumps(
+                    {
+                        "email": email,
+                        "original_user": str(original_user.id),
+                        "duplicate_users": [str(user.id) for user in duplicate_users],
+                    }
+                )
+                + "\n"
+            )
 
-            processed += 1
-            print(f"Deduping {processed}/{total}", end="\r", flush=True)
+    def deduplicate_group(self, email, original_user, duplicate_users):
+        """
+        Merge the duplicate users of a group in the original user, in a transaction.
+
+        Returns
+        -------
+        DedupeTracker
+            The operations of this group, tracked apart from the other groups merged
+            concurrently.
+        """
+        logger.debug("Merging %d duplicates of %s", len(duplicate_users), email)
+        deduplicator = UserDeduplicator(dry_run=self.dry_run)
+        try:
+            with transaction.atomic():
+                for duplicate_user in duplicate_users:
+                    deduplicator.process_duplicate_user(original_user, duplicate_user)
+        finally:
+            if self.workers > 1:
+                # Each worker thread opened its own connection to the database
+                connection.close()
+        return deduplicator.tracker
 
-            users = list(User.objects.filter(email=email).order_by("date_joined"))
-            original_user, *duplicate_users = users
+    def deduplicate(self, duplicate_email=None):
+        """Execute the deduplication process."""
+        plan = self.plan(duplicate_email)
+        total = len(plan)
 
-            for duplicate_user in duplicate_users:
-                self.process_duplicate_user(original_user, duplicate_user)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # A single worker merges the groups in the calling thread and its transaction
+            group_trackers = (executor.map if self.workers > 1 else map)(
+                lambda group: self.deduplicate_group(*group), plan
+            )
+            # Merge the operations tracked in the order of the plan
+            for processed, (group, group_tracker) in enumerate(
+                zip(plan, group_trackers), start=1
+            ):
+                print(f"Deduping {processed}/{total}", end="\r", flush=True)
+                self.tracker.merge(group_tracker)
+                self.write_journal(*group)
 
         self.tracker.log_results(self.dry_run)
@@ -32,6 +32,7 @@ from marsha.bbb.utils.bbb_utils import (
     end,
     get_recording_url,
     get_recordings,
+    invalidate_create_payload_cache,
     join,
     process_recordings,
 )
@@ -40,6 +41,7 @@ from marsha.core import defaults, permissions as core_permissions, storage
 from marsha.core.api import APIViewMixin, BulkDestroyModelMixin, ObjectPkMixin
 from marsha.core.defaults import READY, VOD_CONVERT
 from marsha.core.models import ADMINISTRATOR, INSTRUCTOR, Video
+from marsha.core.pagination import CursorLimitOffsetPagination
 from marsha.core.tasks.recording import copy_video_recording
 from marsha.core.tasks.video import launch_video_transcoding
 from marsha.core.utils.time_utils import to_datetime, to_timestamp
@@ -97,6 +99,7 @@ class ClassroomViewSet(
     ordering_fields = ["created_on", "title"]
     ordering = ["-created_on"]
     filterset_class = ClassroomFilter
+    pagination_class = CursorLimitOffsetPagination
 
     permission_classes = [
         (
@@ -650,6 +653,7 @@ class ClassroomDocumentViewSet(
             filename=serializer.validated_data["filename"],
             upload_state=defaults.PENDING,
         )
+        invalidate_create_payload_cache(classroom_document.classroom_id)
 
         return Response(presigned_post)
 
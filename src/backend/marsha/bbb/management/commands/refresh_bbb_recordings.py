@@ -1,18 +1,31 @@
 """Test update recording management command."""
 
-from datetime import timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 import logging
 
 from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+from django.utils import timezone
 
-from dateutil.parser import parse
+from requests.exceptions import RequestException
 
 from marsha.bbb.models import Classroom, ClassroomRecording
-from marsha.bbb.utils.bbb_utils import get_recordings, process_recordings
+from marsha.bbb.utils.bbb_utils import (
+    ApiMeetingException,
+    RateLimiter,
+    get_meetings_recordings,
+    get_recordings,
+    process_recordings,
+    sync_recordings,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Time BBB may take to publish the recordings of a session once it ended
+RECORDINGS_PROCESSING_DELAY = timedelta(days=1)
+
 
 class Command(BaseCommand):
     """Updates recording from BBB server."""
@@ -33,14 +46,36 @@ class Command(BaseCommand):
         parser.add_argument(
             "-a", "--after", type=str, help="Update recordings after this date."
         )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            default=False,
+            help="Sync all the classrooms, even those without session since their last sync.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Number of classrooms whose recordings are requested at once.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of concurrent requests to the BBB API.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=10,
+            help="Maximum number of requests per second to the BBB API.",
+        )
 
     def handle(self, *args, **options):
         """Execute management command."""
 
         classroom_id = options["classroom_id"]
         recording_id = options["recording_id"]
-        before = options["before"]
-        after = options["after"]
 
         if recording_id:
             try:
@@ -57,39 +92,73 @@ class Command(BaseCommand):
             )
             return
 
-        classrooms = Classroom.objects.all()
-        if classroom_id:
-            classrooms = classrooms.filter(id=classroom_id)
-
+        synced_at = timezone.now()
+        classrooms = self._get_classrooms(classroom_id, options["full"])
         if not classrooms:
             logger.info("No classroom found.")
             return
 
+        batches = []
         for classroom in classrooms:
-            logger.info("Classroom %s found.", classroom.id)
-            # cleanup existing recordings
-            classroom_recordings = classroom.recordings.all()
-            if before:
-                classroom_recordings = classroom_recordings.filter(
-                    started_at__lt=parse(before).replace(tzinfo=timezone.utc)
-                )
-            if after:
-                classroom_recordings = classroom_recordings.filter(
-                    started_at__gt=parse(after).replace(tzinfo=timezone.utc)
-                )
-            known_recording_ids = classroom_recordings.values_list(
-                "record_id", flat=True
+            if not batches or len(batches[-1]) == options["batch_size"]:
+                batches.append([])
+            batches[-1].append(classroom)
+
+        rate_limiter = RateLimiter(options["rate"])
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {
+                executor.submit(
+                    get_meetings_recordings,
+                    [classroom.meeting_id for classroom in batch],
+                    rate_limiter,
+                ): batch
+                for batch in batches
+            }
+            # Database changes are applied from the main thread only
+            for future in as_completed(futures):
+                self._sync_batch(futures[future], future, synced_at, options)
+
+    @staticmethod
+    def _get_classrooms(classroom_id, full):
+        """List the classrooms whose recordings must be synced."""
+        classrooms = Classroom.objects.all()
+        if classroom_id:
+            classrooms = classrooms.filter(id=classroom_id)
+        elif not full:
+            # Only classrooms never synced or with a session since their last sync
+            # can have new recordings
+            synced_since = F("recordings_synced_at") - RECORDINGS_PROCESSING_DELAY
+            classrooms = classrooms.filter(
+                Q(recordings_synced_at__isnull=True)
+                | Q(sessions__started_at__gte=synced_since)
+                | Q(sessions__ended_at__gte=synced_since)
+            ).distinct()
+
+        return list(classrooms.only("id", "meeting_id"))
+
+    @staticmethod
+    def _sync_batch(batch, future, synced_at, options):
+        """Sync the recordings of a batch of classrooms once they are retrieved."""
+        try:
+            recordings_data = future.result()
+        except (ApiMeetingException, RequestException) as error:
+            logger.error(
+                "Recordings of classrooms %s not synced: %s",
+                ", ".join(str(classroom.id) for classroom in batch),
+                error,
             )
-            for recording_id in known_recording_ids:
-                api_response = get_recordings(classroom.meeting_id, recording_id)
-                process_recordings(classroom, api_response, recording_id)
+            return
 
-            # get new recordings
-            api_response = get_recordings(classroom.meeting_id)
-            process_recordings(
-                classroom,
-                api_response,
-                record_ids_to_skip=known_recording_ids,
-                before=before,
-                after=after,
-            )
+        for classroom in batch:
+            logger.info("Classroom %s found.", classroom.id)
+        if not recordings_data:
+            logger.info("No recording found.")
+        sync_recordings(
+            batch, recordings_data, before=options["before"], after=options["after"]
+        )
+
+        # A sync restricted to some dates does not move the watermark
+        if not (options["before"] or options["after"]):
+            Classroom.objects.filter(
+                id__in=[classroom.id for classroom in batch]
+            ).update(recordings_synced_at=synced_at)
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.9 on 2026-10-19 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbb", "0026_classroomdocument_fix_storage_location"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classroom",
+            name="recordings_synced_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="date and time at which the recordings were last synced",
+                null=True,
+                verbose_name="recordings synced at",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.9 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbb", "0027_classroom_recordings_synced_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="classroom",
+            index=models.Index(
+                fields=["created_on", "id"], name="classroom_created_on_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="classroom",
+            index=models.Index(fields=["title", "id"], name="classroom_title_idx"),
+        ),
+    ]
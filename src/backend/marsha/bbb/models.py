@@ -146,6 +146,13 @@ class Classroom(BaseModel, RetentionDateObjectMixin):
         null=True,
         blank=True,
     )
+    recordings_synced_at = models.DateTimeField(
+        verbose_name=_("recordings synced at"),
+        help_text=_("date and time at which the recordings were last synced"),
+        null=True,
+        blank=True,
+        editable=False,
+    )
 
     # Invitation token
     public_token = models.CharField(
@@ -169,6 +176,10 @@ class Classroom(BaseModel, RetentionDateObjectMixin):
         ordering = ["-created_on", "id"]
         verbose_name = _("classroom")
         verbose_name_plural = _("classrooms")
+        indexes = [
+            models.Index(fields=["created_on", "id"], name="classroom_created_on_idx"),
+            models.Index(fields=["title", "id"], name="classroom_title_idx"),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["lti_id", "playlist"],
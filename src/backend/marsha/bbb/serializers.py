@@ -3,7 +3,7 @@
 from datetime import datetime
 import mimetypes
 from os.path import splitext
-from uuid import uuid4
+import time
 
 from django.conf import settings
 from django.core.cache import cache
@@ -20,7 +20,11 @@ from marsha.bbb.models import (
     ClassroomRecording,
     ClassroomSession,
 )
-from marsha.bbb.utils.bbb_utils import get_recording_url, get_url as get_document_url
+from marsha.bbb.utils.bbb_utils import (
+    get_recordings_urls,
+    get_url as get_document_url,
+    invalidate_create_payload_cache,
+)
 from marsha.core.defaults import CLASSROOM_RECORDINGS_KEY_CACHE, VOD_CONVERT
 from marsha.core.serializers import (
     BaseInitiateUploadSerializer,
@@ -31,11 +35,75 @@ from marsha.core.serializers import (
 )
 
 
+# Cached recording urls are renewed once this part of their timeout is elapsed,
+# before BBB invalidates them
+RECORDINGS_URL_REFRESH_RATIO = 0.8
+
+
+def get_recordings_video_file_urls(record_ids):
+    """Video file urls of recordings, from the cache or from a single BBB API call.
+
+    Recording urls do not depend on the user, they are cached per recording and
+    shared between users.
+    """
+    cache_keys = {
+        record_id: f"{CLASSROOM_RECORDINGS_KEY_CACHE}{record_id}"
+        for record_id in record_ids
+    }
+    cached_urls = cache.get_many(cache_keys.values())
+    now = time.time()
+
+    video_file_urls = {}
+    for record_id, cache_key in cache_keys.items():
+        cached_url = cached_urls.get(cache_key)
+        # Recordings not published yet are looked for again
+        if cached_url and cached_url["url"] and cached_url["refresh_at"] > now:
+            video_file_urls[record_id] = cached_url["url"]
+
+    missing_record_ids = [
+        record_id for record_id in record_ids if record_id not in video_file_urls
+    ]
+    if missing_record_ids:
+        # The url timeout is about to expire.
+        # We must retrieve them from BBB and cache them again.
+        found_urls = get_recordings_urls(missing_record_ids)
+        refresh_at = now + settings.RECORDINGS_URL_CACHE_TIMEOUT * (
+            RECORDINGS_URL_REFRESH_RATIO
+        )
+        cache.set_many(
+            {
+                cache_keys[record_id]: {
+                    "url": found_urls.get(record_id),
+                    "refresh_at": refresh_at,
+                }
+                for record_id in missing_record_ids
+            },
+            settings.RECORDINGS_URL_CACHE_TIMEOUT,
+        )
+        for record_id in missing_record_ids:
+            video_file_urls[record_id] = found_urls.get(record_id)
+
+    return video_file_urls
+
+
+class ClassroomRecordingListSerializer(serializers.ListSerializer):
+    """Resolve the video file urls of all the recordings listed at once."""
+
+    def to_representation(self, data):
+        """Resolve the urls of the recordings before serializing each of them."""
+        recordings = list(data.all() if hasattr(data, "all") else data)
+        self.child.video_file_urls = get_recordings_video_file_urls(
+            [recording.record_id for recording in recordings]
+        )
+        return super().to_representation(recordings)
+
+
 class ClassroomRecordingSerializer(ReadOnlyModelSerializer):
     """A serializer to display a ClassroomRecording resource."""
 
     class Meta:  # noqa
         model = ClassroomRecording
+        list_serializer_class = ClassroomRecordingListSerializer
         fields = (
             "id",
             "classroom_id",
@@ -60,39 +128,15 @@ class ClassroomRecordingSerializer(ReadOnlyModelSerializer):
     vod = VideoFromRecordingSerializer(read_only=True)
     video_file_url = serializers.SerializerMethodField()
 
-    def _get_recording_cache_key(self, obj):
-        """Compute the cache key for the current context."""
-        request = self.context.get("request")
-        if request:
-            if request.resource:
-                # LTI context
-                payload = request.resource.token.payload
-                user_id = payload.get("user", {}).get("id", str(uuid4()))
-            else:
-                user_id = request.user.id
-
-            return f"{CLASSROOM_RECORDINGS_KEY_CACHE}{obj.record_id}:{user_id}"
-
-        return f"{CLASSROOM_RECORDINGS_KEY_CACHE}{str(uuid4())}"
+    # Urls resolved at once by the list serializer for all the recordings listed
+    video_file_urls = None
 
     def get_video_file_url(self, obj):
         """Method for video_file_url field."""
-        video_file_url = None
-        cache_key = self._get_recording_cache_key(obj)
-
-        video_file_url = cache.get(cache_key)
-
-        if video_file_url is None:
-            # The url timeout has expired.
-            # We must retrieve it from BBB and cache it again.
-            video_file_url = get_recording_url(record_id=obj.record_id)
-            cache.set(
-                cache_key,
-                video_file_url,
-                settings.RECORDINGS_URL_CACHE_TIMEOUT,
-            )
-
-        return video_file_url
+        video_file_urls = self.video_file_urls or {}
+        if obj.record_id not in video_file_urls:
+            video_file_urls = get_recordings_video_file_urls([obj.record_id])
+        return video_file_urls[obj.record_id]
 
 
 class ClassroomSessionSerializer(serializers.ModelSerializer):
@@ -390,6 +434,7 @@ class ClassroomDocumentSerializer(
                 ClassroomDocument.objects.exclude(id=instance.id).filter(
                     classroom=instance.classroom, is_default=True
                 ).update(is_default=False)
+                invalidate_create_payload_cache(instance.classroom_id)
             return instance
 
     def get_url(self, obj):
@@ -1,11 +1,31 @@
 """Defines the django app config for the ``page`` app."""
 
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from marsha.bbb.models import ClassroomRecording
+from marsha.bbb.models import (
+    Classroom,
+    ClassroomDocument,
+    ClassroomRecording,
+    ClassroomSession,
+)
 from marsha.bbb.utils import bbb_utils
 from marsha.core.api import signal_object_uploaded
 from marsha.core.models import Video
+from marsha.core.models.base import post_cascade_softdelete
+from marsha.core.signals import (
+    resource_changed_callback,
+    resources_cascade_softdeleted_callback,
+)
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+
+
+# Classrooms are served by LTI views and listed by the LTI select view
+post_save.connect(resource_changed_callback, sender=Classroom)
+post_delete.connect(resource_changed_callback, sender=Classroom)
+post_cascade_softdelete.connect(
+    resources_cascade_softdeleted_callback, sender=Classroom
+)
 
 
 @receiver(signal_object_uploaded)
@@ -20,3 +40,31 @@ def object_uploaded_callback(**kwargs):
         recording = ClassroomRecording.objects.filter(vod__id=instance.id).first()
         if recording:
             bbb_utils.delete_recording([recording])
+
+
+@receiver(post_save, sender=ClassroomRecording)
+@receiver(post_delete, sender=ClassroomRecording)
+@receiver(post_save, sender=ClassroomSession)
+@receiver(post_delete, sender=ClassroomSession)
+def classroom_related_object_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of an object serialized with its classroom.
+    The cached app data of the classroom must be renewed.
+    """
+    if raw:
+        return
+
+    invalidate_app_data_cache(instance.classroom_id)
+
+
+@receiver(post_save, sender=ClassroomDocument)
+@receiver(post_delete, sender=ClassroomDocument)
+def classroom_document_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a classroom document.
+    The cached payload declaring the documents of its classroom to BBB must be renewed.
+    """
+    if raw:
+        return
+
+    bbb_utils.invalidate_create_payload_cache(instance.classroom_id)
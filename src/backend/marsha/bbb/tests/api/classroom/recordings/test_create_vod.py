@@ -126,7 +126,7 @@ class ClassroomRecordingCreateVodAPITest(TestCase):
                 <returncode>SUCCESS</returncode>
                 <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>67df5782-c17b-46d8-9dcb-a404e0b31251</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -500,14 +500,18 @@ class ClassroomRetrieveAPITest(TestCase):
             started_at="2019-08-21T11:00:02Z",
         )
 
+        # The urls of all the recordings are retrieved at once
         responses.add(
             responses.GET,
             "https://10.7.7.1/bigbluebutton/api/getRecordings",
             match=[
                 responses.matchers.query_param_matcher(
                     {
-                        "recordID": "67df5782-c17b-46d8-9dcb-a404e0b31251",
-                        "checksum": "5b9680a8fcca9e43f41f494b0503a41c14a86be9",
+                        "recordID": (
+                            "35c165e6-75fd-4bb4-8352-a74057689e40,"
+                            "67df5782-c17b-46d8-9dcb-a404e0b31251"
+                        ),
+                        "checksum": "3abe45c02b452eba5e629ae3a6fd1f37d94999d9",
                     }
                 )
             ],
@@ -516,7 +520,7 @@ class ClassroomRetrieveAPITest(TestCase):
                 <returncode>SUCCESS</returncode>
                 <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>35c165e6-75fd-4bb4-8352-a74057689e40</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -525,10 +529,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -546,29 +546,8 @@ class ClassroomRetrieveAPITest(TestCase):
                             </format>
                         </playback>
                     </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "recordID": "35c165e6-75fd-4bb4-8352-a74057689e40",
-                        "checksum": "3ccf4770fcc739a037f6a8156b99467c6d8c95c5",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>67df5782-c17b-46d8-9dcb-a404e0b31251</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -577,10 +556,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -690,14 +665,18 @@ class ClassroomRetrieveAPITest(TestCase):
             user={"id": "8809baa8-8578-4b1b-bc01-60d313a205f7"},
         )
 
+        # The urls of all the recordings are retrieved at once
         responses.add(
             responses.GET,
             "https://10.7.7.1/bigbluebutton/api/getRecordings",
             match=[
                 responses.matchers.query_param_matcher(
                     {
-                        "recordID": "67df5782-c17b-46d8-9dcb-a404e0b31251",
-                        "checksum": "5b9680a8fcca9e43f41f494b0503a41c14a86be9",
+                        "recordID": (
+                            "35c165e6-75fd-4bb4-8352-a74057689e40,"
+                            "67df5782-c17b-46d8-9dcb-a404e0b31251"
+                        ),
+                        "checksum": "3abe45c02b452eba5e629ae3a6fd1f37d94999d9",
                     }
                 )
             ],
@@ -706,7 +685,7 @@ class ClassroomRetrieveAPITest(TestCase):
                 <returncode>SUCCESS</returncode>
                 <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>35c165e6-75fd-4bb4-8352-a74057689e40</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -715,10 +694,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -736,29 +711,8 @@ class ClassroomRetrieveAPITest(TestCase):
                             </format>
                         </playback>
                     </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "recordID": "35c165e6-75fd-4bb4-8352-a74057689e40",
-                        "checksum": "3ccf4770fcc739a037f6a8156b99467c6d8c95c5",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>67df5782-c17b-46d8-9dcb-a404e0b31251</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -767,10 +721,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -860,11 +810,8 @@ class ClassroomRetrieveAPITest(TestCase):
 
         self.assertEqual(
             cache.get(
-                (
-                    f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_1.record_id}:"
-                    "8809baa8-8578-4b1b-bc01-60d313a205f7"
-                )
-            ),
+                f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_1.record_id}"
+            )["url"],
             (
                 "https://10.7.7.1/presentation/"
                 "c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493/meeting.mp4"
@@ -890,14 +837,18 @@ class ClassroomRetrieveAPITest(TestCase):
 
         jwt_token = UserAccessTokenFactory(user=playlist_access.user)
 
+        # The urls of all the recordings are retrieved at once
         responses.add(
             responses.GET,
             "https://10.7.7.1/bigbluebutton/api/getRecordings",
             match=[
                 responses.matchers.query_param_matcher(
                     {
-                        "recordID": "67df5782-c17b-46d8-9dcb-a404e0b31251",
-                        "checksum": "5b9680a8fcca9e43f41f494b0503a41c14a86be9",
+                        "recordID": (
+                            "35c165e6-75fd-4bb4-8352-a74057689e40,"
+                            "67df5782-c17b-46d8-9dcb-a404e0b31251"
+                        ),
+                        "checksum": "3abe45c02b452eba5e629ae3a6fd1f37d94999d9",
                     }
                 )
             ],
@@ -906,7 +857,7 @@ class ClassroomRetrieveAPITest(TestCase):
                 <returncode>SUCCESS</returncode>
                 <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>35c165e6-75fd-4bb4-8352-a74057689e40</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -915,10 +866,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -936,29 +883,8 @@ class ClassroomRetrieveAPITest(TestCase):
                             </format>
                         </playback>
                     </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "recordID": "35c165e6-75fd-4bb4-8352-a74057689e40",
-                        "checksum": "3ccf4770fcc739a037f6a8156b99467c6d8c95c5",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
                     <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
+                        <recordID>67df5782-c17b-46d8-9dcb-a404e0b31251</recordID>
                         <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
                         <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
                         <name>test ncl</name>
@@ -967,10 +893,6 @@ class ClassroomRetrieveAPITest(TestCase):
                         <startTime>1673282694493</startTime>
                         <endTime>1673282727208</endTime>
                         <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
                         <playback>
                             <format>
                                 <type>presentation</type>
@@ -1060,11 +982,8 @@ class ClassroomRetrieveAPITest(TestCase):
 
         self.assertEqual(
             cache.get(
-                (
-                    f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_1.record_id}:"
-                    f"{playlist_access.user.id}"
-                )
-            ),
+                f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_1.record_id}"
+            )["url"],
             (
                 "https://10.7.7.1/presentation/"
                 "c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493/meeting.mp4"
@@ -1072,11 +991,8 @@ class ClassroomRetrieveAPITest(TestCase):
         )
         self.assertEqual(
             cache.get(
-                (
-                    f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_2.record_id}:"
-                    f"{playlist_access.user.id}"
-                )
-            ),
+                f"{CLASSROOM_RECORDINGS_KEY_CACHE}{classroom_recording_2.record_id}"
+            )["url"],
             (
                 "https://10.7.7.1/presentation/"
                 "c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493/meeting.mp4"
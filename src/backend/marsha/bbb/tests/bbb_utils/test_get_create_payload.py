@@ -0,0 +1,77 @@
+"""Tests for the create payload cache in the ``bbb`` app of the Marsha project."""
+
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from marsha.bbb.factories import ClassroomDocumentFactory, ClassroomFactory
+from marsha.bbb.utils.bbb_utils import get_create_payload
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    },
+    MEDIA_URL="https://abc.svc.edge.scw.cloud/",
+)
+class GetCreatePayloadTestCase(TestCase):
+    """Test the cache of the documents declared to BBB when creating a meeting."""
+
+    maxDiff = None
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get_create_payload_no_document(self):
+        """A classroom without ready document declares no module."""
+        classroom = ClassroomFactory()
+        ClassroomDocumentFactory(classroom=classroom, upload_state="pending")
+
+        self.assertEqual(get_create_payload(classroom), "")
+
+        # The empty payload is cached too
+        with self.assertNumQueries(0):
+            self.assertEqual(get_create_payload(classroom), "")
+
+    def test_get_create_payload_cached(self):
+        """The payload is built once, then renewed when a document changes."""
+        now = datetime(2018, 8, 8, tzinfo=timezone.utc)
+        classroom = ClassroomFactory(id="9b3df0bd-240c-49fe-85e0-caa47420f3eb")
+        document = ClassroomDocumentFactory(
+            id="c5c84f7b-7f1a-4689-8da8-28fae7c7e8d9",
+            is_default=True,
+            filename="file.pdf",
+            classroom=classroom,
+            uploaded_on=now,
+            upload_state="ready",
+        )
+        payload = (
+            '<modules><module name="presentation">'
+            "<document "
+            'url="https://abc.svc.edge.scw.cloud/classroom/9b3df0bd-240c-49fe-85e0-caa47420f3eb/'
+            'classroomdocument/c5c84f7b-7f1a-4689-8da8-28fae7c7e8d9/file.pdf" '
+            'filename="file.pdf" '
+            'current="true" '
+            "/>"
+            "</module></modules>"
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_create_payload(classroom), payload)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_create_payload(classroom), payload)
+
+        document.is_default = False
+        document.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_create_payload(classroom),
+                payload.replace('current="true"', 'current="false"'),
+            )
+
+        document.delete()
+
+        self.assertEqual(get_create_payload(classroom), "")
@@ -0,0 +1,26 @@
+"""Tests for the get_session service in the ``bbb`` app of the Marsha project."""
+
+from django.test import TestCase, override_settings
+
+from marsha.bbb.utils.bbb_utils import get_session
+
+
+@override_settings(BBB_API_ENDPOINT="https://10.7.7.1/bigbluebutton/api")
+class GetSessionTestCase(TestCase):
+    """Test the keep-alive sessions to the BBB servers."""
+
+    def test_get_session(self):
+        """A single session is kept open by BBB server."""
+        session = get_session()
+
+        self.assertIs(get_session(), session)
+        self.assertIs(get_session("https://10.7.7.1/bigbluebutton/api"), session)
+        self.assertIsNot(get_session("https://10.7.7.2/bigbluebutton/api"), session)
+
+    @override_settings(BBB_API_POOL_SIZE=3)
+    def test_get_session_pool_size(self):
+        """The connections kept open to a server are limited to the pool size."""
+        session = get_session("https://10.7.7.3/bigbluebutton/api")
+
+        adapter = session.get_adapter("https://10.7.7.3/bigbluebutton/api/create")
+        self.assertEqual(adapter._pool_maxsize, 3)  # pylint: disable=protected-access
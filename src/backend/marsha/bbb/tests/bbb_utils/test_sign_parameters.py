@@ -30,3 +30,17 @@ class ClassroomServiceTestCase(TestCase):
             },
             sign_parameters(action="join", parameters=parameters),
         )
+
+    def test_sign_parameters_none(self):
+        """Parameters set to None are not sent, they are not signed either."""
+        parameters = {
+            "fullName": "User 7585026",
+            "meetingID": "random - 8619987",
+            "password": "ap",
+            "redirect": "false",
+            "userID": None,
+        }
+        self.assertEqual(
+            "26390c020c085ddf328305d33bbdf96ba22244b1",
+            sign_parameters(action="join", parameters=parameters)["checksum"],
+        )
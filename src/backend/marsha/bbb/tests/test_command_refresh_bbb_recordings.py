@@ -1,21 +1,85 @@
 """Test the development ``refresh_bbb_recordings` management command."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from logging import Logger
 from unittest import mock
 
 from django.core.management import call_command
 from django.test import TransactionTestCase, override_settings
+from django.utils import timezone as django_timezone
 
 import responses
 
-from marsha.bbb.factories import ClassroomFactory, ClassroomRecordingFactory
+from marsha.bbb.factories import (
+    ClassroomFactory,
+    ClassroomRecordingFactory,
+    ClassroomSessionFactory,
+)
 from marsha.bbb.models import ClassroomRecording
+from marsha.bbb.utils import bbb_utils
 from marsha.core.factories import VideoFactory
 
 
 #  pylint: disable=duplicate-code
 
+MEETING_ID = "7e1c8b28-cd7a-4abe-93b2-3121366cb049"
+RECORD_ID = "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234"
+
+
+def get_recording_xml(record_id, meeting_id=MEETING_ID):
+    """Return the xml of a recording in a getRecordings BBB API response."""
+    return f"""
+        <recording>
+            <recordID>{record_id}</recordID>
+            <meetingID>{meeting_id}</meetingID>
+            <internalMeetingID>{record_id}</internalMeetingID>
+            <name>test ncl</name>
+            <published>true</published>
+            <state>published</state>
+            <startTime>1673282694493</startTime>
+            <endTime>1673282727208</endTime>
+            <participants>1</participants>
+            <playback>
+                <format>
+                    <type>presentation</type>
+                    <url>https://10.7.7.1/playback/presentation/2.3/{record_id}</url>
+                    <length>0</length>
+                </format>
+                <format>
+                    <type>video</type>
+                    <url>https://10.7.7.1/presentation/{record_id}/meeting.mp4</url>
+                    <length>0</length>
+                </format>
+            </playback>
+        </recording>
+    """
+
+
+def add_recordings_response(meeting_ids, recordings_xml, offset=0, limit=100):
+    """Mock a getRecordings BBB API call for a page of recordings of meetings."""
+    parameters = {
+        "meetingID": ",".join(meeting_ids),
+        "offset": offset,
+        "limit": limit,
+    }
+    bbb_utils.sign_parameters("getRecordings", parameters)
+    responses.add(
+        responses.GET,
+        "https://10.7.7.1/bigbluebutton/api/getRecordings",
+        match=[
+            responses.matchers.query_param_matcher(
+                {key: str(value) for key, value in parameters.items()}
+            )
+        ],
+        body=f"""
+        <response>
+            <returncode>SUCCESS</returncode>
+            <recordings>{"".join(recordings_xml)}</recordings>
+        </response>
+        """,
+        status=200,
+    )
+
 
 @override_settings(BBB_API_ENDPOINT="https://10.7.7.1/bigbluebutton/api")
 @override_settings(BBB_API_SECRET="SuperSecret")
@@ -24,10 +88,6 @@ from marsha.core.factories import VideoFactory
 class RefreshBBBRecordingsTestCase(TransactionTestCase):
     """Test the ``refresh_bbb_recordings` management command."""
 
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-
     maxDiff = None
 
     @responses.activate
@@ -46,30 +106,10 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
     @responses.activate
     @mock.patch.object(Logger, "info")
     def test_update_recordings_no_recording(self, logger_mock):
-        """Command should call get_meetings when a classroom exists.
+        """Command should call get_recordings when a classroom exists.
         Does nothing when no recording is found and no recording already exists."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings> </recordings>
-                <messageKey>noRecordings</messageKey>
-                <message>There are not recordings for the meetings</message>
-            </response>
-            """,
-            status=200,
-        )
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
+        add_recordings_response([MEETING_ID], [])
 
         call_command("refresh_bbb_recordings")
 
@@ -81,63 +121,22 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
         )
         self.assertEqual(ClassroomRecording.objects.count(), 0)
         self.assertEqual(classroom.recordings.count(), 0)
+        classroom.refresh_from_db()
+        self.assertIsNotNone(classroom.recordings_synced_at)
 
     @responses.activate
     @mock.patch.object(Logger, "info")
     def test_update_recordings_new_recording(self, logger_mock):
-        """Command should call get_meetings when a classroom exists.
+        """Command should call get_recordings when a classroom exists.
         Found recording is saved if not already exists."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
+        add_recordings_response(
+            [MEETING_ID],
+            [
+                get_recording_xml(
+                    "c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493"
                 )
             ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
         )
 
         call_command("refresh_bbb_recordings")
@@ -166,56 +165,11 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
     @mock.patch.object(Logger, "info")
     def test_update_recordings_deleted_recording(self, logger_mock):
         """When an existing recording is not found anymore, it should be deleted."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
         classroom_recording = ClassroomRecordingFactory(
-            classroom=classroom,
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                        "checksum": "85477147f74390fc7985edf85851aa29eea57e5e",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings> </recordings>
-                <messageKey>noRecordings</messageKey>
-                <message>There are not recordings for the meetings</message>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings> </recordings>
-                <messageKey>noRecordings</messageKey>
-                <message>There are not recordings for the meetings</message>
-            </response>
-            """,
-            status=200,
+            classroom=classroom, record_id=RECORD_ID
         )
+        add_recordings_response([MEETING_ID], [])
 
         call_command("refresh_bbb_recordings")
 
@@ -223,14 +177,7 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
             [
                 mock.call("Classroom %s found.", classroom.id),
                 mock.call("No recording found."),
-                mock.call(
-                    "Recording %s not anymore available.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
-                mock.call(
-                    "Deleting recording %s.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
+                mock.call("Deleting recording %s.", RECORD_ID),
             ]
         )
 
@@ -247,75 +194,18 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
         it should not be deleted.
         """
         video = VideoFactory()
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
         classroom_recording = ClassroomRecordingFactory(
-            classroom=classroom,
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-            vod=video,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                        "checksum": "85477147f74390fc7985edf85851aa29eea57e5e",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings> </recordings>
-                <messageKey>noRecordings</messageKey>
-                <message>There are not recordings for the meetings</message>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings> </recordings>
-                <messageKey>noRecordings</messageKey>
-                <message>There are not recordings for the meetings</message>
-            </response>
-            """,
-            status=200,
+            classroom=classroom, record_id=RECORD_ID, vod=video
         )
+        add_recordings_response([MEETING_ID], [])
 
         call_command("refresh_bbb_recordings")
 
-        logger_mock.assert_has_calls(
-            [
-                mock.call("Classroom %s found.", classroom.id),
-                mock.call("No recording found."),
-                mock.call(
-                    "Recording %s not anymore available.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
-                mock.call(
-                    "Recording %s converted to VOD.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
-            ]
+        self.assertNotIn(
+            mock.call("Deleting recording %s.", RECORD_ID),
+            logger_mock.call_args_list,
         )
-
         self.assertEqual(ClassroomRecording.objects.count(), 1)
         self.assertEqual(classroom.recordings.count(), 1)
         classroom_recording.refresh_from_db()
@@ -325,139 +215,35 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
     @mock.patch.object(Logger, "info")
     def test_update_recordings_update_recording(self, logger_mock):
         """When an existing recording is found, it should be updated."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
-        ClassroomRecordingFactory(
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
+        classroom_recording = ClassroomRecordingFactory(
             classroom=classroom,
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                        "checksum": "85477147f74390fc7985edf85851aa29eea57e5e",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
+            record_id=RECORD_ID,
+            started_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
         )
+        add_recordings_response([MEETING_ID], [get_recording_xml(RECORD_ID)])
 
         call_command("refresh_bbb_recordings")
 
         logger_mock.assert_has_calls(
             [
                 mock.call("Classroom %s found.", classroom.id),
-                mock.call(
-                    "Recording %s found.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
+                mock.call("Recording %s found.", RECORD_ID),
                 mock.call(
                     "%s recording started at %s with url %s",
                     "Updated",
                     "2023-01-09T16:44:54+00:00",
-                    "https://10.7.7.1/presentation/"
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/"
-                    "meeting.mp4",
+                    f"https://10.7.7.1/presentation/{RECORD_ID}/meeting.mp4",
                 ),
             ]
         )
 
         self.assertEqual(ClassroomRecording.objects.count(), 1)
-        self.assertEqual(classroom.recordings.count(), 1)
+        classroom_recording.refresh_from_db()
+        self.assertEqual(
+            classroom_recording.started_at,
+            datetime(2023, 1, 9, 16, 44, 54, tzinfo=timezone.utc),
+        )
 
     @responses.activate
     @mock.patch.object(Logger, "info")
@@ -478,15 +264,34 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
         )
         self.assertEqual(ClassroomRecording.objects.count(), 0)
 
+    @responses.activate
+    @mock.patch.object(Logger, "info")
+    def test_update_recordings_classroom_parameter_synced(self, logger_mock):
+        """A classroom given as parameter is synced even if it was synced recently."""
+        classroom = ClassroomFactory(
+            meeting_id=MEETING_ID, recordings_synced_at=django_timezone.now()
+        )
+        add_recordings_response([MEETING_ID], [get_recording_xml(RECORD_ID)])
+
+        call_command("refresh_bbb_recordings", classroom_id=classroom.id)
+
+        logger_mock.assert_has_calls(
+            [
+                mock.call("Classroom %s found.", classroom.id),
+                mock.call("Recording %s found.", RECORD_ID),
+            ]
+        )
+        self.assertEqual(classroom.recordings.count(), 1)
+
     @responses.activate
     @mock.patch.object(Logger, "info")
     def test_update_recordings_recording_parameter(self, logger_mock):
         """Command should accept recording parameter.
         Only this recording should be updated."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
         classroom_recording = ClassroomRecordingFactory(
             id="0fabc045-6b9b-4914-bfbd-8b90c9eee9fc",
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
+            record_id=RECORD_ID,
             classroom=classroom,
         )
 
@@ -496,47 +301,15 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
             match=[
                 responses.matchers.query_param_matcher(
                     {
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
+                        "recordID": RECORD_ID,
                         "checksum": "6bae8c87cb4f84d79cc5ff03e916512e3ad47c9b",
                     }
                 )
             ],
-            body="""
+            body=f"""
             <response>
                 <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
+                <recordings>{get_recording_xml(RECORD_ID)}</recordings>
             </response>
             """,
             status=200,
@@ -549,17 +322,12 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
 
         logger_mock.assert_has_calls(
             [
-                mock.call(
-                    "Recording %s found.",
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                ),
+                mock.call("Recording %s found.", RECORD_ID),
                 mock.call(
                     "%s recording started at %s with url %s",
                     "Updated",
                     "2023-01-09T16:44:54+00:00",
-                    "https://10.7.7.1/presentation/"
-                    "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/"
-                    "meeting.mp4",
+                    f"https://10.7.7.1/presentation/{RECORD_ID}/meeting.mp4",
                 ),
             ]
         )
@@ -571,119 +339,14 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
     @mock.patch.object(Logger, "info")
     def test_update_recordings_before_parameter(self, logger_mock):
         """Command should accept before parameter.
-        Only this recording should be updated."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
-        classroom_recording = ClassroomRecordingFactory(
-            id="0fabc045-6b9b-4914-bfbd-8b90c9eee9fc",
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
+        Only recordings started before this date should be updated."""
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
+        ClassroomRecordingFactory(
+            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560235",
             classroom=classroom,
             started_at=datetime(2023, 1, 9, tzinfo=timezone.utc),
         )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                        "checksum": "85477147f74390fc7985edf85851aa29eea57e5e",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
+        add_recordings_response([MEETING_ID], [get_recording_xml(RECORD_ID)])
 
         call_command(
             "refresh_bbb_recordings",
@@ -696,130 +359,29 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
             ]
         )
         self.assertNotIn(
-            mock.call("Recording %s found.", classroom_recording.id),
+            mock.call("Recording %s found.", RECORD_ID),
             logger_mock.call_args_list,
         )
 
+        # The recording out of range is neither created nor deleted
         self.assertEqual(ClassroomRecording.objects.count(), 1)
         self.assertEqual(classroom.recordings.count(), 1)
+        # A partial sync does not move the watermark
+        classroom.refresh_from_db()
+        self.assertIsNone(classroom.recordings_synced_at)
 
     @responses.activate
     @mock.patch.object(Logger, "info")
     def test_update_recordings_after_parameter(self, logger_mock):
         """Command should accept after parameter.
-        Only this recording should be updated."""
-        classroom = ClassroomFactory(meeting_id="7e1c8b28-cd7a-4abe-93b2-3121366cb049")
-        classroom_recording = ClassroomRecordingFactory(
-            id="0fabc045-6b9b-4914-bfbd-8b90c9eee9fc",
-            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
+        Only recordings started after this date should be updated."""
+        classroom = ClassroomFactory(meeting_id=MEETING_ID)
+        ClassroomRecordingFactory(
+            record_id="d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560235",
             classroom=classroom,
             started_at=datetime(2023, 1, 9, tzinfo=timezone.utc),
         )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "recordID": "d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234",
-                        "checksum": "85477147f74390fc7985edf85851aa29eea57e5e",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            "https://10.7.7.1/bigbluebutton/api/getRecordings",
-            match=[
-                responses.matchers.query_param_matcher(
-                    {
-                        "meetingID": "7e1c8b28-cd7a-4abe-93b2-3121366cb049",
-                        "checksum": "b661619f04336794f4518ab0d387d9c72cf11187",
-                    }
-                )
-            ],
-            body="""
-            <response>
-                <returncode>SUCCESS</returncode>
-                <recordings>
-                    <recording>
-                        <recordID>d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234</recordID>
-                        <meetingID>7e1c8b28-cd7a-4abe-93b2-3121366cb049</meetingID>
-                        <internalMeetingID>c62c9c205d37815befe1b75ae6ef5878d8da5bb6-1673282694493</internalMeetingID>
-                        <name>test ncl</name>
-                        <published>true</published>
-                        <state>published</state>
-                        <startTime>1673282694493</startTime>
-                        <endTime>1673282727208</endTime>
-                        <participants>1</participants>
-                        <metadata>
-                            <analytics-callback-url>https://10.7.7.2/bbb-analytics/api/v1/post_events?tag=bbb-dev
-                            </analytics-callback-url>
-                        </metadata>
-                        <playback>
-                            <format>
-                                <type>presentation</type>
-                                <url>
-                                    https://10.7.7.1/playback/presentation/2.3/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234
-                                </url>
-                                <length>0</length>
-                            </format>
-                            <format>
-                                <type>video</type>
-                                <url>
-                                    https://10.7.7.1/presentation/d58d38e9e31b71a04b993c041d7ca74ef8d5f0dd-1673007560234/meeting.mp4
-                                </url>
-                                <length>0</length>
-                            </format>
-                        </playback>
-                    </recording>
-                </recordings>
-            </response>
-            """,
-            status=200,
-        )
+        add_recordings_response([MEETING_ID], [get_recording_xml(RECORD_ID)])
 
         call_command(
             "refresh_bbb_recordings",
@@ -832,9 +394,84 @@ class RefreshBBBRecordingsTestCase(TransactionTestCase):
             ]
         )
         self.assertNotIn(
-            mock.call("Recording %s found.", classroom_recording.id),
+            mock.call("Recording %s found.", RECORD_ID),
             logger_mock.call_args_list,
         )
 
         self.assertEqual(ClassroomRecording.objects.count(), 1)
         self.assertEqual(classroom.recordings.count(), 1)
+
+    @responses.activate
+    @mock.patch.object(Logger, "info")
+    def test_update_recordings_incremental(self, logger_mock):
+        """Only classrooms never synced or with a session since their sync are synced."""
+        now = django_timezone.now()
+        ClassroomFactory(recordings_synced_at=now)
+        old_session_classroom = ClassroomFactory(
+            recordings_synced_at=now,
+        )
+        ClassroomSessionFactory(
+            classroom=old_session_classroom,
+            started_at=now - timedelta(days=3),
+            ended_at=now - timedelta(days=2),
+        )
+        session_classroom = ClassroomFactory(
+            meeting_id=MEETING_ID, recordings_synced_at=now - timedelta(days=2)
+        )
+        ClassroomSessionFactory(
+            classroom=session_classroom,
+            started_at=now - timedelta(hours=2),
+            ended_at=now - timedelta(hours=1),
+        )
+        add_recordings_response([MEETING_ID], [get_recording_xml(RECORD_ID)])
+
+        call_command("refresh_bbb_recordings")
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(
+            [
+                call
+                for call in logger_mock.call_args_list
+                if call.args[0] == "Classroom %s found."
+            ],
+            [mock.call("Classroom %s found.", session_classroom.id)],
+        )
+        self.assertEqual(session_classroom.recordings.count(), 1)
+        session_classroom.refresh_from_db()
+        self.assertGreater(session_classroom.recordings_synced_at, now)
+
+    @responses.activate
+    @mock.patch.object(bbb_utils, "RECORDINGS_PAGE_SIZE", 2)
+    def test_update_recordings_batches(self):
+        """Recordings of several classrooms are requested at once, page by page."""
+        meeting_ids = [
+            "11111111-cd7a-4abe-93b2-3121366cb049",
+            "22222222-cd7a-4abe-93b2-3121366cb049",
+            "33333333-cd7a-4abe-93b2-3121366cb049",
+        ]
+        classrooms = [
+            ClassroomFactory(meeting_id=meeting_id) for meeting_id in meeting_ids
+        ]
+        # Classrooms are listed from the most recent one
+        add_recordings_response(
+            meeting_ids[:0:-1],
+            [
+                get_recording_xml(f"{RECORD_ID}-{index}", meeting_ids[index])
+                for index in (2, 1)
+            ],
+            limit=2,
+        )
+        add_recordings_response(
+            meeting_ids[:0:-1],
+            [get_recording_xml(f"{RECORD_ID}-1b", meeting_ids[1])],
+            offset=2,
+            limit=2,
+        )
+        add_recordings_response(meeting_ids[:1], [], limit=2)
+
+        call_command("refresh_bbb_recordings", batch_size=2, workers=2, rate=0)
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(
+            [classroom.recordings.count() for classroom in classrooms], [0, 2, 1]
+        )
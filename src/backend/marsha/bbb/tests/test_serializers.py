@@ -0,0 +1,101 @@
+"""Tests for the serializers of the ``bbb`` app of the Marsha project."""
+
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from marsha.bbb import serializers
+from marsha.bbb.factories import ClassroomFactory, ClassroomRecordingFactory
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    },
+    RECORDINGS_URL_CACHE_TIMEOUT=100,
+)
+class ClassroomRecordingSerializerTestCase(TestCase):
+    """Test the video file urls of the ClassroomRecordingSerializer."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_serializers_recordings_urls_single_call(self):
+        """The urls of all the recordings listed are retrieved in a single call."""
+        classroom = ClassroomFactory()
+        recordings = ClassroomRecordingFactory.create_batch(3, classroom=classroom)
+
+        with mock.patch.object(
+            serializers,
+            "get_recordings_urls",
+            side_effect=lambda record_ids: {
+                record_id: f"https://bbb/{record_id}.mp4" for record_id in record_ids
+            },
+        ) as mock_get_recordings_urls:
+            data = serializers.ClassroomRecordingSerializer(
+                classroom.recordings.all(), many=True
+            ).data
+            # Urls are cached and shared between users
+            self.assertEqual(
+                serializers.ClassroomRecordingSerializer(
+                    classroom.recordings.all(), many=True
+                ).data,
+                data,
+            )
+
+        mock_get_recordings_urls.assert_called_once()
+        self.assertCountEqual(
+            mock_get_recordings_urls.call_args.args[0],
+            [recording.record_id for recording in recordings],
+        )
+        self.assertCountEqual(
+            [recording["video_file_url"] for recording in data],
+            [f"https://bbb/{recording.record_id}.mp4" for recording in recordings],
+        )
+
+    def test_serializers_recordings_urls_refresh(self):
+        """Cached urls are renewed ahead of their expiry, unpublished ones each time."""
+        recording = ClassroomRecordingFactory()
+        unpublished_recording = ClassroomRecordingFactory(classroom=recording.classroom)
+        now = time.time()
+
+        with mock.patch.object(
+            serializers,
+            "get_recordings_urls",
+            return_value={recording.record_id: "https://bbb/video.mp4"},
+        ) as mock_get_recordings_urls:
+            with mock.patch.object(time, "time", return_value=now):
+                serializers.get_recordings_video_file_urls(
+                    [recording.record_id, unpublished_recording.record_id]
+                )
+            with mock.patch.object(time, "time", return_value=now + 79):
+                self.assertEqual(
+                    serializers.ClassroomRecordingSerializer(recording).data[
+                        "video_file_url"
+                    ],
+                    "https://bbb/video.mp4",
+                )
+                self.assertIsNone(
+                    serializers.ClassroomRecordingSerializer(
+                        unpublished_recording
+                    ).data["video_file_url"]
+                )
+            with mock.patch.object(time, "time", return_value=now + 81):
+                self.assertEqual(
+                    serializers.ClassroomRecordingSerializer(recording).data[
+                        "video_file_url"
+                    ],
+                    "https://bbb/video.mp4",
+                )
+
+        self.assertEqual(
+            mock_get_recordings_urls.call_args_list,
+            [
+                mock.call([recording.record_id, unpublished_recording.record_id]),
+                mock.call([unpublished_recording.record_id]),
+                mock.call([recording.record_id]),
+            ],
+        )
@@ -5,12 +5,17 @@ import hashlib
 import json
 from json import JSONDecodeError
 import logging
+import threading
+import time
+from urllib.parse import urlencode
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.timezone import now
 
 from dateutil.parser import parse
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import MissingSchema
 import xmltodict
 
@@ -18,10 +23,21 @@ from marsha.bbb.models import Classroom, ClassroomRecording, ClassroomSession
 from marsha.core.defaults import AWS_STORAGE_BASE_DIRECTORY, SCW_S3
 from marsha.core.storage.storage_class import file_storage
 from marsha.core.utils import time_utils
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of recordings BBB returns in a page
+RECORDINGS_PAGE_SIZE = 100
+# Number of calls trying to create a meeting not correctly closed by BBB
+CREATE_ATTEMPTS = 5
+CREATE_PAYLOAD_CACHE_KEY = "bbb|create_payload|{classroom_id}"
+
+# Keep-alive sessions by BBB server
+_sessions = {}
+_sessions_lock = threading.Lock()
+
 
 class ApiMeetingException(Exception):
     """Exception used when a meeting api request fails."""
@@ -46,35 +62,54 @@ class GuestPolicyEnum:
     ASK_MODERATOR = "ASK_MODERATOR"
 
 
+def encode_parameters(parameters):
+    """Encode parameters in a query string, the way requests does.
+
+    Parameters set to None are left out, as requests does not send them.
+    """
+    return urlencode(
+        [(key, value) for key, value in parameters.items() if value is not None],
+        doseq=True,
+    )
+
+
 def sign_parameters(action, parameters):
     """Add a checksum to parameters."""
-    request = requests.Request(
-        "GET", f"{settings.BBB_API_ENDPOINT}/{action}", params=parameters
-    )
-    prepared_request = request.prepare()
-    checksum_data = (
-        prepared_request.url.replace("?", "").replace(
-            settings.BBB_API_ENDPOINT + "/", ""
-        )
-        + settings.BBB_API_SECRET
-    )
+    checksum_data = f"{action}{encode_parameters(parameters)}{settings.BBB_API_SECRET}"
     parameters["checksum"] = hashlib.sha1(  # nosec
         checksum_data.encode("utf-8")
     ).hexdigest()
     return parameters
 
 
+def get_session(endpoint=None):
+    """Return the keep-alive session of a BBB server, shared by the threads.
+
+    Its pool keeps at most `BBB_API_POOL_SIZE` connections open to the server, so that
+    bursts of API calls at class start reuse them instead of paying TLS handshakes.
+    """
+    endpoint = endpoint or settings.BBB_API_ENDPOINT
+    with _sessions_lock:
+        session = _sessions.get(endpoint)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=settings.BBB_API_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[endpoint] = session
+    return session
+
+
 def request_api(action, parameters, prepare=False, data=None):
     """Perform generic request to BBB API."""
     url = f"{settings.BBB_API_ENDPOINT}/{action}"
-    signed_parameters = sign_parameters(action, parameters)
+    signed_parameters = sign_parameters(action, dict(parameters))
     if prepare:
-        request = requests.Request(
-            "GET", url, params=signed_parameters, data=data
-        ).prepare()
-        return {"url": request.url}
+        return {"url": f"{url}?{encode_parameters(signed_parameters)}"}
 
-    request = requests.request(
+    response = get_session().request(
         "post" if data else "get",
         url,
         params=signed_parameters,
@@ -83,7 +118,7 @@ def request_api(action, parameters, prepare=False, data=None):
         timeout=settings.BBB_API_TIMEOUT,
         headers={"Content-Type": "application/xml"} if data else None,
     )
-    api_response = xmltodict.parse(request.content).get("response")
+    api_response = xmltodict.parse(response.content).get("response")
     logger.debug("BBB API response: %s", api_response)
     if api_response.get("returncode") == "SUCCESS":
         return api_response
@@ -124,7 +159,45 @@ def get_url(obj):
     return file_storage.url(file_key)
 
 
-def create(classroom: Classroom, recording_ready_callback_url: str, attempt=0):
+def _build_create_payload(classroom: Classroom):
+    """Build the XML declaring the presentation documents of a classroom."""
+    documents = classroom.classroom_documents.filter(upload_state="ready")
+    if not documents:
+        return ""
+
+    xml = ['<modules><module name="presentation">']
+    for document in documents:
+        if "pdf" not in document.filename:
+            continue
+        xml.append(
+            f'<document url="{get_url(document)}" filename="{document.filename}" '
+            f'current="{document.is_default and "true" or "false"}" '
+            "/>"
+        )
+    xml.append("</module></modules>")
+    return "".join(xml)
+
+
+def get_create_payload(classroom: Classroom):
+    """Return the XML declaring the presentation documents of a classroom.
+
+    It is cached until the documents of the classroom change, and for less time than
+    the signed urls of the documents it contains are valid.
+    """
+    cache_key = CREATE_PAYLOAD_CACHE_KEY.format(classroom_id=classroom.id)
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = _build_create_payload(classroom)
+        cache.set(cache_key, payload, settings.BBB_CREATE_PAYLOAD_CACHE_TIMEOUT)
+    return payload
+
+
+def invalidate_create_payload_cache(classroom_id):
+    """Renew the XML declaring the presentation documents of a classroom."""
+    cache.delete(CREATE_PAYLOAD_CACHE_KEY.format(classroom_id=classroom_id))
+
+
+def create(classroom: Classroom, recording_ready_callback_url: str):
     """Call BBB API to create a meeting."""
     parameters = {
         "meetingID": str(classroom.meeting_id),
@@ -141,41 +214,27 @@ def create(classroom: Classroom, recording_ready_callback_url: str, attempt=0):
         "disabledFeatures": classroom.generate_disabled_features(),
     }
 
-    documents = classroom.classroom_documents.filter(upload_state="ready")
-    xml = ""
-    if documents:
-        xml += '<modules><module name="presentation">'
-        for document in documents:
-            if "pdf" not in document.filename:
-                continue
-            xml += (
-                f'<document url="{get_url(document)}" filename="{document.filename}" '
-                f'current="{document.is_default and "true" or "false"}" '
-                "/>"
-            )
-        xml += "</module></modules>"
-    try:
-        api_response = request_api("create", parameters, data=xml)
-    except ApiMeetingException as error:
-        # When a meeting is not correctly closed by BBB, it is not possible
-        # to create it again. To fix this issue, we must try to force to end it
-        # to be _maybe_ able to create it again
-        # See https://github.com/bigbluebutton/bigbluebutton/issues/18913
-
-        attempt += 1
-        if error.api_response.get("messageKey") == "internalError" and attempt < 5:
+    xml = get_create_payload(classroom)
+    for attempt in range(1, CREATE_ATTEMPTS + 1):
+        try:
+            api_response = request_api("create", parameters, data=xml)
+            break
+        except ApiMeetingException as error:
+            # When a meeting is not correctly closed by BBB, it is not possible
+            # to create it again. To fix this issue, we must try to force to end it
+            # to be _maybe_ able to create it again
+            # See https://github.com/bigbluebutton/bigbluebutton/issues/18913
+            if (
+                error.api_response.get("messageKey") != "internalError"
+                or attempt == CREATE_ATTEMPTS
+            ):
+                raise error
+
             try:
                 end(classroom=classroom)
             except ApiMeetingException:
                 pass
 
-            return create(
-                classroom=classroom,
-                recording_ready_callback_url=recording_ready_callback_url,
-                attempt=attempt,
-            )
-
-        raise error
     if not api_response.get("message"):
         api_response["message"] = "Meeting created."
     start_session(classroom)
@@ -321,13 +380,22 @@ def get_meeting_infos(classroom: Classroom):
         raise exception
 
 
-def get_recordings(meeting_id: str = None, record_id: str = None):
-    """Call BBB API to retrieve recordings."""
+def get_recordings(
+    meeting_id: str = None, record_id: str = None, offset: int = None, limit: int = None
+):
+    """Call BBB API to retrieve recordings.
+
+    Several meetings or recordings can be requested at once with comma separated ids,
+    their recordings are then paginated with offset and limit.
+    """
     parameters = {}
     if meeting_id:
         parameters["meetingID"] = meeting_id
     if record_id:
         parameters["recordID"] = record_id
+    if limit:
+        parameters["offset"] = offset or 0
+        parameters["limit"] = limit
 
     api_response = request_api("getRecordings", parameters)
 
@@ -344,6 +412,45 @@ def get_recordings(meeting_id: str = None, record_id: str = None):
     return api_response
 
 
+class RateLimiter:
+    """Space out calls shared between threads to a maximum rate per second."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.next_call = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        with self.lock:
+            now_ = time.monotonic()
+            delay = self.next_call - now_
+            self.next_call = max(self.next_call, now_) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_meetings_recordings(meeting_ids, rate_limiter=None):
+    """Call BBB API to retrieve all the recordings of several meetings, page by page."""
+    recordings = []
+    offset = 0
+    while True:
+        if rate_limiter:
+            rate_limiter.wait()
+        page = (
+            get_recordings(
+                ",".join(str(meeting_id) for meeting_id in meeting_ids),
+                offset=offset,
+                limit=RECORDINGS_PAGE_SIZE,
+            ).get("recordings")
+            or []
+        )
+        recordings.extend(page)
+        if len(page) < RECORDINGS_PAGE_SIZE:
+            return recordings
+        offset += RECORDINGS_PAGE_SIZE
+
+
 def get_recording_url(meeting_id: str = None, record_id: str = None):
     """Look for the video url in the get_recordings response"""
     recordings = get_recordings(meeting_id=meeting_id, record_id=record_id).get(
@@ -359,6 +466,18 @@ def get_recording_url(meeting_id: str = None, record_id: str = None):
     return None
 
 
+def get_recordings_urls(record_ids):
+    """Look for the video urls of several recordings in a single get_recordings call.
+
+    Returns a dictionary of the video url, or None, of each recording found.
+    """
+    recordings = get_recordings(record_id=",".join(record_ids)).get("recordings")
+    return {
+        recording.get("recordID"): _get_recording_video_url(recording)
+        for recording in recordings or []
+    }
+
+
 def process_recording(classroom, recording_data):
     """Creates or update a recording from BBB API."""
     if recording_data.get("published"):
@@ -418,6 +537,118 @@ def process_recordings(  # pylint: disable=too-many-arguments,too-many-positiona
         process_recording(classroom, recording)
 
 
+def _get_recording_video_url(recording_data):
+    """Url of the video of a published recording, None if it has no video."""
+    if not recording_data.get("published"):
+        return None
+
+    for recording_format in recording_data.get("playback").get("format"):
+        if recording_format.get("type") == "video":
+            return recording_format.get("url")
+
+    return None
+
+
+def _started_in_range(started_at, before=None, after=None):
+    """Whether a recording started between the dates sync is restricted to."""
+    if started_at is None:
+        return True
+    if before and started_at > parse(before).replace(tzinfo=timezone.utc):
+        return False
+    if after and started_at < parse(after).replace(tzinfo=timezone.utc):
+        return False
+    return True
+
+
+def _delete_missing_recordings(known_recordings, recordings_data, before, after):
+    """Delete the known recordings not found anymore and not converted to VOD.
+
+    Returns the ids of the classrooms whose recordings were deleted.
+    """
+    found_record_ids = {
+        recording_data.get("recordID") for recording_data in recordings_data
+    }
+    recordings_to_delete = [
+        recording
+        for record_id, recording in known_recordings.items()
+        if record_id not in found_record_ids
+        and recording.vod_id is None
+        and _started_in_range(recording.started_at, before, after)
+    ]
+    if not recordings_to_delete:
+        return set()
+
+    for recording in recordings_to_delete:
+        logger.info("Deleting recording %s.", recording.record_id)
+    ClassroomRecording.objects.filter(
+        pk__in=[recording.pk for recording in recordings_to_delete]
+    ).delete()
+    return {recording.classroom_id for recording in recordings_to_delete}
+
+
+def sync_recordings(classrooms, recordings_data, before=None, after=None):
+    """Sync in bulk the recordings of classrooms with all their recordings from BBB API.
+
+    Published video recordings are created or updated, the known recordings
+    not found anymore and not converted to VOD are deleted.
+    """
+    classrooms_by_meeting_id = {
+        str(classroom.meeting_id): classroom for classroom in classrooms
+    }
+    known_recordings = {
+        recording.record_id: recording
+        for recording in ClassroomRecording.objects.filter(classroom__in=classrooms)
+    }
+    recordings_to_create = []
+    recordings_to_update = []
+    changed_classroom_ids = set()
+
+    for recording_data in recordings_data:
+        classroom = classrooms_by_meeting_id.get(recording_data.get("meetingID"))
+        started_at = time_utils.to_datetime(int(recording_data.get("startTime")) / 1000)
+        if classroom is None or not _started_in_range(started_at, before, after):
+            continue
+
+        logger.info("Recording %s found.", recording_data.get("recordID"))
+        video_url = _get_recording_video_url(recording_data)
+        if video_url is None:
+            continue
+
+        recording = known_recordings.get(recording_data.get("recordID"))
+        if recording is None:
+            recordings_to_create.append(
+                ClassroomRecording(
+                    classroom=classroom,
+                    record_id=recording_data.get("recordID"),
+                    started_at=started_at,
+                )
+            )
+        elif recording.started_at != started_at:
+            recording.started_at = started_at
+            recordings_to_update.append(recording)
+        else:
+            continue
+
+        changed_classroom_ids.add(classroom.id)
+        logger.info(
+            "%s recording started at %s with url %s",
+            "Updated" if recording else "Created",
+            started_at.isoformat(),
+            video_url,
+        )
+
+    ClassroomRecording.objects.bulk_create(recordings_to_create)
+    ClassroomRecording.objects.bulk_update(recordings_to_update, ["started_at"])
+
+    changed_classroom_ids.update(
+        _delete_missing_recordings(known_recordings, recordings_data, before, after)
+    )
+
+    # Recordings saved in bulk do not send the signals renewing their classroom
+    for classroom_id in changed_classroom_ids:
+        invalidate_app_data_cache(classroom_id)
+
+
 def delete_recording(
     classroom_recordings: list[ClassroomRecording],
 ):
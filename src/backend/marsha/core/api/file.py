@@ -11,6 +11,8 @@ from marsha.core import defaults, permissions, serializers, storage
 from marsha.core.api.base import APIViewMixin, ObjectPkMixin
 from marsha.core.forms import DocumentForm
 from marsha.core.models import Document
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
 from marsha.core.utils.time_utils import to_datetime, to_timestamp
 
 
@@ -107,6 +109,9 @@ class DocumentViewSet(
             filename=serializer.validated_data["filename"],
             upload_state=defaults.PENDING,
         )
+        # `update` sends no signal, the cached app data and LTI select listings are renewed here
+        invalidate_app_data_cache(document.id, document.playlist_id)
+        invalidate_lti_select_cache(document.playlist_id)
 
         return Response(presigned_post)
 
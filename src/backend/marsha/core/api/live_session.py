@@ -30,6 +30,7 @@ from marsha.core.api.base import (
 )
 from marsha.core.defaults import VIDEO_ATTENDANCE_KEY_CACHE
 from marsha.core.models import ConsumerSite, LiveSession, Video
+from marsha.core.pagination import CursorLimitOffsetPagination
 from marsha.core.services.live_session import (
     get_livesession_from_anonymous_id,
     get_livesession_from_lti,
@@ -85,6 +86,7 @@ class LiveSessionViewSet(
     ordering_fields = ["created_on"]
     ordering = ["created_on"]
     filterset_class = LiveSessionFilter
+    pagination_class = CursorLimitOffsetPagination
 
     def get_permissions(self):
         """Instantiate and return the list of permissions that this view requires."""
@@ -425,6 +427,8 @@ class LiveSessionViewSet(
             f"{prefix_key}offset:{self.request.query_params.get('offset')}"
             f"limit:{self.request.query_params.get('limit')}"
         )
+        if (cursor := self.request.query_params.get("cursor")) is not None:
+            cache_key = f"{cache_key}cursor:{cursor}"
         if (cached_data := cache.get(cache_key, None)) is not None:
             return Response(cached_data)
 
@@ -20,6 +20,7 @@ from marsha.core.models import (
     Playlist,
     PlaylistAccess,
 )
+from marsha.core.pagination import CursorLimitOffsetPagination
 
 
 class PlaylistFilter(django_filters.FilterSet):
@@ -58,6 +59,7 @@ class PlaylistViewSet(APIViewMixin, ObjectPkMixin, viewsets.ModelViewSet):
     ordering_fields = ["created_on", "title"]
     ordering = ["-created_on"]
     filterset_class = PlaylistFilter
+    pagination_class = CursorLimitOffsetPagination
 
     def get_permissions(self):
         """
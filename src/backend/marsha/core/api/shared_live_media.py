@@ -17,6 +17,7 @@ from marsha.core.api.base import (
 )
 from marsha.core.models import SharedLiveMedia
 from marsha.core.tasks.shared_live_media import convert_shared_live_media
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
 from marsha.websocket.utils import channel_layers_utils
 
 
@@ -180,6 +181,8 @@ class SharedLiveMediaViewSet(
 
         # Reset the upload state of the shared live media
         SharedLiveMedia.objects.filter(pk=pk).update(upload_state=defaults.PENDING)
+        # `update` sends no signal, the cached app data of the video is renewed here
+        invalidate_app_data_cache(shared_live_media.video_id)
 
         return Response(presigned_post)
 
@@ -18,6 +18,8 @@ from marsha.core.api.base import (
 from marsha.core.metadata import ThumbnailMetadata
 from marsha.core.models import Thumbnail
 from marsha.core.tasks.thumbnail import resize_thumbnails
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
 
 
 class ThumbnailFilter(django_filters.FilterSet):
@@ -125,6 +127,9 @@ class ThumbnailViewSet(
 
         # Reset the upload state of the thumbnail
         Thumbnail.objects.filter(pk=pk).update(upload_state=defaults.PENDING)
+        # `update` sends no signal, the cached app data and LTI select listings are renewed here
+        invalidate_app_data_cache(thumbnail.video_id)
+        invalidate_lti_select_cache(thumbnail.video.playlist_id)
 
         return Response(presigned_post)
 
@@ -18,6 +18,7 @@ from marsha.core.api.base import (
 from marsha.core.metadata import TimedTextMetadata
 from marsha.core.models import TimedTextTrack
 from marsha.core.tasks.timed_text_track import convert_timed_text_track
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
 
 
 class TimedTextTrackFilter(django_filters.FilterSet):
@@ -127,6 +128,8 @@ class TimedTextTrackViewSet(
 
         # Reset the upload state of the timed text track
         TimedTextTrack.objects.filter(pk=pk).update(upload_state=defaults.PENDING)
+        # `update` sends no signal, the cached app data of the video is renewed here
+        invalidate_app_data_cache(timed_text_track.video_id)
 
         return Response(presigned_post)
 
@@ -38,6 +38,7 @@ from marsha.core.models import (
     TimedTextTrack,
     Video,
 )
+from marsha.core.pagination import CursorLimitOffsetPagination
 from marsha.core.services.video_participants import (
     VideoParticipantsException,
     add_participant_asking_to_join,
@@ -53,6 +54,8 @@ from marsha.core.services.video_recording import (
 from marsha.core.tasks.video import launch_video_transcoding, launch_video_transcript
 from marsha.core.utils import jitsi_utils
 from marsha.core.utils.api_utils import validate_signature
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
 from marsha.core.utils.medialive_utils import (
     ManifestMissingException,
     create_live_stream,
@@ -136,6 +139,7 @@ class VideoViewSet(
     ordering_fields = ["created_on", "title"]
     ordering = ["title"]
     filterset_class = VideoFilter
+    pagination_class = CursorLimitOffsetPagination
 
     def get_permissions(self):
         """
@@ -410,6 +414,9 @@ class VideoViewSet(
         # Reset the upload state of the video (don't use get_object()
         # as it does not lock the row)
         Video.objects.filter(pk=pk).update(upload_state=defaults.PENDING)
+        # `update` sends no signal, the cached app data and LTI select listings are renewed here
+        invalidate_app_data_cache(video.id, video.playlist_id)
+        invalidate_lti_select_cache(video.playlist_id)
 
         return Response(response)
 
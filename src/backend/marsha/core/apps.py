@@ -16,3 +16,9 @@ class CoreConfig(AppConfig):
 
     name = "marsha.core"
     verbose_name = _("Marsha")
+
+    def ready(self):
+        # Signals must be imported and connected once the app is ready.
+        # Callbacks are connected thanks to the "receiver" decorator.
+        # pylint: disable=import-outside-toplevel, unused-import
+        import marsha.core.signals  # noqa
@@ -1,5 +1,7 @@
 """Helpers to create a dedicated resources."""
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db.models import Q
 from django.utils.translation import gettext as _
@@ -7,12 +9,17 @@ from django.utils.translation import gettext as _
 from marsha.core.defaults import PENDING
 from marsha.core.models.account import (
     ADMINISTRATOR,
+    ConsumerSite,
     ConsumerSiteAccess,
     OrganizationAccess,
 )
 from marsha.core.models.playlist import Playlist, PlaylistAccess
 
 
+REACHABLE_PLAYLISTS_CACHE_KEY = "portability|playlists|{consumer_site_id}|{context_id}"
+REACHABLE_CONSUMER_SITES_CACHE_KEY = "portability|consumer_sites|{consumer_site_id}"
+
+
 class ResourceException(BaseException):
     """Wrapper to normalize exceptions caught in views."""
 
@@ -75,6 +82,164 @@ def get_selectable_resources(model, lti):
     )
 
 
+def get_selectable_playlist_ids(lti):
+    """List the playlists in which resources can be selected by an LTI select request.
+
+    This mirrors the playlists filtered in `get_selectable_resources` and is used
+    to version the cache of the LTI select listings.
+
+    Parameters
+    ----------
+    lti : Type[LTI]
+
+    Returns
+    -------
+    A list of playlist ids.
+
+    """
+    consumer_site = lti.get_consumer_site()
+
+    return list(
+        Playlist.objects.filter(
+            Q(lti_id=lti.context_id, consumer_site=consumer_site)
+            | Q(
+                portable_to__lti_id=lti.context_id,
+                portable_to__consumer_site_id=consumer_site.id,
+            )
+        )
+        .distinct()
+        .values_list("id", flat=True)
+    )
+
+
+def get_reachable_playlist_ids(consumer_site_id, context_id):
+    """Playlists portable to the playlist targeted by an LTI request.
+
+    The result is cached until the portability of a playlist to the targeted playlist
+    changes (see `invalidate_reachable_playlist_ids`).
+
+    Parameters
+    ----------
+    consumer_site_id : Type[uuid.UUID]
+        The consumer site of the targeted playlist.
+    context_id : string
+        The LTI id of the targeted playlist.
+
+    Returns
+    -------
+    A set of playlist ids.
+
+    """
+    cache_key = REACHABLE_PLAYLISTS_CACHE_KEY.format(
+        consumer_site_id=consumer_site_id, context_id=context_id
+    )
+    playlist_ids = cache.get(cache_key)
+
+    if playlist_ids is None:
+        playlist_ids = set(
+            Playlist.objects.filter(
+                portable_to__lti_id=context_id,
+                portable_to__consumer_site_id=consumer_site_id,
+            ).values_list("id", flat=True)
+        )
+        cache.set(cache_key, playlist_ids, settings.PORTABILITY_CACHE_DURATION)
+
+    return playlist_ids
+
+
+def invalidate_reachable_playlist_ids(consumer_site_id, context_id):
+    """Drop the cached playlists portable to a playlist."""
+    cache.delete(
+        REACHABLE_PLAYLISTS_CACHE_KEY.format(
+            consumer_site_id=consumer_site_id, context_id=context_id
+        )
+    )
+
+
+def get_reachable_consumer_site_ids(consumer_site_id):
+    """Consumer sites whose playlists are all portable to a consumer site.
+
+    The result is cached until the portability of a consumer site to this consumer site
+    changes (see `invalidate_reachable_consumer_site_ids`).
+
+    Parameters
+    ----------
+    consumer_site_id : Type[uuid.UUID]
+        The consumer site targeted by an LTI request.
+
+    Returns
+    -------
+    A set of consumer site ids.
+
+    """
+    cache_key = REACHABLE_CONSUMER_SITES_CACHE_KEY.format(
+        consumer_site_id=consumer_site_id
+    )
+    consumer_site_ids = cache.get(cache_key)
+
+    if consumer_site_ids is None:
+        consumer_site_ids = set(
+            ConsumerSite.objects.filter(
+                portable_to__id=consumer_site_id,
+            ).values_list("id", flat=True)
+        )
+        cache.set(cache_key, consumer_site_ids, settings.PORTABILITY_CACHE_DURATION)
+
+    return consumer_site_ids
+
+
+def invalidate_reachable_consumer_site_ids(consumer_site_id):
+    """Drop the cached consumer sites portable to a consumer site."""
+    cache.delete(
+        REACHABLE_CONSUMER_SITES_CACHE_KEY.format(consumer_site_id=consumer_site_id)
+    )
+
+
+def is_playlist_reachable(playlist, lti):
+    """Check whether the resources of a playlist are reachable from an LTI request.
+
+    The checks only relying on the playlist itself come first, the precomputed
+    portabilities are only looked up when they are not enough.
+
+    Parameters
+    ----------
+    playlist : Type[Playlist]
+        The playlist of the requested resource.
+    lti : Type[LTI]
+
+    Returns
+    -------
+    boolean
+
+    """
+    consumer_site = lti.get_consumer_site()
+
+    return (
+        # The resource exists in this playlist on this consumer site
+        (
+            playlist.lti_id == lti.context_id
+            and playlist.consumer_site_id == consumer_site.id
+        )
+        # The resource exists in another playlist of the same consumer site and is portable
+        or (
+            playlist.is_portable_to_playlist
+            and playlist.consumer_site_id == consumer_site.id
+        )
+        # The resource exists in another consumer site to which it is portable because:
+        # 1. its playlist is portable to all consumer sites
+        or playlist.is_portable_to_consumer_site
+        # 2. its playlist is portable to the requested playlist
+        or playlist.id in get_reachable_playlist_ids(consumer_site.id, lti.context_id)
+        # 3. all playlists in the consumer site of the resource are portable to the
+        #    requesting consumer site
+        or (
+            playlist.consumer_site_id is not None
+            and playlist.consumer_site_id
+            in get_reachable_consumer_site_ids(consumer_site.id)
+        )
+    )
+
+
 def get_or_create_resource(model, lti):
     """Get or Create a resource targeted by an LTI request.
 
@@ -101,12 +266,6 @@ def get_or_create_resource(model, lti):
     An instance of the model targeted by the LTI request or None
 
     """
-    consumer_site = lti.get_consumer_site()
-    playlist_reachable_from = Playlist.objects.filter(
-        portable_to__lti_id=lti.context_id,
-        portable_to__consumer_site_id=consumer_site.id,
-    )
-
     queryset = model.objects.select_related("playlist")
     if hasattr(queryset, "annotate_can_edit"):  # for video only for now
         queryset = queryset.annotate_can_edit(
@@ -116,23 +275,12 @@ def get_or_create_resource(model, lti):
     try:
         instance = queryset.get(
             Q() if (lti.is_instructor or lti.is_admin) else model.get_ready_clause(),
-            # The resource exists in this playlist on this consumer site
-            Q(playlist__lti_id=lti.context_id, playlist__consumer_site=consumer_site)
-            # The resource exists in another playlist of the same consumer site and is portable
-            | Q(
-                playlist__is_portable_to_playlist=True,
-                playlist__consumer_site=consumer_site,
-            )
-            # The resource exists in another consumer site to which it is portable because:
-            # 1. its playlist is portable to all consumer sites
-            | Q(playlist__is_portable_to_consumer_site=True)
-            # 2. its playlist is portable to the requested playlist
-            | Q(playlist__in=playlist_reachable_from)
-            # 3. all playlists in the consumer site of the resource are portable to the
-            #    requesting consumer site
-            | Q(playlist__consumer_site__in=consumer_site.reachable_from.all()),
             pk=lti.resource_id,
         )
+    except model.DoesNotExist:
+        instance = None
+
+    if instance is not None and is_playlist_reachable(instance.playlist, lti):
         if (
             hasattr(instance, "last_lti_url")
             and lti.origin_url
@@ -141,19 +289,13 @@ def get_or_create_resource(model, lti):
             instance.last_lti_url = lti.origin_url
             instance.save(update_fields=["last_lti_url"])
         return instance
-    except model.DoesNotExist:
-        pass
 
     if not (lti.is_instructor or lti.is_admin):
         return None
 
-    try:
-        resource = queryset.get(pk=lti.resource_id)
-    except model.DoesNotExist:
-        pass
-    else:
+    if instance is not None:
         raise PortabilityError(
-            f"The {model.__name__} ID {resource.id} already exists but is not portable to your "
+            f"The {model.__name__} ID {instance.id} already exists but is not portable to your "
             f"playlist ({lti.context_id}) and/or consumer site ({lti.get_consumer_site().domain})."
         )
 
@@ -33,7 +33,7 @@ def get_lti_select_config():
                 "route": LTI_VIDEO_ROUTE,
                 "extra_filter": lambda queryset: queryset.filter(
                     Q(live_type__isnull=True) | Q(live_state=ENDED)
-                ),
+                ).prefetch_related("thumbnail"),
             }
         )
     if settings.WEBINAR_ENABLED:
@@ -45,7 +45,9 @@ def get_lti_select_config():
                 "route": LTI_VIDEO_ROUTE,
                 "extra_filter": lambda queryset: queryset.filter(
                     live_type__isnull=False
-                ).exclude(live_state=ENDED),
+                )
+                .exclude(live_state=ENDED)
+                .prefetch_related("thumbnail"),
             }
         )
 
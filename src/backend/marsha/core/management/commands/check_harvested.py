@@ -11,6 +11,9 @@ import boto3
 
 from marsha.core.defaults import DELETED, HARVESTED, PENDING
 from marsha.core.models import Video
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
+from marsha.core.utils.s3_cleanup_utils import S3PrefixCleanup
 
 
 aws_credentials = {
@@ -50,37 +53,36 @@ class Command(BaseCommand):
                 uploaded_on__lte=expired_date,
             ),
         )
+        videos = list(videos)
+        if not videos:
+            return
+
         for video in videos:
             # For each video ready we check the updated_at value and if it's
             # setting.NB_DAYS_BEFORE_DELETING_LIVE_RECORDINGS old, the video must be put
             # offline and all related objects on aws removed.
             self.stdout.write(f"Processing video {video.id}")
-            self._delete_video_objects(video)
-            video.upload_state = DELETED
-            video.save()
 
-    def _delete_video_objects(self, video, continuation_token=None):
-        """Fetch all existing objects for a given video."""
-        params = {
-            "Bucket": settings.AWS_DESTINATION_BUCKET_NAME,
-            "Prefix": str(video.pk),
-        }
-        if continuation_token:
-            params["ContinuationToken"] = continuation_token
-
-        data = s3_client.list_objects_v2(**params)
-
-        if data.get("KeyCount") == 0:
+        # The objects of all the videos are deleted in shared batches
+        progress = S3PrefixCleanup(
+            s3_client,
+            settings.AWS_DESTINATION_BUCKET_NAME,
+            on_progress=lambda progress: self.stdout.write(
+                f"Deleted {progress['deleted']}/{progress['listed']} objects "
+                f"of {progress['prefixes']} videos"
+            ),
+        ).run(str(video.pk) for video in videos)
+        if progress["errors"]:
+            # Keep the videos to delete their remaining objects at the next run
+            self.stderr.write(f"{progress['errors']} objects could not be deleted")
             return
 
-        s3_objects = []
-        for s3_object in data.get("Contents"):
-            s3_objects.append({"Key": s3_object.get("Key")})
-
-        s3_client.delete_objects(
-            Bucket=settings.AWS_DESTINATION_BUCKET_NAME,
-            Delete={"Objects": s3_objects},
-        )
-
-        if data.get("IsTruncated"):
-            self._delete_video_objects(video, data.get("NextContinuationToken"))
+        now = timezone.now()
+        for video in videos:
+            video.upload_state = DELETED
+            video.updated_on = now
+        Video.objects.bulk_update(videos, ["upload_state", "updated_on"])
+        for video in videos:
+            invalidate_app_data_cache(video.id, video.playlist_id)
+        for playlist_id in {video.playlist_id for video in videos}:
+            invalidate_lti_select_cache(playlist_id)
@@ -7,10 +7,12 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from marsha.core.defaults import DELETED, ENDED
-from marsha.core.models import Video
 from marsha.core.utils.medialive_utils import (
     delete_medialive_stack,
+    exclusive_command,
+    list_environment_medialive_channels,
     list_medialive_channels,
+    run_concurrently,
 )
 from marsha.core.utils.time_utils import to_datetime
 
@@ -36,60 +38,75 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Execute management command."""
-        expired_date = generate_expired_date()
-        for medialive_channel in list_medialive_channels():
-            # Don't work with stack not belonging to the current environment
-            if (
-                medialive_channel.get("Tags", {}).get("environment")
-                != settings.AWS_BASE_NAME
-            ):
-                continue
+        with exclusive_command("clean_aws_elemental_stack") as can_run:
+            if not can_run:
+                self.stdout.write("Command already running")
+                return
+            self._clean_channels()
 
+    def _clean_channels(self):
+        """Delete the channels of expired or missing lives, concurrently."""
+        expired_date = generate_expired_date()
+        idle_channels = [
+            medialive_channel
+            for medialive_channel in list_medialive_channels()
             # If the live is not idle, skip it
-            if medialive_channel.get("State") != "IDLE":
-                continue
-            # the channel name contains the environment, the primary key and the created_at
-            # stamp. Here we want to use the primary key
-            _environment, live_pk, _stamp = medialive_channel["Name"].split("_")
-            try:
-                live = Video.objects.get(pk=live_pk)
-                self.stdout.write(f"Checking video {live.id}")
-
-                if live.get_medialive_channel().get("id") != medialive_channel["Id"]:
-                    # Live is attached to another channel, delete this channel.
-                    self.stdout.write(
-                        f"The video {live.id} is not attached to the "
-                        f"channel {medialive_channel['Name']}"
-                    )
-                    delete_medialive_stack(medialive_channel, self.stdout)
-                    continue
-
-                if live.starting_at:
-                    # Live was scheduled, we can use this schedule date.
-                    if live.starting_at < expired_date:
-                        self._delete_live(live, medialive_channel)
-                elif started_at := live.live_info.get("started_at"):
-                    # Live has started_at info, we can use it.
-                    started_at = to_datetime(started_at)
-                    if started_at < expired_date:
-                        self._delete_live(live, medialive_channel)
-            except Video.DoesNotExist:
+            if medialive_channel.get("State") == "IDLE"
+        ]
+
+        channels_to_delete = []
+        expired_lives = []
+        for medialive_channel, live_pk, live in list_environment_medialive_channels(
+            idle_channels
+        ):
+            if live is None:
                 # Channel exists in AWS but no live in our DB. Delete it.
                 self.stdout.write(
                     f"""Channel {medialive_channel["Name"]} is """
                     f"""attached to a video {live_pk} that does not exist"""
                 )
-                delete_medialive_stack(medialive_channel, self.stdout)
+                channels_to_delete.append(medialive_channel)
+                continue
 
-    def _delete_live(self, live, medialive_channel):
-        """
-        Set the live_state to ENDED, the upload_state to DELETED and delete
-        all AWS resources
-        """
-        self.stdout.write(f"deleting AWS resources for video {live.id}")
+            self.stdout.write(f"Checking video {live.id}")
+
+            if live.get_medialive_channel().get("id") != medialive_channel["Id"]:
+                # Live is attached to another channel, delete this channel.
+                self.stdout.write(
+                    f"The video {live.id} is not attached to the "
+                    f"channel {medialive_channel['Name']}"
+                )
+                channels_to_delete.append(medialive_channel)
+                continue
 
-        delete_medialive_stack(medialive_channel, self.stdout)
+            if live.starting_at:
+                # Live was scheduled, we can use this schedule date.
+                started_at = live.starting_at
+            elif started_at := live.live_info.get("started_at"):
+                # Live has started_at info, we can use it.
+                started_at = to_datetime(started_at)
 
+            if started_at and started_at < expired_date:
+                self.stdout.write(f"deleting AWS resources for video {live.id}")
+                channels_to_delete.append(medialive_channel)
+                expired_lives.append(live)
+
+        run_concurrently(
+            lambda medialive_channel: delete_medialive_stack(
+                medialive_channel, self.stdout
+            ),
+            channels_to_delete,
+        )
+
+        # Lives are updated once their AWS resources are deleted
+        for live in expired_lives:
+            self._delete_live(live)
+
+    def _delete_live(self, live):
+        """
+        Set the live_state to ENDED, the upload_state to DELETED once all AWS
+        resources are deleted
+        """
         self.stdout.write(f"Set video state to deleted for video {live.id}")
         live.live_state = ENDED
         live.upload_state = DELETED
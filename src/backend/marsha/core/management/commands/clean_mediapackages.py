@@ -4,9 +4,12 @@ from django.core.management.base import BaseCommand
 
 from marsha.core.utils.medialive_utils import (
     delete_mediapackage_channel,
+    exclusive_command,
     list_indexed_medialive_channels,
-    list_mediapackage_channel_harvest_jobs,
+    list_indexed_mediapackage_harvest_jobs,
+    list_indexed_mediapackage_origin_endpoints,
     list_mediapackage_channels,
+    run_concurrently,
 )
 
 
@@ -20,34 +23,57 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Execute management command."""
+        with exclusive_command("clean_mediapackages") as can_run:
+            if not can_run:
+                self.stdout.write("Command already running")
+                return
+            self._clean_mediapackages()
+
+    def _clean_mediapackages(self):
+        """Delete the orphan mediapackage channels, concurrently."""
         mediapackage_channels = list_mediapackage_channels()
+        if not mediapackage_channels:
+            return
         indexed_medialive_channels = list_indexed_medialive_channels()
 
+        orphan_channel_ids = []
         for mediapackage_channel in mediapackage_channels:
             mediapackage_channel_id = mediapackage_channel.get("Id")
             self.stdout.write(
                 f"Processing mediapackage channel {mediapackage_channel_id}"
             )
 
-            if mediapackage_channel_id in indexed_medialive_channels.keys():
-                continue
+            if mediapackage_channel_id not in indexed_medialive_channels.keys():
+                orphan_channel_ids.append(mediapackage_channel_id)
+
+        if not orphan_channel_ids:
+            return
 
-            mediapackage_channel_should_be_deleted = True
-            mediapackage_channel_harvest_jobs = list_mediapackage_channel_harvest_jobs(
-                mediapackage_channel_id
+        # Orphan channels are kept as long as one of their harvest jobs did not fail
+        indexed_harvest_jobs = list_indexed_mediapackage_harvest_jobs()
+        channel_ids_to_delete = [
+            mediapackage_channel_id
+            for mediapackage_channel_id in orphan_channel_ids
+            if all(
+                harvest_job.get("Status") in ("FAILED",)
+                for harvest_job in indexed_harvest_jobs.get(mediapackage_channel_id, [])
             )
-            for harvest_job in mediapackage_channel_harvest_jobs:
-                mediapackage_channel_should_be_deleted = (
-                    mediapackage_channel_should_be_deleted
-                    & (harvest_job.get("Status") in ("FAILED",))
-                )
+        ]
+        if not channel_ids_to_delete:
+            return
 
-            if mediapackage_channel_should_be_deleted:
-                deleted_endpoints = delete_mediapackage_channel(mediapackage_channel_id)
-                for deleted_endpoint in deleted_endpoints:
-                    self.stdout.write(
-                        f"Mediapackage channel endpoint {deleted_endpoint} deleted"
-                    )
+        indexed_origin_endpoints = list_indexed_mediapackage_origin_endpoints()
+        deleted_endpoints_by_channel = run_concurrently(
+            lambda channel_id: delete_mediapackage_channel(
+                channel_id, indexed_origin_endpoints.get(channel_id, [])
+            ),
+            channel_ids_to_delete,
+        )
+        for mediapackage_channel_id, deleted_endpoints in zip(
+            channel_ids_to_delete, deleted_endpoints_by_channel
+        ):
+            for deleted_endpoint in deleted_endpoints:
                 self.stdout.write(
-                    f"Mediapackage channel {mediapackage_channel_id} deleted"
+                    f"Mediapackage channel endpoint {deleted_endpoint} deleted"
                 )
+            self.stdout.write(f"Mediapackage channel {mediapackage_channel_id} deleted")
@@ -0,0 +1,42 @@
+"""Management command to recover in batch the transcode pipeline of videos."""
+
+from django.core.management import BaseCommand
+
+from marsha.core.models import Video
+from marsha.core.tasks.video import recover_transcode_pipelines
+
+
+class Command(BaseCommand):
+    """Recover in batch the transcode pipeline of videos uploaded without it."""
+
+    help = "Recover in batch the transcode pipeline of videos uploaded without it"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of videos recovered by each task",
+        )
+
+    def handle(self, *args, **options):
+        """Recover in batch the transcode pipeline of videos."""
+        video_pks = Video.objects.filter(
+            transcode_pipeline__isnull=True, uploaded_on__isnull=False
+        ).values_list("pk", flat=True)
+
+        batch = []
+        for video_pk in video_pks.iterator():
+            batch.append(str(video_pk))
+            if len(batch) == options["batch_size"]:
+                self._recover(batch)
+                batch = []
+        if batch:
+            self._recover(batch)
+
+    def _recover(self, video_pks):
+        """Recover the transcode pipeline of a batch of videos in the background."""
+        recover_transcode_pipelines.delay(video_pks)
+        self.stdout.write(
+            f"{len(video_pks)} videos will have their transcode pipeline recovered"
+        )
@@ -9,8 +9,8 @@ import boto3
 
 from marsha.core.defaults import AWS_S3, AWS_STORAGE_BASE_DIRECTORY, READY
 from marsha.core.models.file import Document
-from marsha.core.storage.storage_class import file_storage
 from marsha.core.utils import time_utils
+from marsha.core.utils.s3_migration_utils import S3ObjectMigration
 
 
 logger = logging.getLogger(__name__)
@@ -41,44 +41,56 @@ class Command(BaseCommand):
 
         return value
 
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of documents renamed at once.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            default=False,
+            help="Start again from the first document instead of the last checkpoint.",
+        )
+
+    def prepare_document(self, document):
+        """Fix the filename of a document and return the keys of its copy."""
+        # Get the file stored on Scaleway S3 under `aws/`
+        stamp = time_utils.to_timestamp(document.uploaded_on)
+        extension = "." + document.extension if document.extension else ""
+
+        file_key_src = document.get_storage_key(
+            filename=f"{stamp}{extension}", base_dir=AWS_STORAGE_BASE_DIRECTORY
+        )
+
+        # Override document filename with the validated S3-compatible filename
+        filename = self.validate_filename(document.title + extension)
+        document.filename = filename
+
+        # Compute file key destination which should be the document filename
+        file_key_dest = document.get_storage_key(
+            filename, base_dir=AWS_STORAGE_BASE_DIRECTORY
+        )
+        return file_key_src, file_key_dest
+
     def handle(self, *args, **options):
         """Execute management command."""
 
         documents = Document.objects.filter(storage_location=AWS_S3, upload_state=READY)
 
-        for document in documents:
-            # Get the file stored on Scaleway S3 under `aws/`
-            stamp = time_utils.to_timestamp(document.uploaded_on)
-            extension = "." + document.extension if document.extension else ""
-
-            file_key_src = document.get_storage_key(
-                filename=f"{stamp}{extension}", base_dir=AWS_STORAGE_BASE_DIRECTORY
-            )
-            copy_source = {
-                "Bucket": settings.STORAGE_S3_BUCKET_NAME,
-                "Key": file_key_src,
-            }
-
-            filename = self.validate_filename(document.title + extension)
-
-            # Override document filename with the validated S3-compatible filename
-            if filename != document.filename:
-                document.filename = filename
-                document.save()
-
-            # Compute file key destination which should be the document filename
-            file_key_dest = document.get_storage_key(
-                filename, base_dir=AWS_STORAGE_BASE_DIRECTORY
-            )
-            if file_storage.exists(file_key_dest):
-                logger.info("Object %s already exists", file_key_dest)
-                continue
-
-            logger.info("Copying %s to %s", file_key_src, file_key_dest)
-            s3_client.copy_object(
-                Bucket=settings.STORAGE_S3_BUCKET_NAME,
-                CopySource=copy_source,
-                Key=file_key_dest,
-            )
+        migration = S3ObjectMigration(
+            "rename_documents", s3_client, settings.STORAGE_S3_BUCKET_NAME
+        )
+        if options["restart"]:
+            migration.reset()
+        migration.run(
+            documents,
+            self.prepare_document,
+            ["filename"],
+            batch_size=options["batch_size"],
+        )
 
         logger.info("Finished copying!")
@@ -7,8 +7,11 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from marsha.core.defaults import HARVESTED
-from marsha.core.models import Video
-from marsha.core.utils.medialive_utils import list_medialive_channels
+from marsha.core.utils.medialive_utils import (
+    exclusive_command,
+    list_environment_medialive_channels,
+    list_medialive_channels,
+)
 from marsha.core.utils.send_emails import send_convert_reminder_notification
 from marsha.core.utils.time_utils import to_datetime
 
@@ -32,39 +35,41 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Execute management command."""
-        expiration_reminder_date = generate_expiration_reminder_date()
-        for medialive_channel in list_medialive_channels():
-            # Don't work with stack not belonging to the current environment
-            if (
-                medialive_channel.get("Tags", {}).get("environment")
-                != settings.AWS_BASE_NAME
-            ):
-                continue
+        with exclusive_command("send_vod_convert_reminders") as can_run:
+            if not can_run:
+                self.stdout.write("Command already running")
+                return
+            self._send_reminders()
 
+    def _send_reminders(self):
+        """Remind the lives of the idle channels that they will be deleted soon."""
+        expiration_reminder_date = generate_expiration_reminder_date()
+        idle_channels = [
+            medialive_channel
+            for medialive_channel in list_medialive_channels()
             # If the live is not idle, skip it
-            if medialive_channel.get("State") != "IDLE":
+            if medialive_channel.get("State") == "IDLE"
+        ]
+        for _channel, _live_pk, live in list_environment_medialive_channels(
+            idle_channels
+        ):
+            if live is None:
+                # Channel exists in AWS but no live in our DB.
+                # Let clean_aws_elemental_stack handle it.
                 continue
-            # the channel name contains the environment, the primary key and the created_at
-            # stamp. Here we want to use the primary key
-            _environment, live_pk, _stamp = medialive_channel["Name"].split("_")
-            try:
-                live = Video.objects.get(pk=live_pk)
-                self.stdout.write(f"Checking video {live.id}")
 
-                if not live.recording_slices or live.live_state == HARVESTED:
-                    # Live has no recordings or is already harvested, we can skip it.
-                    continue
+            self.stdout.write(f"Checking video {live.id}")
 
-                if live.starting_at:
-                    # Live was scheduled, we can use this schedule date.
-                    if live.starting_at < expiration_reminder_date:
-                        send_convert_reminder_notification(live)
-                elif started_at := live.live_info.get("started_at"):
-                    # Live has started_at info, we can use it.
-                    started_at = to_datetime(started_at)
-                    if started_at < expiration_reminder_date:
-                        send_convert_reminder_notification(live)
-            except Video.DoesNotExist:
-                # Channel exists in AWS but no live in our DB.
-                # Let clean_aws_elemental_stack handle it.
-                pass
+            if not live.recording_slices or live.live_state == HARVESTED:
+                # Live has no recordings or is already harvested, we can skip it.
+                continue
+
+            if live.starting_at:
+                # Live was scheduled, we can use this schedule date.
+                if live.starting_at < expiration_reminder_date:
+                    send_convert_reminder_notification(live)
+            elif started_at := live.live_info.get("started_at"):
+                # Live has started_at info, we can use it.
+                started_at = to_datetime(started_at)
+                if started_at < expiration_reminder_date:
+                    send_convert_reminder_notification(live)
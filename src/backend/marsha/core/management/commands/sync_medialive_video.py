@@ -1,14 +1,15 @@
 """Check every existing medialive channel and check if the related video is still usable."""
 
-from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from marsha.core.defaults import IDLE, RUNNING, STOPPED
-from marsha.core.models import Video
 from marsha.core.utils.medialive_utils import (
     delete_medialive_stack,
+    exclusive_command,
+    list_environment_medialive_channels,
     list_medialive_channels,
+    run_concurrently,
     update_id3_tags,
 )
 from marsha.core.utils.time_utils import to_timestamp
@@ -79,35 +80,43 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Execute management command."""
-        for medialive_channel in list_medialive_channels():
-            # Don't work with stack not belonging to the current environment
-            if (
-                medialive_channel.get("Tags", {}).get("environment")
-                != settings.AWS_BASE_NAME
-            ):
-                continue
-
-            # the channel name contains the environment, the primary key and the created_at
-            # stamp. Here we want to use the primary key
-            _environment, live_pk, _stamp = medialive_channel["Name"].split("_")
-            try:
-                live = Video.objects.get(pk=live_pk)
-                self.stdout.write(f"Checking video {live.id}")
-                channel_state = medialive_channel.get("State").casefold()
-
-                # If the live state in not sync with media channel state,
-                # we manually update to avoid soft lock
-                live_state = live.live_state.casefold()
-                if not self.is_channel_sync_with_video(live_state, channel_state):
-                    self.stdout.write(
-                        f"""Video {live.id} not sync: (video) """
-                        f"""{live_state} != {channel_state} (medialive)"""
-                    )
-                    self.update_video_state(live, channel_state)
-            except Video.DoesNotExist:
+        with exclusive_command("sync_medialive_video") as can_run:
+            if not can_run:
+                self.stdout.write("Command already running")
+                return
+            self._sync_medialive_channels()
+
+    def _sync_medialive_channels(self):
+        """Sync the lives with their channel and delete the orphan channels."""
+        orphan_channels = []
+        for medialive_channel, live_pk, live in list_environment_medialive_channels(
+            list_medialive_channels()
+        ):
+            if live is None:
                 # live exists in AWS but not in our DB
                 self.stdout.write(
                     f"""Channel {medialive_channel["Name"]} is """
                     f"""attached to a video {live_pk} that does not exist"""
                 )
-                delete_medialive_stack(medialive_channel, self.stdout)
+                orphan_channels.append(medialive_channel)
+                continue
+
+            self.stdout.write(f"Checking video {live.id}")
+            channel_state = medialive_channel.get("State").casefold()
+
+            # If the live state in not sync with media channel state,
+            # we manually update to avoid soft lock
+            live_state = live.live_state.casefold()
+            if not self.is_channel_sync_with_video(live_state, channel_state):
+                self.stdout.write(
+                    f"""Video {live.id} not sync: (video) """
+                    f"""{live_state} != {channel_state} (medialive)"""
+                )
+                self.update_video_state(live, channel_state)
+
+        run_concurrently(
+            lambda medialive_channel: delete_medialive_stack(
+                medialive_channel, self.stdout
+            ),
+            orphan_channels,
+        )
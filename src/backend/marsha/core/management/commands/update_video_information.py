@@ -4,7 +4,7 @@ from django.core.management import BaseCommand
 
 from marsha.core import defaults
 from marsha.core.models import Video
-from marsha.core.tasks.video import compute_video_information
+from marsha.core.tasks.video import compute_videos_information
 
 
 class Command(BaseCommand):
@@ -18,6 +18,12 @@ class Command(BaseCommand):
             type=int,
             help="The number of videos to update",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of videos updated by each task",
+        )
 
     def handle(self, *args, **options):
         """Update in batch video size and duration."""
@@ -28,6 +34,12 @@ class Command(BaseCommand):
         if options["limit"]:
             videos = videos[: options["limit"]]
 
-        for video in videos.iterator():
-            compute_video_information.delay(str(video.id))
-            self.stdout.write(f"Video {video.id} information will be updated")
+        batch = []
+        for video_id in videos.values_list("id", flat=True).iterator():
+            batch.append(str(video_id))
+            self.stdout.write(f"Video {video_id} information will be updated")
+            if len(batch) == options["batch_size"]:
+                compute_videos_information.delay(batch)
+                batch = []
+        if batch:
+            compute_videos_information.delay(batch)
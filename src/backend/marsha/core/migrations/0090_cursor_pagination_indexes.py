@@ -0,0 +1,39 @@
+# Generated by Django 5.0.9 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0089_alter_audiotrack_language_alter_signtrack_language_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["created_on", "id"], name="video_created_on_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["title", "id"], name="video_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="livesession",
+            index=models.Index(
+                fields=["created_on", "id"], name="live_session_created_on_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="playlist",
+            index=models.Index(
+                fields=["created_on", "id"], name="playlist_created_on_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="playlist",
+            index=models.Index(fields=["title", "id"], name="playlist_title_idx"),
+        ),
+    ]
@@ -5,18 +5,39 @@ In this base model, we activate generic behaviours that apply to all our models
 checks and validation that go further than what Django is doing.
 """
 
-from itertools import chain
+from collections import Counter, defaultdict
+from itertools import chain, islice
 import uuid
 
 from django.core import checks
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models.deletion import ProtectedError, get_candidate_relations_to_delete
+from django.db.models.signals import ModelSignal
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from safedelete.models import SOFT_DELETE_CASCADE, SafeDeleteModel
+from safedelete.models import (
+    SOFT_DELETE,
+    SOFT_DELETE_CASCADE,
+    SafeDeleteModel,
+    is_safedelete_cls,
+)
 
 
 CHECKED_APPS = {"core"}
+SOFT_DELETE_CASCADE_BATCH_SIZE = 1000
+
+# Sent once per model and batch of primary keys soft deleted by cascade with
+# the `pks` and `using` arguments. The instances are updated in bulk, they send
+# neither `post_save` nor `post_softdelete`.
+post_cascade_softdelete = ModelSignal(use_caching=True)
+
+
+def _batches(iterable):
+    """Split an iterable in lists of at most `SOFT_DELETE_CASCADE_BATCH_SIZE` items."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, SOFT_DELETE_CASCADE_BATCH_SIZE)):
+        yield batch
 
 
 def _get_fields_by_source_model(model):
@@ -199,6 +220,140 @@ class BaseModel(SafeDeleteModel):
 
         return errors
 
+    def _collect_soft_delete_cascade(self, using):
+        """Walk the relations of the instance to find what its soft deletion impacts.
+
+        Only primary keys are fetched, one query per relation and batch of primary keys,
+        instead of instantiating every related object.
+
+        Parameters
+        ----------
+        using: string
+            The database alias to query.
+
+        Returns
+        -------
+        Tuple[Dict[Type[models.Model], Set], List[Tuple[models.QuerySet, Dict]]]
+            The primary keys of the related objects to soft delete by model, and the
+            querysets to update with their values for the `SET_NULL` and `SET_DEFAULT`
+            relations.
+
+        Raises
+        ------
+        ProtectedError
+            When a related object not deleted is protected by a foreign key.
+
+        """
+        to_delete = defaultdict(set)
+        to_delete[self.__class__].add(self.pk)
+        field_updates = []
+        protected = []
+
+        pending = [(self.__class__, [self.pk])]
+        while pending:
+            model, pks = pending.pop()
+            for relation in get_candidate_relations_to_delete(model._meta):
+                related_model = relation.related_model
+                field = relation.field
+                on_delete = field.remote_field.on_delete
+                if on_delete is models.DO_NOTHING:
+                    continue
+
+                for batch in _batches(pks):
+                    # pylint: disable=protected-access
+                    queryset = related_model._base_manager.using(using).filter(
+                        **{f"{field.name}__in": batch}
+                    )
+                    if on_delete is models.SET_NULL:
+                        field_updates.append((queryset, {field.name: None}))
+                        continue
+                    if on_delete is models.SET_DEFAULT:
+                        field_updates.append(
+                            (queryset, {field.name: field.get_default()})
+                        )
+                        continue
+
+                    # Objects already soft deleted are neither protected nor deleted again
+                    if is_safedelete_cls(related_model):
+                        queryset = queryset.filter(deleted__isnull=True)
+                    if on_delete in (models.PROTECT, models.RESTRICT):
+                        protected.extend(queryset)
+                        continue
+                    # Only soft deletable objects are deleted by cascade
+                    if not is_safedelete_cls(related_model):
+                        continue
+
+                    related_pks = (
+                        set(queryset.values_list("pk", flat=True))
+                        - to_delete[related_model]
+                    )
+                    if related_pks:
+                        to_delete[related_model].update(related_pks)
+                        pending.append((related_model, list(related_pks)))
+
+        if protected:
+            raise ProtectedError(
+                f"Cannot delete some instances of model {self.__class__.__name__!r} "
+                "because they are referenced through protected foreign keys: "
+                f"{', '.join(sorted({obj.__class__.__name__ for obj in protected}))}.",
+                set(protected),
+            )
+
+        to_delete[self.__class__].discard(self.pk)
+        return to_delete, field_updates
+
+    def soft_delete_cascade_policy_action(self, **kwargs):
+        """Soft delete the instance and, in bulk, the objects related to it.
+
+        Unlike `safedelete`, which saves the related objects one by one, the related
+        objects are updated with one query per model and batch of
+        `SOFT_DELETE_CASCADE_BATCH_SIZE` primary keys. Their side effects are left to
+        the receivers of the `post_cascade_softdelete` signal.
+
+        Parameters
+        ----------
+        kwargs:
+            Passed onto the soft deletion of the instance.
+
+        Returns
+        -------
+        Tuple[int, Dict[str, int]]
+            The number of objects soft deleted and the number by model label.
+
+        """
+        using = kwargs.get("using") or router.db_for_write(
+            self.__class__, instance=self
+        )
+        deleted_counter = Counter()
+        batches = []
+
+        to_delete, field_updates = self._collect_soft_delete_cascade(using)
+
+        with transaction.atomic(using=using):
+            now = timezone.now()
+            for model, pks in to_delete.items():
+                values = {"deleted": now, "deleted_by_cascade": True}
+                if any(field.name == "updated_on" for field in model._meta.fields):
+                    values["updated_on"] = now
+                for batch in _batches(pks):
+                    deleted_counter[model._meta.label] += (
+                        model.all_objects.using(using)
+                        .filter(pk__in=batch, deleted__isnull=True)
+                        .update(**values)
+                    )
+                    batches.append((model, batch))
+
+            _, delete_response = self._delete(force_policy=SOFT_DELETE, **kwargs)
+            deleted_counter.update(delete_response)
+
+            for queryset, values in field_updates:
+                queryset.update(**values)
+
+        for model, batch in batches:
+            post_cascade_softdelete.send(sender=model, pks=batch, using=using)
+
+        return sum(deleted_counter.values()), dict(deleted_counter)
+
     def __repr__(self, dict_repr=False):
         return str(self.to_dict())
 
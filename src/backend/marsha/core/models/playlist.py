@@ -161,6 +161,10 @@ class Playlist(BaseModel):
         db_table = "playlist"
         verbose_name = _("playlist")
         verbose_name_plural = _("playlists")
+        indexes = [
+            models.Index(fields=["created_on", "id"], name="playlist_created_on_idx"),
+            models.Index(fields=["title", "id"], name="playlist_title_idx"),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["lti_id", "consumer_site"],
@@ -283,6 +283,11 @@ class Video(BaseFile, RetentionDateObjectMixin):
         ordering = ["position", "id"]
         verbose_name = _("video")
         verbose_name_plural = _("videos")
+        # Support the cursor pagination of the API on its ordering fields
+        indexes = [
+            models.Index(fields=["created_on", "id"], name="video_created_on_idx"),
+            models.Index(fields=["title", "id"], name="video_title_idx"),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="live_type_check",
@@ -960,6 +965,11 @@ class LiveSession(BaseModel):
         """Options for the `livesessions` model."""
 
         db_table = "live_session"
+        indexes = [
+            models.Index(
+                fields=["created_on", "id"], name="live_session_created_on_idx"
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="livesession_lti_or_public_or_standalone",
@@ -0,0 +1,208 @@
+"""Pagination classes for the API of the core app and the other apps."""
+
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+CURSOR_COUNT_CACHE_KEY = "cursor_pagination|count|{query_hash}"
+
+
+class CursorLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination, switching to keyset pagination with a `cursor` parameter.
+
+    Deep offsets scan and drop all the rows before them. Clients opt in keyset pagination
+    by sending a `cursor` query parameter, empty for the first page: each page then
+    starts right after the last row of the previous one, on the first field the
+    queryset is ordered by, with the primary key as tiebreaker. This field must be
+    one of the `ordering_fields` of the view, other orderings fall back to the
+    limit/offset pagination.
+
+    The response keeps the shape of the limit/offset pagination, its `next` and
+    `previous` links carrying cursors. Its `count` is cached for
+    `CURSOR_PAGINATION_COUNT_CACHE_TIMEOUT` seconds and may lag behind the results.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    cursor_ordering = None
+    has_next = False
+    has_previous = False
+    results = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate with a cursor when one is requested and the ordering supports it."""
+        self.cursor_ordering = None
+        if self.cursor_query_param in request.query_params:
+            self.cursor_ordering = self.get_cursor_ordering(queryset, view)
+        if self.cursor_ordering is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        # pylint: disable=attribute-defined-outside-init
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        field, descending = self.cursor_ordering
+        position = self.decode_cursor(request.query_params[self.cursor_query_param])
+        reverse = position is not None and position["reverse"]
+        if reverse:
+            descending = not descending
+        page_queryset = queryset
+        if position is not None:
+            page_queryset = queryset.filter(
+                self._after_position(field, descending, position)
+            )
+
+        direction = "-" if descending else ""
+        results = list(
+            page_queryset.order_by(f"{direction}{field.name}", f"{direction}pk")[
+                : self.limit + 1
+            ]
+        )
+        has_more = len(results) > self.limit
+        results = results[: self.limit]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.results = results
+        self.count = self.get_cached_count(queryset)
+        return results
+
+    def get_cursor_ordering(self, queryset, view):
+        """
+        Return the field paginated by cursor and whether it is descending.
+
+        Returns None when the first field the queryset is ordered by is not one of the
+        `ordering_fields` of the view.
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        if not ordering or not isinstance(ordering[0], str):
+            return None
+
+        name = ordering[0].lstrip("-")
+        if name not in (getattr(view, "ordering_fields", None) or []):
+            return None
+
+        return queryset.model._meta.get_field(name), ordering[0].startswith("-")
+
+    def _after_position(self, field, descending, position):
+        """
+        Filter the rows after a position, in the order PostgreSQL returns them.
+
+        Null values come last in ascending order and first in descending order.
+        """
+        lookup = "lt" if descending else "gt"
+        value, pk = position["value"], position["pk"]
+        if value is None:
+            after = Q(**{f"{field.name}__isnull": True, f"pk__{lookup}": pk})
+            if descending:
+                after |= Q(**{f"{field.name}__isnull": False})
+            return after
+
+        after = Q(**{f"{field.name}__{lookup}": value}) | Q(
+            **{field.name: value, f"pk__{lookup}": pk}
+        )
+        if field.null and not descending:
+            after |= Q(**{f"{field.name}__isnull": True})
+        return after
+
+    def encode_cursor(self, instance, reverse):
+        """Encode the position of an instance in a cursor."""
+        field, _descending = self.cursor_ordering
+        value = field.value_from_object(instance)
+        position = {
+            "value": None if value is None else field.value_to_string(instance),
+            "pk": str(instance.pk),
+            "reverse": reverse,
+        }
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Decode the position of a cursor, None for the first page."""
+        if not cursor:
+            return None
+
+        field, _descending = self.cursor_ordering
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if position["value"] is not None:
+                position["value"] = field.to_python(position["value"])
+            return {
+                "value": position["value"],
+                "pk": position["pk"],
+                "reverse": bool(position["reverse"]),
+            }
+        except (TypeError, ValueError, KeyError) as error:
+            raise NotFound(self.invalid_cursor_message) from error
+
+    def get_cached_count(self, queryset):
+        """Count the rows of a queryset, caching the count of each query."""
+        sql, params = queryset.order_by().query.sql_with_params()
+        cache_key = CURSOR_COUNT_CACHE_KEY.format(
+            query_hash=hashlib.md5(  # nosec
+                f"{sql}{params}".encode("utf-8")
+            ).hexdigest()
+        )
+        count = cache.get(cache_key)
+        if count is None:
+            count = queryset.count()
+            cache.set(cache_key, count, settings.CURSOR_PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def get_cursor_link(self, instance, reverse):
+        """Link to the page after, or before if reversed, an instance."""
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.offset_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(instance, reverse)
+        )
+
+    def get_next_link(self):
+        if self.cursor_ordering is None:
+            return super().get_next_link()
+        if not self.has_next or not self.results:
+            return None
+        return self.get_cursor_link(self.results[-1], reverse=False)
+
+    def get_previous_link(self):
+        if self.cursor_ordering is None:
+            return super().get_previous_link()
+        if not self.has_previous or not self.results:
+            return None
+        return self.get_cursor_link(self.results[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        if self.cursor_ordering is None:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_html_context(self):
+        if self.cursor_ordering is None:
+            return super().get_html_context()
+        return {
+            "previous_url": self.get_previous_link(),
+            "next_url": self.get_next_link(),
+        }
@@ -10,7 +10,6 @@ from django.urls import reverse
 from django.utils import timezone
 
 from rest_framework import serializers
-from sentry_sdk import capture_message
 
 from marsha.core.defaults import (
     AWS_PIPELINE,
@@ -206,19 +205,11 @@ class VideoBaseSerializer(serializers.ModelSerializer):
 
         stamp = time_utils.to_timestamp(obj.uploaded_on)
 
-        # Trying to recover the transcoding pipeline
-        if obj.transcode_pipeline is None:
-            if file_storage.exists(f"scw/{obj.pk}/video/{stamp}/thumbnail.jpg"):
-                obj.transcode_pipeline = PEERTUBE_PIPELINE
-            else:  # Fallback to AWS_PIPELINE
-                obj.transcode_pipeline = AWS_PIPELINE
-            obj.save(update_fields=["transcode_pipeline"])
-            capture_message(
-                f"VOD {obj.pk} had no transcode_pipeline and "
-                f"was recovered to {obj.transcode_pipeline}",
-            )
+        # Videos without pipeline are recovered in the background by the
+        # `recover_transcode_pipelines` command, serializing them stays read-only.
+        transcode_pipeline = obj.transcode_pipeline or AWS_PIPELINE
 
-        if obj.transcode_pipeline == AWS_PIPELINE:
+        if transcode_pipeline == AWS_PIPELINE:
             base = obj.get_storage_prefix(base_dir=AWS_STORAGE_BASE_DIRECTORY)
 
             for resolution in obj.resolutions:
@@ -244,7 +235,7 @@ class VideoBaseSerializer(serializers.ModelSerializer):
                 # Previews
                 urls["previews"] = file_storage.url(f"{base}/previews/{stamp}_100.jpg")
 
-        elif obj.transcode_pipeline == PEERTUBE_PIPELINE:
+        elif transcode_pipeline == PEERTUBE_PIPELINE:
             base = obj.get_storage_prefix(stamp=stamp)
             for resolution in obj.resolutions:
                 # MP4
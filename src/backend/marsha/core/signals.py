@@ -1,6 +1,228 @@
 """Defines the django signals for ```core`` app."""
 
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save
 import django.dispatch
+from django.dispatch import receiver
+
+from marsha.core.lti.utils import (
+    invalidate_reachable_consumer_site_ids,
+    invalidate_reachable_playlist_ids,
+)
+from marsha.core.models import (
+    ConsumerSite,
+    ConsumerSitePortability,
+    Document,
+    Playlist,
+    PlaylistPortability,
+    RetentionDateObjectMixin,
+    SharedLiveMedia,
+    Thumbnail,
+    TimedTextTrack,
+    Video,
+)
+from marsha.core.models.base import post_cascade_softdelete
+from marsha.core.tasks.s3 import delete_s3_videos
+from marsha.core.utils.app_data_utils import (
+    invalidate_app_data_cache,
+    invalidate_playlist_app_data_cache,
+)
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
 
 
 signal_object_uploaded = django.dispatch.Signal()
+
+
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+@receiver(post_save, sender=Video)
+@receiver(post_delete, sender=Video)
+def resource_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a resource served by LTI views.
+    Its cached app data and the cached LTI select listings including its playlist
+    must be renewed.
+    Apps declaring other resources connect it to their own models.
+    """
+    if raw:
+        return
+
+    invalidate_app_data_cache(instance.id, instance.playlist_id)
+    invalidate_lti_select_cache(instance.playlist_id)
+
+
+@receiver(post_cascade_softdelete, sender=Document)
+@receiver(post_cascade_softdelete, sender=Video)
+def resources_cascade_softdeleted_callback(sender, pks, **kwargs):
+    """
+    Callback answering the soft deletion by cascade of resources served by LTI views.
+    Their cached app data and the cached LTI select listings including their playlists
+    must be renewed.
+    Apps declaring other resources connect it to their own models.
+    """
+    for resource_id in pks:
+        invalidate_app_data_cache(resource_id)
+
+    for playlist_id in (
+        sender.all_objects.filter(pk__in=pks)
+        .values_list("playlist_id", flat=True)
+        .distinct()
+    ):
+        invalidate_lti_select_cache(playlist_id)
+
+
+@receiver(post_cascade_softdelete)
+def retention_cascade_softdeleted_callback(sender, pks, **kwargs):
+    """
+    Callback answering the soft deletion by cascade of objects with a retention date.
+    Their files must be deleted from S3 as when they are soft deleted one by one.
+    """
+    if not issubclass(sender, RetentionDateObjectMixin):
+        return
+
+    delete_s3_videos.delay([str(pk) for pk in pks])
+
+
+@receiver(post_save, sender=Playlist)
+@receiver(post_delete, sender=Playlist)
+def playlist_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a playlist.
+    The cached LTI select listings including this playlist must be renewed, as well as
+    the cached app data of its resources, which are serialized with their playlist.
+    """
+    if raw:
+        return
+
+    invalidate_lti_select_cache(instance.id)
+    invalidate_playlist_app_data_cache(instance.id)
+
+
+@receiver(post_cascade_softdelete, sender=Playlist)
+def playlists_cascade_softdeleted_callback(pks, **kwargs):
+    """
+    Callback answering the soft deletion by cascade of playlists.
+    The cached LTI select listings including them and the cached app data of their
+    resources must be renewed.
+    """
+    for playlist_id in pks:
+        invalidate_lti_select_cache(playlist_id)
+        invalidate_playlist_app_data_cache(playlist_id)
+
+
+@receiver(post_save, sender=Thumbnail)
+@receiver(post_delete, sender=Thumbnail)
+def thumbnail_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a thumbnail.
+    The cached LTI select listings including the playlist of its video must be renewed.
+    """
+    if raw:
+        return
+
+    invalidate_app_data_cache(instance.video_id)
+    try:
+        invalidate_lti_select_cache(instance.video.playlist_id)
+    except ObjectDoesNotExist:
+        pass
+
+
+@receiver(post_save, sender=SharedLiveMedia)
+@receiver(post_delete, sender=SharedLiveMedia)
+@receiver(post_save, sender=TimedTextTrack)
+@receiver(post_delete, sender=TimedTextTrack)
+def video_related_object_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of an object serialized with its video.
+    The cached app data of the video must be renewed.
+    """
+    if raw:
+        return
+
+    invalidate_app_data_cache(instance.video_id)
+
+
+@receiver(post_save, sender=PlaylistPortability)
+@receiver(post_delete, sender=PlaylistPortability)
+def playlist_portability_changed_callback(instance, **kwargs):
+    """
+    Callback answering the save and delete of a playlist portability.
+    The playlists reachable from the target playlist must be computed again.
+    """
+    invalidate_reachable_playlist_ids(
+        instance.target_playlist.consumer_site_id, instance.target_playlist.lti_id
+    )
+
+
+@receiver(post_cascade_softdelete, sender=PlaylistPortability)
+def playlist_portabilities_cascade_softdeleted_callback(pks, **kwargs):
+    """
+    Callback answering the soft deletion by cascade of playlist portabilities.
+    The playlists reachable from their target playlists must be computed again.
+    """
+    for consumer_site_id, lti_id in (
+        PlaylistPortability.all_objects.filter(pk__in=pks)
+        .values_list("target_playlist__consumer_site_id", "target_playlist__lti_id")
+        .distinct()
+    ):
+        invalidate_reachable_playlist_ids(consumer_site_id, lti_id)
+
+
+@receiver(m2m_changed, sender=Playlist.portable_to.through)
+def playlist_portable_to_changed_callback(instance, action, reverse, pk_set, **kwargs):
+    """
+    Callback answering the links added through `Playlist.portable_to`.
+    They are bulk created and do not send `post_save`, removed links are deleted
+    one by one and handled by `playlist_portability_changed_callback`.
+    """
+    if action != "post_add":
+        return
+
+    target_playlists = [instance] if reverse else Playlist.objects.filter(pk__in=pk_set)
+
+    for target_playlist in target_playlists:
+        invalidate_reachable_playlist_ids(
+            target_playlist.consumer_site_id, target_playlist.lti_id
+        )
+
+
+@receiver(post_save, sender=ConsumerSitePortability)
+@receiver(post_delete, sender=ConsumerSitePortability)
+def consumer_site_portability_changed_callback(instance, **kwargs):
+    """
+    Callback answering the save and delete of a consumer site portability.
+    The consumer sites reachable from the target site must be computed again.
+    """
+    invalidate_reachable_consumer_site_ids(instance.target_site_id)
+
+
+@receiver(post_cascade_softdelete, sender=ConsumerSitePortability)
+def consumer_site_portabilities_cascade_softdeleted_callback(pks, **kwargs):
+    """
+    Callback answering the soft deletion by cascade of consumer site portabilities.
+    The consumer sites reachable from their target sites must be computed again.
+    """
+    for target_site_id in (
+        ConsumerSitePortability.all_objects.filter(pk__in=pks)
+        .values_list("target_site_id", flat=True)
+        .distinct()
+    ):
+        invalidate_reachable_consumer_site_ids(target_site_id)
+
+
+@receiver(m2m_changed, sender=ConsumerSite.portable_to.through)
+def consumer_site_portable_to_changed_callback(
+    instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Callback answering the links added through `ConsumerSite.portable_to`.
+    They are bulk created and do not send `post_save`, removed links are deleted
+    one by one and handled by `consumer_site_portability_changed_callback`.
+    """
+    if action != "post_add":
+        return
+
+    target_site_ids = [instance.pk] if reverse else pk_set
+
+    for target_site_id in target_site_ids:
+        invalidate_reachable_consumer_site_ids(target_site_id)
@@ -1,11 +1,75 @@
 """Marsha specific authentication class for API."""
 
+from collections import OrderedDict
+import hashlib
+import threading
+
+from django.conf import settings
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+
+
+class ValidatedTokenCache:
+    """
+    Bounded in-process LRU of the validated tokens, keyed by the digest of the raw token.
+
+    A token is kept until its expiration, with the token class it was validated
+    against, so that the same token sent again is not decoded nor verified. The cache
+    holds at most `JWT_VALIDATED_TOKEN_CACHE_SIZE` tokens, 0 disables it.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._tokens = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(raw_token):
+        """Digest of the raw token, the tokens themselves are not kept as keys."""
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode("utf-8")
+        return hashlib.sha256(raw_token).hexdigest()
+
+    def get(self, raw_token):
+        """Return the validated token of a raw token, None if unknown or expired."""
+        key = self._get_key(raw_token)
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is None:
+                return None
+            token, expires_at = cached
+            if expires_at <= aware_utcnow():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return token
+
+    def set(self, raw_token, token):
+        """Keep a validated token until its expiration."""
+        size = settings.JWT_VALIDATED_TOKEN_CACHE_SIZE
+        exp = token.payload.get("exp")
+        if not size or exp is None:
+            return
+
+        key = self._get_key(raw_token)
+        with self._lock:
+            self._tokens[key] = (token, datetime_from_epoch(exp))
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > size:
+                self._tokens.popitem(last=False)
+
+    def clear(self):
+        """Forget all the validated tokens."""
+        with self._lock:
+            self._tokens.clear()
+
+
+validated_token_cache = ValidatedTokenCache()
 
 
 class TokenPlaylist(TokenUser):
@@ -32,8 +96,22 @@ class JWTStatelessUserOrPlaylistAuthentication(JWTStatelessUserAuthentication):
     An authentication plugin that authenticates requests through a JSON web
     token provided in a request header without performing a database lookup
     to obtain a user instance.
+
+    Validated tokens are cached until they expire, players polling the API with the
+    same token are authenticated without verifying it again.
     """
 
+    def get_validated_token(self, raw_token):
+        """
+        Validates an encoded JSON web token and returns a validated token
+        wrapper object, from the cache when it was already validated.
+        """
+        validated_token = validated_token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            validated_token_cache.set(raw_token, validated_token)
+        return validated_token
+
     def get_user(self, validated_token):
         """
         Returns a stateless user object which is backed by the given validated
@@ -4,8 +4,11 @@ import re
 
 from django.conf import settings
 from django.utils import timezone
+from django.utils.encoding import filepath_to_uri
+from django.utils.functional import cached_property
 
 from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
 
 from marsha.core.defaults import (
     MARKDOWN_DOCUMENT_STORAGE_BASE_DIRECTORY,
@@ -16,6 +19,7 @@ from marsha.core.utils.time_utils import to_timestamp
 
 
 PROTECTED_NAME_REGEX = re.compile(r"^/?tmp/.*$")
+PUBLIC_URL_PLACEHOLDER = "public-url-placeholder"
 
 
 class S3FileStorage(S3Storage):
@@ -36,22 +40,49 @@ class S3FileStorage(S3Storage):
     custom_domain = settings.SCW_EDGE_SERVICE_DOMAIN
     url_protocol = "https:"
 
-    def url(self, name, parameters=None, expire=None, http_method=None):
+    @cached_property
+    def public_base_url(self):
         """
-        Override the url method to remove signature part of the url if the resource
-        is not protected.
+        Base of the urls of the public resources, computed once for the storage.
+
+        Public urls are not signed, they only depend on the domain serving the bucket.
+        Without a custom domain, the url boto generates for a placeholder key is used
+        once to know the endpoint and addressing style of the bucket.
         """
-        url = super().url(
-            name, parameters=parameters, expire=expire, http_method=http_method
-        )
+        if self.custom_domain:
+            return f"{self.url_protocol}//{self.custom_domain}/"
 
-        if not PROTECTED_NAME_REGEX.match(name):
-            # As explain in the _strip_signing_parameters docstring
-            # Boto3 does not currently support generating URLs that are unsigned.
-            # So if we want an unsign url we have to unsign it using this method.
-            return self._strip_signing_parameters(url)
+        placeholder = filepath_to_uri(self._normalize_name(PUBLIC_URL_PLACEHOLDER))
+        url = self._strip_signing_parameters(super().url(PUBLIC_URL_PLACEHOLDER))
+        return url[: -len(placeholder)]
 
-        return url
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        """
+        Override the url method to build the url of resources that are not protected
+        without signing it.
+        """
+        if (
+            PROTECTED_NAME_REGEX.match(name)
+            or parameters
+            or http_method
+            or self.cloudfront_signer
+        ):
+            url = super().url(
+                name, parameters=parameters, expire=expire, http_method=http_method
+            )
+
+            if not PROTECTED_NAME_REGEX.match(name):
+                # As explain in the _strip_signing_parameters docstring
+                # Boto3 does not currently support generating URLs that are unsigned.
+                # So if we want an unsign url we have to unsign it using this method.
+                return self._strip_signing_parameters(url)
+
+            return url
+
+        # Public resources are served as is, signing their url with boto
+        # only to strip the signature afterwards is costly.
+        name = self._normalize_name(clean_name(name))
+        return f"{self.public_base_url}{filepath_to_uri(name)}"
 
 
 # pylint: disable=unused-argument
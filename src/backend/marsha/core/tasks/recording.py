@@ -15,6 +15,10 @@ from marsha.core.defaults import (
 )
 from marsha.core.models.video import Video
 from marsha.core.storage.storage_class import file_storage
+from marsha.core.utils.transfer_utils import (
+    MultipartTransfer,
+    supports_multipart_transfer,
+)
 
 
 class RecordingSourceError(Exception):
@@ -62,7 +66,13 @@ def copy_video_recording(record_url: str, video_pk: str, stamp: str):
         ) as video_response:
             video_response.raise_for_status()
             source = video.get_storage_prefix(stamp, TMP_STORAGE_BASE_DIRECTORY)
-            file_storage.save(source, video_response.raw)
+            if supports_multipart_transfer(file_storage, video_response):
+                # Large recordings are transferred in concurrent parts that survive
+                # a restart of the task instead of in a single stream
+                video_response.close()
+                MultipartTransfer(file_storage, source, video_response).run()
+            else:
+                file_storage.save(source, video_response.raw)
 
         video.update_upload_state(PROCESSING, None)
 
@@ -1,5 +1,7 @@
 """Celery s3 tasks for the core app."""
 
+import logging
+
 from django.conf import settings
 
 from marsha.celery_app import app
@@ -7,7 +9,10 @@ from marsha.core.defaults import (
     DELETED_STORAGE_BASE_DIRECTORY,
     VOD_STORAGE_BASE_DIRECTORY,
 )
-from marsha.core.utils.s3_utils import move_s3_directory
+from marsha.core.utils.s3_utils import move_s3_directories
+
+
+logger = logging.getLogger(__name__)
 
 
 @app.task
@@ -20,19 +25,36 @@ def delete_s3_video(video_pk: str):
     Args:
         video_pk (str): The video to delete on S3.
     """
+    delete_s3_videos([video_pk])
+
+
+@app.task
+def delete_s3_videos(video_pks: list):
+    """Move many videos to the "to_delete" folder at once, see `delete_s3_video`.
+    The objects of all the videos are moved in shared batches.
+
+    Args:
+        video_pks (list): The videos to delete on S3.
+
+    Returns:
+        dict: The progress of the moves, by client type.
+    """
 
-    # Video on AWS_DESTINATION_BUCKET_NAME has {video_pk}/ as prefix
-    move_s3_directory(
-        video_pk,
-        DELETED_STORAGE_BASE_DIRECTORY,
-        "AWS",
-        settings.AWS_DESTINATION_BUCKET_NAME,
-    )
-
-    # Video on STORAGE_S3 has {VOD_STORAGE_BASE_DIRECTORY}/{video_pk}/ as prefix
-    move_s3_directory(
-        f"{VOD_STORAGE_BASE_DIRECTORY}/{video_pk}",
-        DELETED_STORAGE_BASE_DIRECTORY,
-        "STORAGE_S3",
-        settings.STORAGE_S3_BUCKET_NAME,
-    )
+    progress = {
+        # Video on AWS_DESTINATION_BUCKET_NAME has {video_pk}/ as prefix
+        "AWS": move_s3_directories(
+            video_pks,
+            DELETED_STORAGE_BASE_DIRECTORY,
+            "AWS",
+            settings.AWS_DESTINATION_BUCKET_NAME,
+        ),
+        # Video on STORAGE_S3 has {VOD_STORAGE_BASE_DIRECTORY}/{video_pk}/ as prefix
+        "STORAGE_S3": move_s3_directories(
+            [f"{VOD_STORAGE_BASE_DIRECTORY}/{video_pk}" for video_pk in video_pks],
+            DELETED_STORAGE_BASE_DIRECTORY,
+            "STORAGE_S3",
+            settings.STORAGE_S3_BUCKET_NAME,
+        ),
+    }
+    logger.info("Moved %d videos to the deleted folder: %s", len(video_pks), progress)
+    return progress
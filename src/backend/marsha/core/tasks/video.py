@@ -1,31 +1,41 @@
 """Celery videos tasks for the core app."""
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from django.conf import settings
 
+from django_peertube_runner_connector.models import Video as TranscodedVideo, VideoState
 from django_peertube_runner_connector.transcode import transcode_video
 from django_peertube_runner_connector.transcript import transcript_video
 from django_peertube_runner_connector.utils.ffprobe import (
     get_video_stream_dimensions_info,
 )
-import ffmpeg
 from sentry_sdk import capture_exception
 
 from marsha.celery_app import app
 from marsha.core.defaults import (
+    AWS_PIPELINE,
     ERROR,
     MAX_RESOLUTION_EXCEDEED,
+    PEERTUBE_PIPELINE,
     READY,
     TMP_STORAGE_BASE_DIRECTORY,
 )
 from marsha.core.models.video import Video
-from marsha.core.serializers import VideoSerializer
+from marsha.core.serializers import VideoBaseSerializer
 from marsha.core.storage.storage_class import file_storage
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
+from marsha.core.utils.probe_utils import get_format_information, probe, probe_many
+from marsha.core.utils.time_utils import to_timestamp
+from marsha.core.utils.transcode import get_transcoded_video_information
 
 
 logger = logging.getLogger(__name__)
 
+TRANSCODE_PIPELINE_RECOVERY_WORKERS = 10
+
 
 class MaxResolutionError(Exception):
     """Raised when the resolution of a video is higher than the maximum enabled resolution."""
@@ -43,9 +53,9 @@ def launch_video_transcoding(video_pk: str, stamp: str, domain: str):
     video = Video.objects.get(pk=video_pk)
     try:
         source = video.get_storage_prefix(stamp, TMP_STORAGE_BASE_DIRECTORY)
-        probe = ffmpeg.probe(file_storage.url(source))
+        video_probe = probe(file_storage.url(source))
         dimensions_info = get_video_stream_dimensions_info(
-            path=source, existing_probe=probe
+            path=source, existing_probe=video_probe
         )
         resolution = dimensions_info["resolution"]
         max_enabled_resolution = settings.VIDEO_RESOLUTIONS[-1]
@@ -55,8 +65,9 @@ def launch_video_transcoding(video_pk: str, stamp: str, domain: str):
                 f"{max_enabled_resolution}. video {video.id} will not be transcoded."
             )
 
-        video.duration = probe.get("format", {}).get("duration")
-        video.size = probe.get("format", {}).get("size")
+        information = get_format_information(video_probe)
+        video.duration = information["duration"]
+        video.size = information["size"]
         video.save()
 
         prefix_destination = video.get_storage_prefix(stamp)
@@ -105,18 +116,120 @@ def compute_video_information(video_pk: str):
     """
     Get probes from the video and update its size and duration
     """
+    compute_videos_information([video_pk])
+
+
+def _get_transcoded_videos_information(videos):
+    """Read the size and duration of videos from the results of the Peertube runners."""
+    videos_by_directory = {
+        video.get_storage_prefix(stamp=to_timestamp(video.uploaded_on)): video
+        for video in videos
+        if video.transcode_pipeline == PEERTUBE_PIPELINE
+    }
+    transcoded_videos = (
+        TranscodedVideo.objects.filter(
+            directory__in=videos_by_directory, state=VideoState.PUBLISHED
+        )
+        .select_related("streamingPlaylist")
+        .prefetch_related("streamingPlaylist__videoFiles")
+    )
+    return {
+        videos_by_directory[transcoded_video.directory].pk: (
+            get_transcoded_video_information(transcoded_video)
+        )
+        for transcoded_video in transcoded_videos
+    }
 
-    video = Video.objects.get(pk=video_pk)
 
-    if video.upload_state != READY:
+@app.task
+def compute_videos_information(video_pks: list):
+    """
+    Update the size and duration of ready videos.
+
+    Videos transcoded by Peertube runners read them from the runner results. The
+    highest resolution mp4 of the others is probed, concurrently and reading only
+    its headers. The videos are then updated in a single query.
+    """
+    videos = list(
+        Video.objects.filter(
+            pk__in=video_pks, upload_state=READY, uploaded_on__isnull=False
+        )
+    )
+    if not videos:
         return
 
-    serializer = VideoSerializer(video)
-    video_urls = serializer.data.get("urls").get("mp4")
-    video_url = video_urls.get(max(video_urls.keys()))
+    information = _get_transcoded_videos_information(videos)
+
+    video_urls = {}
+    for video in videos:
+        if video.pk in information:
+            continue
+        mp4_urls = VideoBaseSerializer().get_vod_urls(video)["mp4"]
+        if mp4_urls:
+            video_urls[video.pk] = mp4_urls[max(mp4_urls)]
+
+    probes = probe_many(video_urls.values())
+    for video_pk, video_url in video_urls.items():
+        if probes[video_url]:
+            information[video_pk] = get_format_information(probes[video_url])
+
+    updated_videos = []
+    for video in videos:
+        if video.pk in information:
+            video.duration = information[video.pk]["duration"]
+            video.size = information[video.pk]["size"]
+            updated_videos.append(video)
+    Video.objects.bulk_update(updated_videos, ["duration", "size"])
 
-    probe = ffmpeg.probe(video_url)
 
-    video.duration = probe.get("format", {}).get("duration")
-    video.size = probe.get("format", {}).get("size")
-    video.save(update_fields=["duration", "size"])
+def _get_recovered_transcode_pipeline(video):
+    """Find the pipeline a video was transcoded with from the files in the storage."""
+    stamp = to_timestamp(video.uploaded_on)
+    if file_storage.exists(f"scw/{video.pk}/video/{stamp}/thumbnail.jpg"):
+        return PEERTUBE_PIPELINE
+    # Fallback to AWS_PIPELINE
+    return AWS_PIPELINE
+
+
+@app.task
+def recover_transcode_pipelines(video_pks: list):
+    """
+    Recover the transcode pipeline of videos uploaded before it was recorded.
+
+    The storage is checked concurrently for all the videos, which are then
+    updated in a single query.
+    """
+    videos = list(
+        Video.objects.filter(
+            pk__in=video_pks,
+            transcode_pipeline__isnull=True,
+            uploaded_on__isnull=False,
+        )
+    )
+    if not videos:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=TRANSCODE_PIPELINE_RECOVERY_WORKERS
+    ) as executor:
+        pipelines = list(executor.map(_get_recovered_transcode_pipeline, videos))
+
+    for video, pipeline in zip(videos, pipelines):
+        video.transcode_pipeline = pipeline
+    Video.objects.bulk_update(videos, ["transcode_pipeline"])
+
+    # Videos without pipeline are served as AWS ones,
+    # only the urls of the recovered peertube ones change.
+    playlist_ids = set()
+    for video in videos:
+        logger.info(
+            "VOD %s had no transcode_pipeline and was recovered to %s",
+            video.pk,
+            video.transcode_pipeline,
+        )
+        if video.transcode_pipeline == PEERTUBE_PIPELINE:
+            invalidate_app_data_cache(video.id, video.playlist_id)
+            playlist_ids.add(video.playlist_id)
+
+    for playlist_id in playlist_ids:
+        invalidate_lti_select_cache(playlist_id)
@@ -0,0 +1,208 @@
+"""Test the precomputed portability reachability used by LTI launches."""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from marsha.core import factories, lti as lti_module, models
+from marsha.core.lti import LTI
+from marsha.core.lti.utils import (
+    REACHABLE_CONSUMER_SITES_CACHE_KEY,
+    REACHABLE_PLAYLISTS_CACHE_KEY,
+    PortabilityError,
+    get_or_create_resource,
+    get_reachable_consumer_site_ids,
+    get_reachable_playlist_ids,
+    is_playlist_reachable,
+)
+
+
+# We don't enforce arguments documentation in tests
+# pylint: disable=unused-argument
+
+
+class PortabilityReachabilityTestCase(TestCase):
+    """Test the reachability of playlists from an LTI request."""
+
+    def setUp(self):
+        """Build the playlist and consumer site targeted by the LTI request."""
+        super().setUp()
+        self.consumer_site = factories.ConsumerSiteFactory()
+        self.playlist = factories.PlaylistFactory(consumer_site=self.consumer_site)
+        self.lti = mock.Mock(context_id=self.playlist.lti_id)
+        self.lti.get_consumer_site.return_value = self.consumer_site
+
+    def _playlist_cache_key(self):
+        return REACHABLE_PLAYLISTS_CACHE_KEY.format(
+            consumer_site_id=self.consumer_site.id, context_id=self.playlist.lti_id
+        )
+
+    def _consumer_site_cache_key(self):
+        return REACHABLE_CONSUMER_SITES_CACHE_KEY.format(
+            consumer_site_id=self.consumer_site.id
+        )
+
+    def test_is_playlist_reachable_same_playlist(self):
+        """The playlist targeted by the LTI request is reachable."""
+        with self.assertNumQueries(0):
+            self.assertTrue(is_playlist_reachable(self.playlist, self.lti))
+
+    def test_is_playlist_reachable_portable_to_playlist(self):
+        """A playlist of the same site portable to all its playlists is reachable."""
+        playlist = factories.PlaylistFactory(
+            consumer_site=self.consumer_site, is_portable_to_playlist=True
+        )
+        with self.assertNumQueries(0):
+            self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+    def test_is_playlist_reachable_portable_to_consumer_site(self):
+        """A playlist portable to all consumer sites is reachable."""
+        playlist = factories.PlaylistFactory(
+            is_portable_to_playlist=False, is_portable_to_consumer_site=True
+        )
+        with self.assertNumQueries(0):
+            self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+    def test_is_playlist_reachable_portable_to_targeted_playlist(self):
+        """A playlist explicitly portable to the targeted playlist is reachable."""
+        playlist = factories.PlaylistFactory(
+            is_portable_to_playlist=False, is_portable_to_consumer_site=False
+        )
+        playlist.portable_to.add(self.playlist)
+
+        self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+        # The portabilities are now cached
+        with self.assertNumQueries(0):
+            self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+    def test_is_playlist_reachable_consumer_site_portable(self):
+        """A playlist of a consumer site portable to the requesting one is reachable."""
+        playlist = factories.PlaylistFactory(
+            is_portable_to_playlist=False, is_portable_to_consumer_site=False
+        )
+        playlist.consumer_site.portable_to.add(self.consumer_site)
+
+        self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+        # The portabilities are now cached
+        with self.assertNumQueries(0):
+            self.assertTrue(is_playlist_reachable(playlist, self.lti))
+
+    def test_is_playlist_reachable_not_portable(self):
+        """A playlist matching no portability rule is not reachable."""
+        playlist = factories.PlaylistFactory(
+            is_portable_to_playlist=False, is_portable_to_consumer_site=False
+        )
+        self.assertFalse(is_playlist_reachable(playlist, self.lti))
+
+    @mock.patch.object(lti_module, "verify_request_common", return_value=True)
+    def test_get_or_create_resource_not_portable(self, mock_verify):
+        """An instructor launching a resource that is not reachable gets a PortabilityError."""
+        passport = factories.ConsumerSiteLTIPassportFactory(
+            consumer_site__domain="example.com"
+        )
+        video = factories.VideoFactory(
+            playlist__is_portable_to_playlist=False,
+            playlist__is_portable_to_consumer_site=False,
+        )
+        data = {
+            "resource_link_id": video.lti_id,
+            "context_id": "other_context_id",
+            "roles": "Instructor",
+            "tool_consumer_instance_guid": "example.com",
+            "oauth_consumer_key": passport.oauth_consumer_key,
+        }
+        request = RequestFactory().post(
+            "/", data, HTTP_REFERER="https://example.com/route"
+        )
+        lti = LTI(request, video.pk)
+        lti.verify()
+
+        with self.assertRaises(PortabilityError):
+            get_or_create_resource(models.Video, lti)
+
+    def test_reachable_playlists_cache_portable_to_add_remove(self):
+        """Adding or removing a playlist portability drops the cached playlists."""
+        playlist = factories.PlaylistFactory()
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            set(),
+        )
+        self.assertEqual(cache.get(self._playlist_cache_key()), set())
+
+        playlist.portable_to.add(self.playlist)
+        self.assertIsNone(cache.get(self._playlist_cache_key()))
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            {playlist.id},
+        )
+
+        playlist.portable_to.remove(self.playlist)
+        self.assertIsNone(cache.get(self._playlist_cache_key()))
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            set(),
+        )
+
+    def test_reachable_playlists_cache_portable_to_clear(self):
+        """Clearing the portabilities of a playlist drops the cached playlists."""
+        playlist = factories.PlaylistFactory()
+        playlist.portable_to.add(self.playlist)
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            {playlist.id},
+        )
+
+        playlist.portable_to.clear()
+        self.assertIsNone(cache.get(self._playlist_cache_key()))
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            set(),
+        )
+
+    def test_reachable_playlists_cache_reachable_from_add(self):
+        """Adding a portability from the target playlist side drops the cached playlists."""
+        playlist = factories.PlaylistFactory()
+        get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id)
+
+        self.playlist.reachable_from.add(playlist)
+        self.assertIsNone(cache.get(self._playlist_cache_key()))
+        self.assertEqual(
+            get_reachable_playlist_ids(self.consumer_site.id, self.playlist.lti_id),
+            {playlist.id},
+        )
+
+    def test_reachable_consumer_sites_cache_portability_save_delete(self):
+        """Saving or deleting a consumer site portability drops the cached sites."""
+        consumer_site = factories.ConsumerSiteFactory()
+        self.assertEqual(get_reachable_consumer_site_ids(self.consumer_site.id), set())
+        self.assertEqual(cache.get(self._consumer_site_cache_key()), set())
+
+        portability = models.ConsumerSitePortability.objects.create(
+            source_site=consumer_site, target_site=self.consumer_site
+        )
+        self.assertIsNone(cache.get(self._consumer_site_cache_key()))
+        self.assertEqual(
+            get_reachable_consumer_site_ids(self.consumer_site.id), {consumer_site.id}
+        )
+
+        portability.delete()
+        self.assertIsNone(cache.get(self._consumer_site_cache_key()))
+        self.assertEqual(get_reachable_consumer_site_ids(self.consumer_site.id), set())
+
+    def test_reachable_consumer_sites_cache_portable_to_add_clear(self):
+        """Changing `ConsumerSite.portable_to` drops the cached sites."""
+        consumer_site = factories.ConsumerSiteFactory()
+        get_reachable_consumer_site_ids(self.consumer_site.id)
+
+        consumer_site.portable_to.add(self.consumer_site)
+        self.assertIsNone(cache.get(self._consumer_site_cache_key()))
+        self.assertEqual(
+            get_reachable_consumer_site_ids(self.consumer_site.id), {consumer_site.id}
+        )
+
+        consumer_site.portable_to.clear()
+        self.assertIsNone(cache.get(self._consumer_site_cache_key()))
+        self.assertEqual(get_reachable_consumer_site_ids(self.consumer_site.id), set())
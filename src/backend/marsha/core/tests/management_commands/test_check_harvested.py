@@ -129,3 +129,68 @@ class CheckWaitingLiveToVodTest(TestCase):
 
         self.assertEqual("", out.getvalue())
         out.close()
+
+    def test_check_harvested_many_videos_to_process(self):
+        """Command should delete the objects of all the expired videos at once."""
+        now = timezone.now()
+        videos = VideoFactory.create_batch(
+            2,
+            live_state=HARVESTED,
+            live_type=JITSI,
+            upload_state=PENDING,
+            starting_at=now,
+        )
+        s3_client = mock.Mock()
+        s3_client.list_objects_v2.side_effect = lambda Bucket, Prefix: {
+            "Contents": [{"Key": f"{Prefix}/object_key_1"}],
+            "IsTruncated": False,
+        }
+        s3_client.delete_objects.return_value = {}
+
+        out = StringIO()
+        with mock.patch.object(check_harvested, "s3_client", s3_client), mock.patch(
+            "marsha.core.management.commands.check_harvested.generate_expired_date",
+            return_value=now + timedelta(days=1),
+        ), self.assertNumQueries(2):
+            call_command("check_harvested", stdout=out)
+
+        s3_client.delete_objects.assert_called_once()
+        self.assertCountEqual(
+            s3_client.delete_objects.call_args.kwargs["Delete"]["Objects"],
+            [{"Key": f"{video.pk}/object_key_1"} for video in videos],
+        )
+        for video in videos:
+            video.refresh_from_db()
+            self.assertEqual(video.upload_state, DELETED)
+        self.assertIn("Deleted 2/2 objects of 2 videos", out.getvalue())
+        out.close()
+
+    def test_check_harvested_video_objects_not_deleted(self):
+        """Command should keep the videos whose objects could not all be deleted."""
+        now = timezone.now()
+        video = VideoFactory(
+            live_state=HARVESTED,
+            live_type=JITSI,
+            upload_state=PENDING,
+            starting_at=now,
+        )
+        s3_client = mock.Mock()
+        s3_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": f"{video.pk}/object_key_1"}],
+            "IsTruncated": False,
+        }
+        s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": f"{video.pk}/object_key_1", "Message": "Error"}]
+        }
+
+        err = StringIO()
+        with mock.patch.object(check_harvested, "s3_client", s3_client), mock.patch(
+            "marsha.core.management.commands.check_harvested.generate_expired_date",
+            return_value=now + timedelta(days=1),
+        ):
+            call_command("check_harvested", stdout=StringIO(), stderr=err)
+
+        video.refresh_from_db()
+        self.assertEqual(video.upload_state, PENDING)
+        self.assertIn("1 objects could not be deleted", err.getvalue())
+        err.close()
@@ -1,8 +1,11 @@
 """Tests for clean_mediapackages command."""
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+
 from io import StringIO
 from unittest import mock
 
+from django.core.cache import cache
 from django.core.management import call_command
 from django.test import TestCase
 
@@ -48,7 +51,7 @@ class CleanMediapackagesTest(TestCase):
         self.assertNotIn("Mediapackage channel MP2 deleted", out.getvalue())
         out.close()
 
-    @mock.patch.object(clean_mediapackages, "list_mediapackage_channel_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
     @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
     @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
     def test_clean_mediapackages_harvest_job_pending(
@@ -61,7 +64,7 @@ class CleanMediapackagesTest(TestCase):
         out = StringIO()
         mock_mediapackage_channels.return_value = [{"Id": "MP1"}]
         mock_medialive_indexed_channels.return_value = {}
-        mock_harvest_jobs.return_value = [{"Status": "PENDING"}]
+        mock_harvest_jobs.return_value = {"MP1": [{"Status": "PENDING"}]}
 
         call_command("clean_mediapackages", stdout=out)
 
@@ -69,8 +72,11 @@ class CleanMediapackagesTest(TestCase):
         self.assertNotIn("Mediapackage channel MP1 deleted", out.getvalue())
         out.close()
 
+    @mock.patch.object(
+        clean_mediapackages, "list_indexed_mediapackage_origin_endpoints"
+    )
     @mock.patch.object(clean_mediapackages, "delete_mediapackage_channel")
-    @mock.patch.object(clean_mediapackages, "list_mediapackage_channel_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
     @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
     @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
     def test_clean_mediapackages_harvest_job_failed(
@@ -79,12 +85,14 @@ class CleanMediapackagesTest(TestCase):
         mock_mediapackage_channels,
         mock_harvest_jobs,
         mock_delete_mediapackage,
+        mock_origin_endpoints,
     ):
         """Command should delete channel when only a failed harvest job exists."""
         out = StringIO()
         mock_mediapackage_channels.return_value = [{"Id": "MP1"}]
         mock_medialive_indexed_channels.return_value = {}
-        mock_harvest_jobs.return_value = [{"Status": "FAILED"}]
+        mock_harvest_jobs.return_value = {"MP1": [{"Status": "FAILED"}]}
+        mock_origin_endpoints.return_value = {"MP1": [{"Id": "EP1"}, {"Id": "EP2"}]}
         mock_delete_mediapackage.return_value = ["EP1", "EP2"]
 
         call_command("clean_mediapackages", stdout=out)
@@ -93,9 +101,12 @@ class CleanMediapackagesTest(TestCase):
         self.assertIn("Mediapackage channel endpoint EP1 deleted", out.getvalue())
         self.assertIn("Mediapackage channel endpoint EP2 deleted", out.getvalue())
         self.assertIn("Mediapackage channel MP1 deleted", out.getvalue())
+        mock_delete_mediapackage.assert_called_once_with(
+            "MP1", [{"Id": "EP1"}, {"Id": "EP2"}]
+        )
         out.close()
 
-    @mock.patch.object(clean_mediapackages, "list_mediapackage_channel_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
     @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
     @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
     def test_clean_mediapackages_harvest_jobs_failed_and_pending(
@@ -108,10 +119,12 @@ class CleanMediapackagesTest(TestCase):
         out = StringIO()
         mock_mediapackage_channels.return_value = [{"Id": "MP1"}]
         mock_medialive_indexed_channels.return_value = {}
-        mock_harvest_jobs.return_value = [
-            {"Status": "FAILED"},
-            {"Status": "PENDING"},
-        ]
+        mock_harvest_jobs.return_value = {
+            "MP1": [
+                {"Status": "FAILED"},
+                {"Status": "PENDING"},
+            ]
+        }
 
         call_command("clean_mediapackages", stdout=out)
 
@@ -119,7 +132,7 @@ class CleanMediapackagesTest(TestCase):
         self.assertNotIn("Mediapackage channel MP1 deleted", out.getvalue())
         out.close()
 
-    @mock.patch.object(clean_mediapackages, "list_mediapackage_channel_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
     @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
     @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
     def test_clean_mediapackages_harvest_jobs_pending_and_failed(
@@ -132,10 +145,12 @@ class CleanMediapackagesTest(TestCase):
         out = StringIO()
         mock_mediapackage_channels.return_value = [{"Id": "MP1"}]
         mock_medialive_indexed_channels.return_value = {}
-        mock_harvest_jobs.return_value = [
-            {"Status": "PENDING"},
-            {"Status": "FAILED"},
-        ]
+        mock_harvest_jobs.return_value = {
+            "MP1": [
+                {"Status": "PENDING"},
+                {"Status": "FAILED"},
+            ]
+        }
 
         call_command("clean_mediapackages", stdout=out)
 
@@ -143,8 +158,11 @@ class CleanMediapackagesTest(TestCase):
         self.assertNotIn("Mediapackage channel MP1 deleted", out.getvalue())
         out.close()
 
+    @mock.patch.object(
+        clean_mediapackages, "list_indexed_mediapackage_origin_endpoints"
+    )
     @mock.patch.object(clean_mediapackages, "delete_mediapackage_channel")
-    @mock.patch.object(clean_mediapackages, "list_mediapackage_channel_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
     @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
     @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
     def test_clean_mediapackages_no_harvest_job(
@@ -153,12 +171,14 @@ class CleanMediapackagesTest(TestCase):
         mock_medialive_indexed_channels,
         mock_harvest_jobs,
         mock_delete_mediapackage,
+        mock_origin_endpoints,
     ):
         """Command should delete channel when no harvest job exists."""
         out = StringIO()
         mock_mediapackage_channels.return_value = [{"Id": "MP1"}]
         mock_medialive_indexed_channels.return_value = {}
-        mock_harvest_jobs.return_value = []
+        mock_harvest_jobs.return_value = {}
+        mock_origin_endpoints.return_value = {"MP1": [{"Id": "EP1"}, {"Id": "EP2"}]}
         mock_delete_mediapackage.return_value = ["EP1", "EP2"]
 
         call_command("clean_mediapackages", stdout=out)
@@ -167,4 +187,58 @@ class CleanMediapackagesTest(TestCase):
         self.assertIn("Mediapackage channel endpoint EP1 deleted", out.getvalue())
         self.assertIn("Mediapackage channel endpoint EP2 deleted", out.getvalue())
         self.assertIn("Mediapackage channel MP1 deleted", out.getvalue())
+        mock_delete_mediapackage.assert_called_once_with(
+            "MP1", [{"Id": "EP1"}, {"Id": "EP2"}]
+        )
+        out.close()
+
+    @mock.patch.object(
+        clean_mediapackages, "list_indexed_mediapackage_origin_endpoints"
+    )
+    @mock.patch.object(clean_mediapackages, "delete_mediapackage_channel")
+    @mock.patch.object(clean_mediapackages, "list_indexed_mediapackage_harvest_jobs")
+    @mock.patch.object(clean_mediapackages, "list_indexed_medialive_channels")
+    @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
+    def test_clean_mediapackages_many_channels(
+        self,
+        mock_mediapackage_channels,
+        mock_medialive_indexed_channels,
+        mock_harvest_jobs,
+        mock_delete_mediapackage,
+        mock_origin_endpoints,
+    ):
+        """AWS resources are listed once whatever the number of channels."""
+        out = StringIO()
+        mock_mediapackage_channels.return_value = [{"Id": f"MP{i}"} for i in range(20)]
+        mock_medialive_indexed_channels.return_value = {"MP0": {"Name": "MP0"}}
+        mock_harvest_jobs.return_value = {"MP1": [{"Status": "PENDING"}]}
+        mock_origin_endpoints.return_value = {"MP2": [{"Id": "EP2"}]}
+        mock_delete_mediapackage.side_effect = lambda channel_id, endpoints: [
+            endpoint["Id"] for endpoint in endpoints
+        ]
+
+        call_command("clean_mediapackages", stdout=out)
+
+        mock_harvest_jobs.assert_called_once_with()
+        mock_origin_endpoints.assert_called_once_with()
+        self.assertEqual(mock_delete_mediapackage.call_count, 18)
+        mock_delete_mediapackage.assert_any_call("MP2", [{"Id": "EP2"}])
+        mock_delete_mediapackage.assert_any_call("MP3", [])
+        self.assertIn("Mediapackage channel endpoint EP2 deleted", out.getvalue())
+        self.assertNotIn("Mediapackage channel MP0 deleted", out.getvalue())
+        self.assertNotIn("Mediapackage channel MP1 deleted", out.getvalue())
+        self.assertIn("Mediapackage channel MP19 deleted", out.getvalue())
+        out.close()
+
+    @mock.patch.object(clean_mediapackages, "list_mediapackage_channels")
+    def test_clean_mediapackages_already_running(self, mock_mediapackage_channels):
+        """Command should do nothing while another run is in progress."""
+        out = StringIO()
+        cache.set("aws_elemental_command:clean_mediapackages", "1")
+        self.addCleanup(cache.delete, "aws_elemental_command:clean_mediapackages")
+
+        call_command("clean_mediapackages", stdout=out)
+
+        self.assertEqual("Command already running\n", out.getvalue())
+        mock_mediapackage_channels.assert_not_called()
         out.close()
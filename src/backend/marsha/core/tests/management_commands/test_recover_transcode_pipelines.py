@@ -0,0 +1,49 @@
+"""Test recover_transcode_pipelines management command."""
+
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from marsha.core.defaults import AWS_PIPELINE
+from marsha.core.factories import VideoFactory
+from marsha.core.management.commands.recover_transcode_pipelines import (
+    recover_transcode_pipelines,
+)
+
+
+class RecoverTranscodePipelinesTestCase(TestCase):
+    """Test recover_transcode_pipelines management command."""
+
+    def test_recover_transcode_pipelines(self):
+        """The videos uploaded without pipeline are recovered in batches."""
+        videos = VideoFactory.create_batch(
+            5, transcode_pipeline=None, uploaded_on="2020-07-22T10:18:45.000000Z"
+        )
+        VideoFactory(transcode_pipeline=None, uploaded_on=None)
+        VideoFactory(
+            transcode_pipeline=AWS_PIPELINE, uploaded_on="2020-07-22T10:18:45.000000Z"
+        )
+        out = StringIO()
+
+        with mock.patch.object(
+            recover_transcode_pipelines, "delay"
+        ) as mock_recover_transcode_pipelines:
+            call_command("recover_transcode_pipelines", batch_size=2, stdout=out)
+
+        self.assertEqual(mock_recover_transcode_pipelines.call_count, 3)
+        self.assertCountEqual(
+            [
+                video_pk
+                for call in mock_recover_transcode_pipelines.call_args_list
+                for video_pk in call.args[0]
+            ],
+            [str(video.pk) for video in videos],
+        )
+        self.assertEqual(
+            out.getvalue(),
+            "2 videos will have their transcode pipeline recovered\n"
+            "2 videos will have their transcode pipeline recovered\n"
+            "1 videos will have their transcode pipeline recovered\n",
+        )
@@ -6,103 +6,112 @@ from unittest import mock
 from django.core.management import call_command
 from django.test import TestCase
 
-from botocore.stub import Stubber
-
 from marsha import settings
 from marsha.core.defaults import AWS_S3, PENDING, READY, SCW_S3
 from marsha.core.factories import DocumentFactory
 from marsha.core.management.commands import rename_documents
-from marsha.core.models.file import Document
+from marsha.core.tests.testing_utils import get_s3_client_mock
 from marsha.core.utils import time_utils
 
 
-# pylint: disable=too-many-locals
-
-
 class RenameDocumentsTestCase(TestCase):
     """
     Test the ``rename_documents`` command.
     """
 
-    @mock.patch("marsha.core.storage.storage_class.file_storage.exists")
-    def test_rename_documents(self, mock_exists):
+    def test_rename_documents(self):
         """Command should rename document S3 objects to their filename."""
 
-        mock_exists.return_value = False
-
         now = datetime(2018, 8, 8, tzinfo=timezone.utc)
 
-        with Stubber(rename_documents.s3_client) as s3_client_stubber:
-            # Generate some documents
-            # (<original title>, <expected and cleaned filename>)
-            filenames = [
-                ("normal_filename", "normal_filename.pdf"),
-                ("weird\\file name", "weird_file_name.pdf"),
-                (".hidden_file", "hidden_file.pdf"),
-            ]
-
-            documents = []
-            for filename_src, _ in filenames:
-                document = DocumentFactory(
-                    title=filename_src,
-                    extension="pdf",
-                    uploaded_on=now,
-                    upload_state=READY,
-                    storage_location=AWS_S3,
+        # Generate some documents
+        # (<original title>, <expected and cleaned filename>)
+        filenames = [
+            ("normal_filename", "normal_filename.pdf"),
+            ("weird\\file name", "weird_file_name.pdf"),
+            (".hidden_file", "hidden_file.pdf"),
+        ]
+
+        documents = []
+        objects = {}
+        expected_copies = []
+        for filename_src, filename_dest in filenames:
+            document = DocumentFactory(
+                title=filename_src,
+                extension="pdf",
+                uploaded_on=now,
+                upload_state=READY,
+                storage_location=AWS_S3,
+            )
+            documents.append(document)
+            stamp = time_utils.to_timestamp(document.uploaded_on)
+            file_key_src = f"aws/{document.id}/document/{stamp}.pdf"
+            objects[file_key_src] = 10
+            expected_copies.append(
+                mock.call(
+                    Bucket=settings.STORAGE_S3_BUCKET_NAME,
+                    CopySource={
+                        "Bucket": settings.STORAGE_S3_BUCKET_NAME,
+                        "Key": file_key_src,
+                    },
+                    Key=f"aws/{document.id}/document/{filename_dest}",
                 )
-                documents.append(document)
+            )
 
-            # Create mocks for copy_objects with Stubber
-            # Note: Stubber requires that its mocks are called in the exact order they
-            # were created, so we must iterate over objects.all() in the same sequence
-            for document in Document.objects.all():
-                stamp = time_utils.to_timestamp(document.uploaded_on)
-                extension = "." + document.extension if document.extension else ""
+        # Create some documents that should not be concerned
+        DocumentFactory(
+            upload_state=READY,
+            storage_location=SCW_S3,
+        )
+        DocumentFactory(
+            upload_state=PENDING,
+            storage_location=AWS_S3,
+        )
 
-                file_key_src = f"aws/{document.id}/document/{stamp}{extension}"
+        s3_client = get_s3_client_mock(objects)
+        with mock.patch.object(rename_documents, "s3_client", s3_client):
+            call_command("rename_documents")
 
-                filename = document.title + extension
-                sanitized_filename = rename_documents.Command().validate_filename(
-                    filename
-                )
-                file_key_dest = f"aws/{document.id}/document/{sanitized_filename}"
+        # Each document folder is listed once and each object copied once
+        self.assertEqual(s3_client.get_paginator.return_value.paginate.call_count, 3)
+        self.assertCountEqual(s3_client.copy_object.call_args_list, expected_copies)
 
-                expected_params = {
-                    "Bucket": settings.STORAGE_S3_BUCKET_NAME,
-                    "CopySource": {
-                        "Bucket": settings.STORAGE_S3_BUCKET_NAME,
-                        "Key": file_key_src,
-                    },
-                    "Key": file_key_dest,
-                }
-                s3_client_stubber.add_response("copy_object", {}, expected_params)
+        # Check that each document.filename has been updated with the clean
+        # S3-compatible filename
+        for document, (_, expected_filename) in zip(documents, filenames):
+            document.refresh_from_db()
+            assert document.filename == expected_filename
 
-            # Create some documents that should not be concerned
-            DocumentFactory(
-                upload_state=READY,
-                storage_location=SCW_S3,
-            )
-            DocumentFactory(
-                upload_state=PENDING,
-                storage_location=AWS_S3,
-            )
+    def test_rename_documents_destination_exists(self):
+        """Command should not copy a document already renamed."""
 
-            call_command("rename_documents")
+        now = datetime(2018, 8, 8, tzinfo=timezone.utc)
+
+        document = DocumentFactory(
+            title="filename",
+            extension="pdf",
+            uploaded_on=now,
+            upload_state=READY,
+            storage_location=AWS_S3,
+        )
+        stamp = time_utils.to_timestamp(now)
 
-            s3_client_stubber.assert_no_pending_responses()
+        s3_client = get_s3_client_mock(
+            {
+                f"aws/{document.id}/document/{stamp}.pdf": 10,
+                f"aws/{document.id}/document/filename.pdf": 10,
+            }
+        )
+        with mock.patch.object(rename_documents, "s3_client", s3_client):
+            call_command("rename_documents")
 
-            # Check that each document.filename has been updated with the clean
-            # S3-compatible filename
-            for document, (_, expected_filename) in zip(documents, filenames):
-                document.refresh_from_db()
-                assert document.filename == expected_filename
+        s3_client.copy_object.assert_not_called()
+        document.refresh_from_db()
+        self.assertEqual(document.filename, "filename.pdf")
 
-    @mock.patch("marsha.core.storage.storage_class.file_storage.exists")
-    def test_rename_documents_file_exists(self, mock_exists):
+    def test_rename_documents_file_exists(self):
         """Command should not copy document if file already exists."""
 
-        mock_exists.return_value = True
-
         now = datetime(2018, 8, 8, tzinfo=timezone.utc)
 
         DocumentFactory(
@@ -110,6 +119,8 @@ class RenameDocumentsTestCase(TestCase):
             uploaded_on=now,
         )
 
-        with Stubber(rename_documents.s3_client) as s3_client_stubber:
+        s3_client = get_s3_client_mock({})
+        with mock.patch.object(rename_documents, "s3_client", s3_client):
             call_command("rename_documents")
-            s3_client_stubber.assert_no_pending_responses()
+
+        s3_client.copy_object.assert_not_called()
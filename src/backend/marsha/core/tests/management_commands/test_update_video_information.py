@@ -9,7 +9,7 @@ from django.test import TestCase
 from marsha.core import defaults
 from marsha.core.factories import VideoFactory
 from marsha.core.management.commands.update_video_information import (
-    compute_video_information,
+    compute_videos_information,
 )
 
 
@@ -33,10 +33,18 @@ class UpdateVideoInformationTestCase(TestCase):
         )
         out = StringIO()
         with mock.patch.object(
-            compute_video_information, "delay"
-        ) as mock_compute_video_information:
-            call_command("update_video_information", stdout=out)
-            self.assertEqual(mock_compute_video_information.call_count, 3)
+            compute_videos_information, "delay"
+        ) as mock_compute_videos_information:
+            call_command("update_video_information", stdout=out, batch_size=2)
+            self.assertEqual(mock_compute_videos_information.call_count, 2)
+
+        batches = [
+            call.args[0] for call in mock_compute_videos_information.call_args_list
+        ]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(
+            sorted(sum(batches, [])), sorted(str(video.id) for video in videos)
+        )
 
         for video in videos:
             self.assertIn(
@@ -58,7 +66,8 @@ class UpdateVideoInformationTestCase(TestCase):
         )
         out = StringIO()
         with mock.patch.object(
-            compute_video_information, "delay"
-        ) as mock_compute_video_information:
+            compute_videos_information, "delay"
+        ) as mock_compute_videos_information:
             call_command("update_video_information", stdout=out, limit=5)
-            self.assertEqual(mock_compute_video_information.call_count, 5)
+            mock_compute_videos_information.assert_called_once()
+            self.assertEqual(len(mock_compute_videos_information.call_args.args[0]), 5)
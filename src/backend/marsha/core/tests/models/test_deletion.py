@@ -2,13 +2,15 @@
 
 import random
 from typing import Type
+from unittest import mock
 import uuid
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
 from django.db.models.deletion import ProtectedError
 from django.db.utils import IntegrityError
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from factory.django import DjangoModelFactory
 from safedelete.models import HARD_DELETE, SOFT_DELETE_CASCADE
@@ -28,7 +30,13 @@ from marsha.core.factories import (
     UserFactory,
     VideoFactory,
 )
-from marsha.core.models import TimedTextTrack
+from marsha.core.models import (
+    PlaylistAccess,
+    TimedTextTrack,
+    User,
+    Video,
+    base as base_models,
+)
 
 
 # We don't enforce arguments documentation in tests
@@ -492,3 +500,85 @@ class DeletionTestCase(TestCase):
             ),
             user=user,
         )
+
+    def test_soft_deletion_cascade_in_bulk(self):
+        """Related objects are soft deleted in bulk, flagged as deleted by cascade."""
+        user = UserFactory()
+        organization = OrganizationFactory()
+        playlists = PlaylistFactory.create_batch(
+            3, created_by=UserFactory(), organization=organization
+        )
+        playlist_accesses = [
+            PlaylistAccessFactory(user=user, playlist=playlist)
+            for playlist in playlists
+        ]
+        videos = VideoFactory.create_batch(3, created_by=user)
+        deleted_video = VideoFactory(created_by=user)
+        deleted_video.delete()
+
+        receiver = mock.Mock()
+        base_models.post_cascade_softdelete.connect(receiver)
+        self.addCleanup(base_models.post_cascade_softdelete.disconnect, receiver)
+
+        with mock.patch.object(base_models, "SOFT_DELETE_CASCADE_BATCH_SIZE", 2):
+            self.assertEqual(
+                user.delete(),
+                (7, {"core.User": 1, "core.PlaylistAccess": 3, "core.Video": 3}),
+            )
+
+        self.assertIsSoftDeleted(user)
+        user.refresh_from_db()
+        self.assertFalse(user.deleted_by_cascade)
+        deleted = set()
+        for obj in [*playlist_accesses, *videos]:
+            obj.refresh_from_db()
+            deleted.add(obj.deleted)
+            self.assertTrue(obj.deleted_by_cascade)
+        # All of them are soft deleted at once
+        self.assertEqual(len(deleted), 1)
+        self.assertLessEqual(deleted.pop(), user.deleted)
+        for playlist in playlists:
+            self.assertIsVisible(playlist)
+
+        # The video deleted beforehand is left untouched
+        previously_deleted = deleted_video.deleted
+        deleted_video.refresh_from_db()
+        self.assertEqual(deleted_video.deleted, previously_deleted)
+        self.assertFalse(deleted_video.deleted_by_cascade)
+
+        # One signal is sent per model and batch of primary keys
+        sent = {}
+        for call in receiver.call_args_list:
+            self.assertLessEqual(len(call.kwargs["pks"]), 2)
+            sent.setdefault(call.kwargs["sender"], set()).update(call.kwargs["pks"])
+        self.assertEqual(len(receiver.call_args_list), 4)
+        self.assertEqual(
+            sent,
+            {
+                PlaylistAccess: {access.pk for access in playlist_accesses},
+                Video: {video.pk for video in videos},
+            },
+        )
+
+        # Undeleting the user restores what was deleted by cascade only
+        User.all_objects.get(pk=user.pk).undelete()
+        for obj in [*playlist_accesses, *videos]:
+            self.assertIsVisible(obj)
+        self.assertIsSoftDeleted(deleted_video)
+
+    def test_soft_deletion_cascade_queries(self):
+        """The number of queries does not depend on the number of related objects."""
+
+        def delete_user(count):
+            user = UserFactory()
+            for playlist in PlaylistFactory.create_batch(
+                count, created_by=UserFactory(), organization=OrganizationFactory()
+            ):
+                PlaylistAccessFactory(user=user, playlist=playlist)
+            VideoFactory.create_batch(count, created_by=user)
+
+            with CaptureQueriesContext(connection) as context:
+                user.delete()
+            return len(context.captured_queries)
+
+        self.assertEqual(delete_user(1), delete_user(5))
@@ -9,7 +9,7 @@ from django.utils.module_loading import import_string
 from marsha.core.defaults import AWS_PIPELINE, PEERTUBE_PIPELINE
 from marsha.core.factories import VideoFactory
 from marsha.core.serializers import VideoBaseSerializer
-from marsha.core.storage import storage_class
+from marsha.core.tests.testing_utils import assert_no_io
 
 
 # flake8: noqa: E501
@@ -86,7 +86,7 @@ class VideoBaseSerializerTest(TestCase):
 
     @override_settings(MEDIA_URL="https://abc.svc.edge.scw.cloud/")
     def test_video_serializer_urls_with_no_pipeline(self):
-        """The VideoBaseSerializer should default to AWS pipeline."""
+        """The VideoBaseSerializer should default to AWS pipeline without any I/O."""
         date = datetime(2022, 1, 1, tzinfo=baseTimezone.utc)
         video = VideoFactory(
             transcode_pipeline=None,
@@ -95,72 +95,25 @@ class VideoBaseSerializerTest(TestCase):
             uploaded_on=date,
         )
 
-        with mock.patch(
-            "marsha.core.serializers.video.capture_message"
-        ) as sentry_capture_message:
-            serializer = VideoBaseSerializer(video)
-            self.assertTrue(
-                f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/mp4/1640995200_1080.mp4"
-                in serializer.data["urls"]["mp4"][1080]
-            )
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/thumbnails/1640995200_1080.0000000.jpg",
-                serializer.data["urls"]["thumbnails"][1080],
-            )
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/cmaf/1640995200.m3u8",
-                serializer.data["urls"]["manifests"]["hls"],
-            )
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/previews/1640995200_100.jpg",
-                serializer.data["urls"]["previews"],
-            )
-            self.assertEqual(video.transcode_pipeline, AWS_PIPELINE)
-            sentry_capture_message.assert_called_once_with(
-                f"VOD {video.pk} had no transcode_pipeline and was recovered to AWS",
-            )
+        with assert_no_io(), self.assertNumQueries(1):
+            data = VideoBaseSerializer(video).data
 
-    @override_settings(MEDIA_URL="https://abc.svc.edge.scw.cloud/")
-    def test_video_serializer_urls_with_no_pipeline_recovered_to_peertube(self):
-        """The VideoBaseSerializer should return the right URLs with Peertube pipeline."""
-        date = datetime(2022, 1, 1, tzinfo=baseTimezone.utc)
-        video = VideoFactory(
-            transcode_pipeline=None,
-            live_state=None,
-            resolutions=[1080],
-            uploaded_on=date,
+        self.assertTrue(
+            f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/mp4/1640995200_1080.mp4"
+            in data["urls"]["mp4"][1080]
         )
-
-        with (
-            mock.patch(
-                "marsha.core.serializers.video.capture_message"
-            ) as sentry_capture_message,
-            mock.patch(
-                "marsha.core.serializers.video.file_storage"
-            ) as mock_file_storage,
-        ):
-            mock_file_storage.url = storage_class.file_storage.url
-            mock_file_storage.exists.return_value = True
-
-            serializer = VideoBaseSerializer(video)
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/vod/{video.pk}/video/1640995200/thumbnail.jpg",
-                serializer.data["urls"]["thumbnails"][1080],
-            )
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/vod/{video.pk}/video/1640995200/master.m3u8",
-                serializer.data["urls"]["manifests"]["hls"],
-            )
-            self.assertEqual(
-                f"https://abc.svc.edge.scw.cloud/vod/{video.pk}/video/1640995200/thumbnail.jpg",
-                serializer.data["urls"]["previews"],
-            )
-            self.assertTrue(
-                f"https://abc.svc.edge.scw.cloud/vod/{video.pk}/"
-                "video/1640995200/1640995200-1080-fragmented.mp4"
-                in serializer.data["urls"]["mp4"][1080]
-            )
-            self.assertEqual(video.transcode_pipeline, PEERTUBE_PIPELINE)
-            sentry_capture_message.assert_called_once_with(
-                f"VOD {video.pk} had no transcode_pipeline and was recovered to peertube",
-            )
+        self.assertEqual(
+            f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/thumbnails/1640995200_1080.0000000.jpg",
+            data["urls"]["thumbnails"][1080],
+        )
+        self.assertEqual(
+            f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/cmaf/1640995200.m3u8",
+            data["urls"]["manifests"]["hls"],
+        )
+        self.assertEqual(
+            f"https://abc.svc.edge.scw.cloud/aws/{video.pk}/previews/1640995200_100.jpg",
+            data["urls"]["previews"],
+        )
+        # The pipeline is left to the recover_transcode_pipelines command
+        video.refresh_from_db()
+        self.assertIsNone(video.transcode_pipeline)
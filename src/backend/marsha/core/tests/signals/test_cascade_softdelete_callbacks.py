@@ -0,0 +1,78 @@
+"""Tests for the signals answering soft deletions by cascade in the Marsha project."""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from marsha.core import signals
+from marsha.core.factories import (
+    ConsumerSiteFactory,
+    PlaylistFactory,
+    UserFactory,
+    VideoFactory,
+)
+from marsha.core.models import ConsumerSitePortability, PlaylistPortability
+from marsha.core.utils.app_data_utils import get_app_data_version
+from marsha.core.utils.lti_select_utils import LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY
+
+
+class CascadeSoftDeleteCallbacksTestCase(TestCase):
+    """Test the side effects of objects soft deleted in bulk by cascade."""
+
+    def _get_lti_select_version(self, playlist):
+        return cache.get(
+            LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist.id)
+        )
+
+    @mock.patch.object(signals, "delete_s3_videos")
+    def test_cascade_softdelete_callbacks_resources(self, mock_delete_s3_videos):
+        """Resources deleted by cascade renew their caches and delete their files."""
+        user = UserFactory()
+        video = VideoFactory(created_by=user)
+        playlist = PlaylistFactory(created_by=user)
+        app_data_version = get_app_data_version(video.id)
+        video_playlist_version = self._get_lti_select_version(video.playlist)
+        playlist_version = self._get_lti_select_version(playlist)
+
+        user.delete()
+
+        self.assertNotEqual(get_app_data_version(video.id), app_data_version)
+        self.assertNotEqual(
+            self._get_lti_select_version(video.playlist), video_playlist_version
+        )
+        self.assertNotEqual(self._get_lti_select_version(playlist), playlist_version)
+        mock_delete_s3_videos.delay.assert_called_once_with([str(video.pk)])
+
+    @mock.patch.object(signals, "invalidate_reachable_playlist_ids")
+    def test_cascade_softdelete_callbacks_playlist_portability(self, mock_invalidate):
+        """Playlist portabilities deleted by cascade renew the reachable playlists."""
+        user = UserFactory()
+        playlist = PlaylistFactory(created_by=user)
+        target_playlist = PlaylistFactory()
+        PlaylistPortability.objects.create(
+            source_playlist=playlist, target_playlist=target_playlist
+        )
+        mock_invalidate.reset_mock()
+
+        user.delete()
+
+        mock_invalidate.assert_called_once_with(
+            target_playlist.consumer_site_id, target_playlist.lti_id
+        )
+
+    @mock.patch.object(signals, "invalidate_reachable_consumer_site_ids")
+    def test_cascade_softdelete_callbacks_consumer_site_portability(
+        self, mock_invalidate
+    ):
+        """Consumer site portabilities deleted by cascade renew the reachable sites."""
+        consumer_site = ConsumerSiteFactory()
+        target_site = ConsumerSiteFactory()
+        ConsumerSitePortability.objects.create(
+            source_site=consumer_site, target_site=target_site
+        )
+        mock_invalidate.reset_mock()
+
+        consumer_site.delete()
+
+        mock_invalidate.assert_called_once_with(target_site.id)
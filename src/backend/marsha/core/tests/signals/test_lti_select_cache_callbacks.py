@@ -0,0 +1,67 @@
+"""Tests for the LTI select cache invalidation signals of the Marsha project."""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.test import TestCase
+
+from marsha.core.factories import (
+    DocumentFactory,
+    PlaylistFactory,
+    ThumbnailFactory,
+    VideoFactory,
+)
+from marsha.core.models import Video
+from marsha.core.utils.lti_select_utils import LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY
+
+
+class LtiSelectCacheCallbacksTestCase(TestCase):
+    """Test the cached LTI select listings are renewed when their resources change."""
+
+    def _get_version(self, playlist):
+        return cache.get(
+            LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist.id)
+        )
+
+    def test_lti_select_cache_callbacks_resources(self):
+        """Saving or deleting a selectable resource renews the version of its playlist."""
+        playlist = PlaylistFactory()
+
+        for factory in (VideoFactory, DocumentFactory):
+            version = self._get_version(playlist)
+            resource = factory(playlist=playlist)
+            self.assertNotEqual(self._get_version(playlist), version)
+
+            version = self._get_version(playlist)
+            resource.delete()
+            self.assertNotEqual(self._get_version(playlist), version)
+
+    def test_lti_select_cache_callbacks_playlist(self):
+        """Saving a playlist renews its own version."""
+        playlist = PlaylistFactory()
+        version = self._get_version(playlist)
+
+        playlist.title = "new title"
+        playlist.save()
+
+        self.assertNotEqual(self._get_version(playlist), version)
+
+    def test_lti_select_cache_callbacks_thumbnail(self):
+        """Saving or deleting a thumbnail renews the version of its video playlist."""
+        video = VideoFactory()
+        version = self._get_version(video.playlist)
+
+        thumbnail = ThumbnailFactory(video=video)
+        self.assertNotEqual(self._get_version(video.playlist), version)
+
+        version = self._get_version(video.playlist)
+        thumbnail.delete()
+        self.assertNotEqual(self._get_version(video.playlist), version)
+
+    def test_lti_select_cache_callbacks_raw(self):
+        """Raw saves, sent when loading fixtures, leave the cache untouched."""
+        video = VideoFactory()
+        version = self._get_version(video.playlist)
+
+        post_save.send(sender=Video, instance=video, created=False, raw=True)
+
+        self.assertEqual(self._get_version(video.playlist), version)
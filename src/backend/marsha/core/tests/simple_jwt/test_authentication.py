@@ -0,0 +1,105 @@
+"""Test the Marsha authentication class for API."""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from marsha.core.simple_jwt.authentication import (
+    JWTStatelessUserOrPlaylistAuthentication,
+    validated_token_cache,
+)
+from marsha.core.simple_jwt.factories import (
+    PlaylistAccessTokenFactory,
+    UserAccessTokenFactory,
+)
+from marsha.core.simple_jwt.tokens import PlaylistAccessToken
+
+
+class JWTStatelessUserOrPlaylistAuthenticationTestCase(TestCase):
+    """Test the validated tokens cache of JWTStatelessUserOrPlaylistAuthentication."""
+
+    def setUp(self):
+        """Start each test with an empty cache."""
+        super().setUp()
+        validated_token_cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+        validated_token_cache.clear()
+
+    def test_get_validated_token_cached(self):
+        """A token sent again is not verified again."""
+        raw_token = str(PlaylistAccessTokenFactory()).encode("utf-8")
+        authentication = JWTStatelessUserOrPlaylistAuthentication()
+
+        with mock.patch.object(
+            PlaylistAccessToken, "verify", autospec=True
+        ) as mock_verify:
+            validated_token = authentication.get_validated_token(raw_token)
+            self.assertIs(
+                JWTStatelessUserOrPlaylistAuthentication().get_validated_token(
+                    raw_token
+                ),
+                validated_token,
+            )
+
+        mock_verify.assert_called_once()
+        # The token class the token was validated against is remembered
+        self.assertIsInstance(validated_token, PlaylistAccessToken)
+
+    def test_get_validated_token_expired(self):
+        """An expired token is not served from the cache."""
+        token = UserAccessTokenFactory()
+        raw_token = str(token).encode("utf-8")
+        authentication = JWTStatelessUserOrPlaylistAuthentication()
+        authentication.get_validated_token(raw_token)
+
+        with mock.patch(
+            "marsha.core.simple_jwt.authentication.aware_utcnow",
+            return_value=timezone.now() + timedelta(days=1),
+        ):
+            self.assertIsNone(validated_token_cache.get(raw_token))
+
+    def test_get_validated_token_invalid(self):
+        """Invalid tokens are not cached."""
+        token = PlaylistAccessTokenFactory()
+        token.set_exp(
+            from_time=timezone.now() - timedelta(minutes=30),
+            lifetime=timedelta(minutes=1),
+        )
+        raw_token = str(token).encode("utf-8")
+
+        with self.assertRaises(InvalidToken):
+            JWTStatelessUserOrPlaylistAuthentication().get_validated_token(raw_token)
+
+        self.assertIsNone(validated_token_cache.get(raw_token))
+
+    @override_settings(JWT_VALIDATED_TOKEN_CACHE_SIZE=2)
+    def test_get_validated_token_bounded(self):
+        """The least recently used token is evicted when the cache is full."""
+        raw_tokens = [
+            str(PlaylistAccessTokenFactory()).encode("utf-8") for _ in range(3)
+        ]
+        authentication = JWTStatelessUserOrPlaylistAuthentication()
+        authentication.get_validated_token(raw_tokens[0])
+        authentication.get_validated_token(raw_tokens[1])
+        authentication.get_validated_token(raw_tokens[0])
+        authentication.get_validated_token(raw_tokens[2])
+
+        self.assertIsNotNone(validated_token_cache.get(raw_tokens[0]))
+        self.assertIsNone(validated_token_cache.get(raw_tokens[1]))
+        self.assertIsNotNone(validated_token_cache.get(raw_tokens[2]))
+
+    @override_settings(JWT_VALIDATED_TOKEN_CACHE_SIZE=0)
+    def test_get_validated_token_disabled(self):
+        """No token is cached when the cache size is 0."""
+        raw_token = str(AccessToken()).encode("utf-8")
+
+        JWTStatelessUserOrPlaylistAuthentication().get_validated_token(raw_token)
+
+        self.assertIsNone(validated_token_cache.get(raw_token))
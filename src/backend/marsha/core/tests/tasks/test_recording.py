@@ -3,6 +3,7 @@
 # pylint: disable=unexpected-keyword-arg,no-value-for-parameter
 
 from pathlib import Path
+from unittest import mock
 
 from django.test import TestCase
 
@@ -11,6 +12,7 @@ import responses
 from marsha.core import defaults
 from marsha.core.factories import VideoFactory
 from marsha.core.storage.storage_class import file_storage
+from marsha.core.tasks import recording
 from marsha.core.tasks.recording import copy_video_recording
 
 
@@ -160,6 +162,62 @@ class TestRecordingTask(TestCase):
                 self.video_content,
             )
 
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_copy_video_recording_multipart(self):
+        """
+        Test the copy_video_recording task transferring the video in parts when the
+        storage and the server support it.
+        """
+        record_url = "https://example.com/recording/1234/video?token=456"
+        html_video_url = "https://example.com/video/1234"
+        video_file_url = f"{html_video_url}/video-0.m4v"
+
+        responses.add(
+            responses.GET,
+            record_url,
+            status=302,
+            headers={
+                "Location": html_video_url,
+                "Content-Type": "text/html",
+                "Set-Cookie": "recording_video_1234=xxxxx",
+            },
+        )
+        responses.add(
+            responses.GET,
+            html_video_url,
+            status=200,
+            body=self.html_content,
+            headers={"Content-Type": "text/html"},
+        )
+        responses.add(
+            responses.GET,
+            video_file_url,
+            status=200,
+            body=self.video_content,
+            headers={"Content-Type": "video/mp4", "Accept-Ranges": "bytes"},
+        )
+
+        video = VideoFactory()
+        stamp = "1640995200"
+
+        with mock.patch.object(
+            recording, "supports_multipart_transfer", return_value=True
+        ), mock.patch.object(recording, "MultipartTransfer") as mock_transfer:
+            copy_video_recording(record_url, video.pk, stamp)
+
+        video.refresh_from_db()
+        self.assertEqual(video.upload_state, defaults.PROCESSING)
+        mock_transfer.assert_called_once()
+        storage, source, video_response = mock_transfer.call_args.args
+        self.assertEqual(storage, file_storage)
+        self.assertEqual(source, f"tmp/{str(video.pk)}/video/{stamp}")
+        self.assertEqual(video_response.url, video_file_url)
+        self.assertEqual(
+            video_response.request.headers["Cookie"], "recording_video_1234=xxxxx"
+        )
+        mock_transfer.return_value.run.assert_called_once_with()
+        self.assertFalse(file_storage.exists(source))
+
     @responses.activate(assert_all_requests_are_fired=True)
     def test_copy_video_recording_no_redirection(self):
         """
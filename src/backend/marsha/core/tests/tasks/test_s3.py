@@ -6,7 +6,7 @@ from unittest import mock
 from django.test import TestCase
 
 from marsha.core.factories import VideoFactory
-from marsha.core.tasks.s3 import delete_s3_video
+from marsha.core.tasks.s3 import delete_s3_video, delete_s3_videos
 
 
 class TestS3Task(TestCase):
@@ -16,29 +16,62 @@ class TestS3Task(TestCase):
 
     def test_delete_s3_video(self):
         """
-        Test the the delete_s3_video function. It should call the move_s3_directory
+        Test the the delete_s3_video function. It should call the move_s3_directories
         that move the content of the video to the "deleted" folder for AWS and
         Videos S3 buckets.
         """
         video = VideoFactory()
 
         with mock.patch(
-            "marsha.core.tasks.s3.move_s3_directory"
-        ) as mock_move_s3_directory:
+            "marsha.core.tasks.s3.move_s3_directories"
+        ) as mock_move_s3_directories:
             delete_s3_video(str(video.pk))
-            mock_move_s3_directory.assert_has_calls(
+            mock_move_s3_directories.assert_has_calls(
                 [
                     mock.call(
-                        str(video.pk),
+                        [str(video.pk)],
                         "deleted",
                         "AWS",
                         "test-marsha-destination",
                     ),
                     mock.call(
-                        f"vod/{video.pk}",
+                        [f"vod/{video.pk}"],
                         "deleted",
                         "STORAGE_S3",
                         "test-marsha",
                     ),
                 ]
             )
+
+    def test_delete_s3_videos(self):
+        """
+        Test the the delete_s3_videos function. The content of all the videos should
+        be moved at once for each bucket and the progress of the moves returned.
+        """
+        videos = VideoFactory.create_batch(2)
+
+        with mock.patch(
+            "marsha.core.tasks.s3.move_s3_directories", return_value={"deleted": 3}
+        ) as mock_move_s3_directories:
+            progress = delete_s3_videos([str(video.pk) for video in videos])
+
+        self.assertEqual(
+            mock_move_s3_directories.call_args_list,
+            [
+                mock.call(
+                    [str(video.pk) for video in videos],
+                    "deleted",
+                    "AWS",
+                    "test-marsha-destination",
+                ),
+                mock.call(
+                    [f"vod/{video.pk}" for video in videos],
+                    "deleted",
+                    "STORAGE_S3",
+                    "test-marsha",
+                ),
+            ],
+        )
+        self.assertEqual(
+            progress, {"AWS": {"deleted": 3}, "STORAGE_S3": {"deleted": 3}}
+        )
@@ -5,7 +5,16 @@ from unittest import mock
 
 from django.test import TestCase
 
+from django_peertube_runner_connector.models import (
+    Video as TranscodedVideo,
+    VideoFile,
+    VideoState,
+    VideoStreamingPlaylist,
+)
+import ffmpeg
+
 from marsha.core.defaults import (
+    AWS_PIPELINE,
     ERROR,
     MAX_RESOLUTION_EXCEDEED,
     PEERTUBE_PIPELINE,
@@ -14,10 +23,13 @@ from marsha.core.defaults import (
 from marsha.core.factories import VideoFactory
 from marsha.core.tasks.video import (
     compute_video_information,
-    ffmpeg,
+    compute_videos_information,
     launch_video_transcoding,
     launch_video_transcript,
+    recover_transcode_pipelines,
 )
+from marsha.core.utils.app_data_utils import get_app_data_version
+from marsha.core.utils.probe_utils import PROBE_SIZE
 
 
 FFMPEG_PROBE_VALID = {
@@ -390,7 +402,8 @@ class TestVideoTask(TestCase):
             compute_video_information(str(video.pk))
             mock_ffmpeg_probe.assert_called_once_with(
                 "/media/vod/6da65e16-dbdf-4b92-9e22-0852bfffba11/video/1595413125/"
-                "1595413125-1080-fragmented.mp4"
+                "1595413125-1080-fragmented.mp4",
+                probesize=PROBE_SIZE,
             )
         video.refresh_from_db()
         self.assertEqual(video.duration, 22.2222)
@@ -414,3 +427,108 @@ class TestVideoTask(TestCase):
         video.refresh_from_db()
         self.assertIsNone(video.duration)
         self.assertIsNone(video.size)
+
+    def test_compute_videos_information(self):
+        """Runner results are used when they exist, other videos are probed."""
+        peertube_video = VideoFactory(
+            size=None,
+            duration=None,
+            upload_state=READY,
+            uploaded_on="2020-07-22T10:18:45.000000Z",
+            resolutions=[480, 720],
+            transcode_pipeline=PEERTUBE_PIPELINE,
+        )
+        transcoded_video = TranscodedVideo.objects.create(
+            state=VideoState.PUBLISHED,
+            directory=f"vod/{peertube_video.pk}/video/1595413125",
+            duration=42,
+        )
+        playlist = VideoStreamingPlaylist.objects.create(video=transcoded_video)
+        for resolution, size in ((480, 1000), (720, 3000)):
+            VideoFile.objects.create(
+                video=transcoded_video,
+                streamingPlaylist=playlist,
+                resolution=resolution,
+                size=size,
+                extname="mp4",
+            )
+        aws_video = VideoFactory(
+            size=None,
+            duration=None,
+            upload_state=READY,
+            uploaded_on="2020-07-22T10:18:45.000000Z",
+            resolutions=[240, 480],
+            transcode_pipeline=AWS_PIPELINE,
+        )
+        unprobed_video = VideoFactory(
+            size=None,
+            duration=None,
+            upload_state=READY,
+            uploaded_on="2020-07-22T10:18:45.000000Z",
+            resolutions=[240],
+            transcode_pipeline=AWS_PIPELINE,
+        )
+
+        def probe(url, **kwargs):
+            if str(unprobed_video.pk) in url:
+                raise ffmpeg.Error("ffprobe", b"", b"Server returned 404 Not Found")
+            return FFMPEG_PROBE_VALID
+
+        with mock.patch.object(ffmpeg, "probe", side_effect=probe) as mock_probe:
+            # Select the videos and their runner results, then update them at once
+            with self.assertNumQueries(4):
+                compute_videos_information(
+                    [str(peertube_video.pk), str(aws_video.pk), str(unprobed_video.pk)]
+                )
+
+        self.assertEqual(mock_probe.call_count, 2)
+        mock_probe.assert_any_call(
+            f"/media/aws/{aws_video.pk}/mp4/1595413125_480.mp4", probesize=PROBE_SIZE
+        )
+        for video in (peertube_video, aws_video, unprobed_video):
+            video.refresh_from_db()
+        self.assertEqual(peertube_video.duration, 42)
+        self.assertEqual(peertube_video.size, 3000)
+        self.assertEqual(aws_video.duration, 22.2222)
+        self.assertEqual(aws_video.size, 2964950)
+        self.assertIsNone(unprobed_video.duration)
+        self.assertIsNone(unprobed_video.size)
+
+    def test_recover_transcode_pipelines(self):
+        """The pipelines are recovered from the storage in a single update."""
+        peertube_video = VideoFactory(
+            transcode_pipeline=None, uploaded_on="2020-07-22T10:18:45.000000Z"
+        )
+        aws_video = VideoFactory(
+            transcode_pipeline=None, uploaded_on="2020-07-22T10:18:45.000000Z"
+        )
+        not_uploaded_video = VideoFactory(transcode_pipeline=None, uploaded_on=None)
+        peertube_version = get_app_data_version(peertube_video.id)
+        aws_version = get_app_data_version(aws_video.id)
+
+        with mock.patch(
+            "marsha.core.tasks.video.file_storage.exists",
+            side_effect=lambda key: key.startswith(f"scw/{peertube_video.pk}/"),
+        ) as mock_exists:
+            # Select the videos and update them at once
+            with self.assertNumQueries(2):
+                recover_transcode_pipelines(
+                    [
+                        str(peertube_video.pk),
+                        str(aws_video.pk),
+                        str(not_uploaded_video.pk),
+                    ]
+                )
+
+        self.assertEqual(mock_exists.call_count, 2)
+        mock_exists.assert_any_call(
+            f"scw/{peertube_video.pk}/video/1595413125/thumbnail.jpg"
+        )
+        for video in (peertube_video, aws_video, not_uploaded_video):
+            video.refresh_from_db()
+        self.assertEqual(peertube_video.transcode_pipeline, PEERTUBE_PIPELINE)
+        self.assertEqual(aws_video.transcode_pipeline, AWS_PIPELINE)
+        self.assertIsNone(not_uploaded_video.transcode_pipeline)
+        # Only the urls of the peertube video changed
+        self.assertNotEqual(get_app_data_version(peertube_video.id), peertube_version)
+        self.assertEqual(get_app_data_version(aws_video.id), aws_version)
@@ -66,7 +66,8 @@ class PlaylistPortabilityAPITest(TestCase):
         video = factories.VideoFactory()
         new_playlist = factories.PlaylistFactory()
 
-        with self.assertNumQueries(12):
+        # One query fetches the target playlists to drop their cached reachability
+        with self.assertNumQueries(13):
             response = self._patch_video(video, {"portable_to": [str(new_playlist.id)]})
 
         self.assertEqual(response.status_code, 200)
@@ -270,7 +271,8 @@ class PlaylistPortabilityAPITest(TestCase):
         ported_to_playlist = factories.PlaylistFactory()
         video.playlist.portable_to.add(ported_to_playlist)
 
-        with self.assertNumQueries(11):
+        # One query fetches the target playlists to drop their cached reachability
+        with self.assertNumQueries(12):
             response = self._patch_video(video, {"portable_to": []})
 
         self.assertEqual(response.status_code, 200)
@@ -0,0 +1,142 @@
+"""Tests for the cursor pagination of the Marsha project."""
+
+from datetime import datetime, timedelta, timezone as baseTimezone
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from marsha.core import factories, models
+from marsha.core.simple_jwt.factories import UserAccessTokenFactory
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CursorLimitOffsetPaginationTest(TestCase):
+    """Test the cursor pagination on the playlist list API."""
+
+    maxDiff = None
+
+    def setUp(self):
+        """Create playlists in an organization administrated by a user."""
+        super().setUp()
+        user = factories.UserFactory()
+        organization = factories.OrganizationFactory()
+        factories.OrganizationAccessFactory(
+            user=user, organization=organization, role=models.ADMINISTRATOR
+        )
+        now = datetime(2022, 1, 1, tzinfo=baseTimezone.utc)
+        self.playlists = []
+        for index, title in enumerate(["b", "a", "c", "a", "d"]):
+            with mock.patch(
+                "django.utils.timezone.now", return_value=now + timedelta(days=index)
+            ):
+                self.playlists.append(
+                    factories.PlaylistFactory(organization=organization, title=title)
+                )
+        self.jwt_token = UserAccessTokenFactory(user=user)
+
+    def tearDown(self):
+        super().tearDown()
+        cache.clear()
+
+    def _get(self, url):
+        """Get a page of playlists."""
+        return self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {self.jwt_token}")
+
+    def _ids(self, response):
+        """Return the ids of the playlists of a page."""
+        return [playlist["id"] for playlist in response.json()["results"]]
+
+    def test_cursor_pagination_forward_and_backward(self):
+        """Pages follow each other with cursors, in the ordering of the view."""
+        response = self._get("/api/playlists/?cursor=&limit=2")
+
+        self.assertEqual(response.status_code, 200)
+        content = response.json()
+        self.assertEqual(content["count"], 5)
+        self.assertIsNone(content["previous"])
+        self.assertEqual(
+            self._ids(response),
+            [str(self.playlists[4].id), str(self.playlists[3].id)],
+        )
+        self.assertIn("cursor=", content["next"])
+
+        response = self._get(content["next"])
+        content = response.json()
+        self.assertEqual(
+            self._ids(response),
+            [str(self.playlists[2].id), str(self.playlists[1].id)],
+        )
+
+        last_page = self._get(content["next"]).json()
+        self.assertEqual(
+            [playlist["id"] for playlist in last_page["results"]],
+            [str(self.playlists[0].id)],
+        )
+        self.assertIsNone(last_page["next"])
+
+        response = self._get(last_page["previous"])
+        content = response.json()
+        self.assertEqual(
+            self._ids(response),
+            [str(self.playlists[2].id), str(self.playlists[1].id)],
+        )
+        response = self._get(content["previous"])
+        self.assertEqual(
+            self._ids(response),
+            [str(self.playlists[4].id), str(self.playlists[3].id)],
+        )
+        self.assertIsNone(response.json()["previous"])
+
+    def test_cursor_pagination_ties(self):
+        """Rows sharing the same value of the ordering field are not skipped."""
+        ids = []
+        url = "/api/playlists/?ordering=title&cursor=&limit=1"
+        while url:
+            content = self._get(url).json()
+            ids.extend(playlist["id"] for playlist in content["results"])
+            url = content["next"]
+
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(
+            set(ids[:2]), {str(self.playlists[1].id), str(self.playlists[3].id)}
+        )
+        self.assertEqual(
+            ids[2:],
+            [
+                str(self.playlists[0].id),
+                str(self.playlists[2].id),
+                str(self.playlists[4].id),
+            ],
+        )
+
+    def test_cursor_pagination_invalid_cursor(self):
+        """An invalid cursor is not found."""
+        response = self._get("/api/playlists/?cursor=invalid&limit=2")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Invalid cursor"})
+
+    def test_cursor_pagination_without_cursor(self):
+        """Without cursor, pages are paginated by limit and offset."""
+        response = self._get("/api/playlists/?limit=2&offset=2")
+
+        content = response.json()
+        self.assertEqual(content["count"], 5)
+        self.assertEqual(
+            self._ids(response),
+            [str(self.playlists[2].id), str(self.playlists[1].id)],
+        )
+        self.assertIn("offset=4", content["next"])
+        self.assertNotIn("cursor=", content["next"])
+
+    def test_cursor_pagination_cached_count(self):
+        """The count of the rows is cached between pages."""
+        self._get("/api/playlists/?cursor=&limit=2")
+        factories.PlaylistFactory(organization=self.playlists[0].organization)
+
+        response = self._get("/api/playlists/?cursor=&limit=2")
+
+        self.assertEqual(response.json()["count"], 5)
@@ -0,0 +1,85 @@
+"""Test the S3 storage of the marsha project."""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from marsha.core.storage.s3 import S3FileStorage
+
+
+class S3FileStorageTestCase(TestCase):
+    """Test the urls of the S3FileStorage."""
+
+    def test_storage_s3_url_public_custom_domain(self):
+        """Public urls are built on the custom domain without signing them."""
+        storage = S3FileStorage(custom_domain="abc.svc.edge.scw.cloud")
+
+        with mock.patch.object(
+            storage.bucket.meta.client, "generate_presigned_url"
+        ) as mock_presign:
+            url = storage.url("aws/1234/thumbnails/1640995200_1080.0000000.jpg")
+
+        mock_presign.assert_not_called()
+        self.assertEqual(
+            url,
+            "https://abc.svc.edge.scw.cloud/aws/1234/thumbnails/1640995200_1080.0000000.jpg",
+        )
+
+    def test_storage_s3_url_public_endpoint(self):
+        """Without custom domain, public urls match the unsigned urls boto builds."""
+        storage = S3FileStorage(custom_domain=None)
+
+        with mock.patch.object(
+            storage.bucket.meta.client,
+            "generate_presigned_url",
+            wraps=storage.bucket.meta.client.generate_presigned_url,
+        ) as mock_presign:
+            urls = [storage.url(f"vod/1234/video/{i} page.svg") for i in range(3)]
+
+        # The bucket url is only resolved once
+        mock_presign.assert_called_once()
+        self.assertEqual(
+            urls,
+            [
+                f"https://s3.fr-par.scw.cloud/test-marsha/vod/1234/video/{i}%20page.svg"
+                for i in range(3)
+            ],
+        )
+        self.assertEqual(
+            urls[0],
+            storage._strip_signing_parameters(  # pylint: disable=protected-access
+                storage.bucket.meta.client.generate_presigned_url(
+                    "get_object",
+                    Params={
+                        "Bucket": "test-marsha",
+                        "Key": "vod/1234/video/0 page.svg",
+                    },
+                )
+            ),
+        )
+
+    def test_storage_s3_url_protected(self):
+        """Urls of the tmp directory are still signed."""
+        storage = S3FileStorage(custom_domain=None)
+
+        url = storage.url("tmp/1234/video/1640995200")
+
+        self.assertTrue(
+            url.startswith("https://s3.fr-par.scw.cloud/test-marsha/tmp/1234/video/")
+        )
+        self.assertIn("X-Amz-Signature=", url)
+
+    def test_storage_s3_url_parameters(self):
+        """Urls with parameters are built by boto and unsigned."""
+        storage = S3FileStorage(custom_domain=None)
+
+        url = storage.url(
+            "aws/1234/document/1640995200.pdf",
+            parameters={"ResponseContentDisposition": "attachment"},
+        )
+
+        self.assertEqual(
+            url,
+            "https://s3.fr-par.scw.cloud/test-marsha/aws/1234/document/1640995200.pdf"
+            "?response-content-disposition=attachment",
+        )
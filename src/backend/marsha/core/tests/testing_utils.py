@@ -1,10 +1,14 @@
 """Test utils module."""
 
+from contextlib import ExitStack, contextmanager
 from importlib import reload
+import socket
 import sys
+from unittest import mock
 from urllib.parse import unquote, urlparse
 
 from django.conf import settings
+from django.core.files.storage import storages
 from django.urls import clear_url_caches
 
 from oauthlib import oauth1
@@ -44,6 +48,62 @@ ASOu/Da3/eg8PI5Rsh6ubNVlEAMQdDFhL/TpfaHqSwim6mxbrQ==
 """
 
 
+STORAGE_IO_METHODS = (
+    "delete",
+    "exists",
+    "get_accessed_time",
+    "get_created_time",
+    "get_modified_time",
+    "listdir",
+    "open",
+    "save",
+    "size",
+)
+
+
+@contextmanager
+def assert_no_io():
+    """
+    Fail when the files storage or the network is reached inside the block.
+
+    Serializers run in list endpoints and websocket dispatches and must stay free
+    of storage requests and network calls, ie:
+    with assert_no_io():
+        serializer.data
+    """
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Unexpected I/O while no I/O is allowed.")
+
+    storage_class = type(storages["files"])
+    with ExitStack() as stack:
+        for method in STORAGE_IO_METHODS:
+            stack.enter_context(mock.patch.object(storage_class, method, fail))
+        stack.enter_context(mock.patch.object(socket, "getaddrinfo", fail))
+        stack.enter_context(mock.patch.object(socket.socket, "connect", fail))
+        yield
+
+
+def get_s3_client_mock(objects):
+    """
+    Mock an S3 client whose bucket holds `objects`, a dict of their size by key.
+
+    Only the listing of the objects is answered, ie:
+    s3_client = get_s3_client_mock({"aws/1234/document/1533686400.pdf": 10})
+    """
+    s3_client = mock.Mock()
+    s3_client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix: [
+        {
+            "Contents": [
+                {"Key": key, "Size": size}
+                for key, size in objects.items()
+                if key.startswith(Prefix)
+            ]
+        }
+    ]
+    return s3_client
+
+
 def reload_urlconf():
     """
     Enforce URL configuration reload.
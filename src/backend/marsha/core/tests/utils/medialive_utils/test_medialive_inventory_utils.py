@@ -0,0 +1,123 @@
+"""Test medialive inventory utils functions."""
+
+import uuid
+
+from django.test import TestCase
+
+from botocore.stub import Stubber
+
+from marsha.core.factories import VideoFactory
+from marsha.core.utils import medialive_utils
+
+
+class MediaLiveInventoryUtilsTestCase(TestCase):
+    """Test medialive inventory utils."""
+
+    maxDiff = None
+
+    def test_list_environment_medialive_channels(self):
+        """Channels of the environment are paired with their live in a single query."""
+        live = VideoFactory()
+        missing_live_pk = str(uuid.uuid4())
+        live_channel = {
+            "Name": f"test_{live.pk}_1667490961",
+            "Tags": {"environment": "test"},
+        }
+        orphan_channel = {
+            "Name": f"test_{missing_live_pk}_1667490961",
+            "Tags": {"environment": "test"},
+        }
+        other_environment_channel = {
+            "Name": f"production_{live.pk}_1667490961",
+            "Tags": {"environment": "production"},
+        }
+
+        with self.assertNumQueries(1):
+            channels = medialive_utils.list_environment_medialive_channels(
+                [live_channel, orphan_channel, other_environment_channel]
+            )
+
+        self.assertEqual(
+            channels,
+            [
+                (live_channel, str(live.pk), live),
+                (orphan_channel, missing_live_pk, None),
+            ],
+        )
+
+    def test_list_indexed_mediapackage_harvest_jobs(self):
+        """All the harvest jobs are listed once and indexed by channel."""
+        with Stubber(
+            medialive_utils.mediapackage_client
+        ) as mediapackage_client_stubber:
+            mediapackage_client_stubber.add_response(
+                "list_harvest_jobs",
+                service_response={
+                    "HarvestJobs": [
+                        {"Id": "1", "ChannelId": "channel1"},
+                        {"Id": "2", "ChannelId": "channel2"},
+                    ],
+                    "NextToken": "next_token",
+                },
+                expected_params={},
+            )
+            mediapackage_client_stubber.add_response(
+                "list_harvest_jobs",
+                service_response={
+                    "HarvestJobs": [{"Id": "3", "ChannelId": "channel1"}]
+                },
+                expected_params={"NextToken": "next_token"},
+            )
+            harvest_jobs = medialive_utils.list_indexed_mediapackage_harvest_jobs()
+            mediapackage_client_stubber.assert_no_pending_responses()
+
+        self.assertEqual(
+            harvest_jobs,
+            {
+                "channel1": [
+                    {"Id": "1", "ChannelId": "channel1"},
+                    {"Id": "3", "ChannelId": "channel1"},
+                ],
+                "channel2": [{"Id": "2", "ChannelId": "channel2"}],
+            },
+        )
+
+    def test_list_indexed_mediapackage_origin_endpoints(self):
+        """All the origin endpoints are listed once and indexed by channel."""
+        with Stubber(
+            medialive_utils.mediapackage_client
+        ) as mediapackage_client_stubber:
+            mediapackage_client_stubber.add_response(
+                "list_origin_endpoints",
+                service_response={
+                    "OriginEndpoints": [
+                        {"Id": "1", "ChannelId": "channel1"},
+                        {"Id": "2", "ChannelId": "channel2"},
+                    ]
+                },
+                expected_params={},
+            )
+            origin_endpoints = (
+                medialive_utils.list_indexed_mediapackage_origin_endpoints()
+            )
+            mediapackage_client_stubber.assert_no_pending_responses()
+
+        self.assertEqual(
+            origin_endpoints,
+            {
+                "channel1": [{"Id": "1", "ChannelId": "channel1"}],
+                "channel2": [{"Id": "2", "ChannelId": "channel2"}],
+            },
+        )
+
+    def test_exclusive_command(self):
+        """A command can not run while another run of it is in progress."""
+        with medialive_utils.exclusive_command("command") as can_run:
+            self.assertTrue(can_run)
+            with medialive_utils.exclusive_command("command") as can_run_again:
+                self.assertFalse(can_run_again)
+            with medialive_utils.exclusive_command("other_command") as can_run_other:
+                self.assertTrue(can_run_other)
+
+        with medialive_utils.exclusive_command("command") as can_run:
+            self.assertTrue(can_run)
@@ -0,0 +1,117 @@
+"""Tests for the `core.utils.app_data_utils` module."""
+
+from unittest import mock
+import uuid
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from marsha.core.utils import app_data_utils
+from marsha.core.utils.app_data_utils import (
+    get_app_data_version,
+    get_or_compute_app_data,
+    invalidate_app_data_cache,
+    invalidate_playlist_app_data_cache,
+)
+
+
+@override_settings(APP_DATA_CACHE_DURATION=300, APP_DATA_CACHE_STALE_DURATION=60)
+class AppDataUtilsTestCase(TestCase):
+    """Tests for app_data_utils module."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_key = f"app_data|test|{uuid.uuid4()}"
+
+    def test_get_app_data_version(self):
+        """The version of a resource is kept until the resource is invalidated."""
+        resource_id = uuid.uuid4()
+        version = get_app_data_version(resource_id)
+
+        self.assertEqual(get_app_data_version(resource_id), version)
+        self.assertNotEqual(get_app_data_version(uuid.uuid4()), version)
+
+        invalidate_app_data_cache(resource_id)
+        self.assertNotEqual(get_app_data_version(resource_id), version)
+
+    def test_get_app_data_version_playlist(self):
+        """The version of a resource is renewed when its playlist is invalidated."""
+        resource_id = uuid.uuid4()
+        playlist_id = uuid.uuid4()
+
+        # The playlist is unknown until the resource is invalidated with it
+        invalidate_playlist_app_data_cache(playlist_id)
+        version = get_app_data_version(resource_id)
+        invalidate_playlist_app_data_cache(playlist_id)
+        self.assertEqual(get_app_data_version(resource_id), version)
+
+        invalidate_app_data_cache(resource_id, playlist_id)
+        version = get_app_data_version(resource_id)
+        self.assertEqual(get_app_data_version(resource_id), version)
+
+        invalidate_playlist_app_data_cache(uuid.uuid4())
+        self.assertEqual(get_app_data_version(resource_id), version)
+
+        invalidate_playlist_app_data_cache(playlist_id)
+        self.assertNotEqual(get_app_data_version(resource_id), version)
+
+    def test_get_or_compute_app_data_fresh(self):
+        """Fresh data is computed once."""
+        compute = mock.Mock(return_value={"id": "1"})
+
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), {"id": "1"})
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), {"id": "1"})
+
+        compute.assert_called_once_with()
+
+    def test_get_or_compute_app_data_stale(self):
+        """Expired data is computed again by a single request, others get stale data."""
+        # The data expired but is still served stale
+        cache.set(self.cache_key, (0, "stale"))
+
+        # Another request is already computing the data
+        cache.add(f"{self.cache_key}|lock", "1")
+        compute = mock.Mock(return_value="new")
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), "stale")
+        compute.assert_not_called()
+
+        cache.delete(f"{self.cache_key}|lock")
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), "new")
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), "new")
+        compute.assert_called_once_with()
+
+        self.assertIsNone(cache.get(f"{self.cache_key}|lock"))
+
+    @mock.patch.object(app_data_utils.time, "sleep")
+    def test_get_or_compute_app_data_missing_single_flight(self, mock_sleep):
+        """Requests wait for the one computing missing data instead of computing it."""
+        cache.add(f"{self.cache_key}|lock", "1")
+        compute = mock.Mock(return_value="computed")
+
+        def other_request_computes(_seconds):
+            cache.set(self.cache_key, (10**10, "other"))
+
+        mock_sleep.side_effect = other_request_computes
+
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), "other")
+        compute.assert_not_called()
+        mock_sleep.assert_called_once()
+
+    @mock.patch.object(app_data_utils.time, "sleep")
+    def test_get_or_compute_app_data_missing_timeout(self, mock_sleep):
+        """Requests stop waiting for a request that never computes the data."""
+        cache.add(f"{self.cache_key}|lock", "1")
+        compute = mock.Mock(return_value="computed")
+
+        self.assertEqual(get_or_compute_app_data(self.cache_key, compute), "computed")
+        self.assertEqual(mock_sleep.call_count, app_data_utils.APP_DATA_LOCK_POLL_COUNT)
+
+    def test_get_or_compute_app_data_error(self):
+        """The lock is released when computing the data fails."""
+        compute = mock.Mock(side_effect=ValueError)
+
+        with self.assertRaises(ValueError):
+            get_or_compute_app_data(self.cache_key, compute)
+
+        self.assertIsNone(cache.get(f"{self.cache_key}|lock"))
+        self.assertIsNone(cache.get(self.cache_key))
@@ -1,8 +1,16 @@
 """Tests for the `core.utils.lti_select_utils` module."""
 
+import uuid
+
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
-from marsha.core.utils.lti_select_utils import get_lti_select_resources
+from marsha.core.utils.lti_select_utils import (
+    LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY,
+    get_lti_select_cache_key,
+    get_lti_select_resources,
+    invalidate_lti_select_cache,
+)
 
 
 class LtiSelectUtilsTestCase(TestCase):
@@ -38,3 +46,49 @@ class LtiSelectUtilsTestCase(TestCase):
 
         lti_select_config = get_lti_select_resources()
         self.assertIn("classroom", lti_select_config)
+
+    def test_get_lti_select_cache_key(self):
+        """The cache key only changes when one of the listed playlists is invalidated."""
+        playlist_ids = [uuid.uuid4(), uuid.uuid4()]
+        other_playlist_id = uuid.uuid4()
+
+        cache_key = get_lti_select_cache_key("video", playlist_ids, "context_id")
+        self.assertTrue(cache_key.startswith("lti_select|video|context_id|"))
+        self.assertEqual(
+            get_lti_select_cache_key("video", playlist_ids, "context_id"), cache_key
+        )
+        self.assertEqual(
+            get_lti_select_cache_key("video", playlist_ids[::-1], "context_id"),
+            cache_key,
+        )
+        self.assertNotEqual(
+            get_lti_select_cache_key("document", playlist_ids, "context_id"),
+            cache_key,
+        )
+
+        invalidate_lti_select_cache(other_playlist_id)
+        self.assertEqual(
+            get_lti_select_cache_key("video", playlist_ids, "context_id"), cache_key
+        )
+
+        invalidate_lti_select_cache(playlist_ids[1])
+        new_cache_key = get_lti_select_cache_key("video", playlist_ids, "context_id")
+        self.assertNotEqual(new_cache_key, cache_key)
+
+        # A listing including a new playlist has a different cache key
+        self.assertNotEqual(
+            get_lti_select_cache_key(
+                "video", [*playlist_ids, other_playlist_id], "context_id"
+            ),
+            new_cache_key,
+        )
+
+    def test_get_lti_select_cache_key_evicted_version(self):
+        """An evicted playlist version does not make a previous cache key valid again."""
+        playlist_id = uuid.uuid4()
+
+        cache_key = get_lti_select_cache_key("video", [playlist_id])
+        cache.delete(
+            LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist_id)
+        )
+        self.assertNotEqual(get_lti_select_cache_key("video", [playlist_id]), cache_key)
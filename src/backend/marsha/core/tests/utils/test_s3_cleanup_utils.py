@@ -0,0 +1,133 @@
+"""Test the s3 cleanup utils of the core app."""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from marsha.core.utils import s3_cleanup_utils
+from marsha.core.utils.s3_cleanup_utils import S3PrefixCleanup
+
+
+def get_s3_client_mock(pages):
+    """Mock an S3 client listing the pages of keys given for each prefix."""
+    s3_client = mock.Mock()
+
+    def list_objects_v2(**kwargs):
+        prefix_pages = pages[kwargs["Prefix"]]
+        index = int(kwargs.get("ContinuationToken", 0))
+        response = {
+            "Contents": [{"Key": key} for key in prefix_pages[index]],
+            "IsTruncated": index + 1 < len(prefix_pages),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(index + 1)
+        return response
+
+    s3_client.list_objects_v2.side_effect = list_objects_v2
+    s3_client.delete_objects.return_value = {}
+    return s3_client
+
+
+def get_deleted_keys(s3_client):
+    """Return the keys deleted by each delete_objects call."""
+    return [
+        [item["Key"] for item in call.kwargs["Delete"]["Objects"]]
+        for call in s3_client.delete_objects.call_args_list
+    ]
+
+
+class S3PrefixCleanupTestCase(TestCase):
+    """Test the cleanup of the objects under many prefixes."""
+
+    def test_s3_cleanup_utils_delete(self):
+        """The objects of all the prefixes are deleted in shared batches."""
+        s3_client = get_s3_client_mock(
+            {
+                "video1": [["video1/a", "video1/b"], ["video1/c"]],
+                "video2": [["video2/a"]],
+                "video3": [[]],
+            }
+        )
+        on_progress = mock.Mock()
+
+        progress = S3PrefixCleanup(s3_client, "bucket", on_progress=on_progress).run(
+            ["video1", "video2", "video3"]
+        )
+
+        self.assertEqual(s3_client.list_objects_v2.call_count, 4)
+        s3_client.list_objects_v2.assert_any_call(
+            Bucket="bucket", Prefix="video1", ContinuationToken="1"
+        )
+        # The keys of the videos are coalesced in a single request
+        self.assertEqual(len(get_deleted_keys(s3_client)), 1)
+        self.assertCountEqual(
+            get_deleted_keys(s3_client)[0],
+            ["video1/a", "video1/b", "video1/c", "video2/a"],
+        )
+        s3_client.copy.assert_not_called()
+        self.assertEqual(
+            progress,
+            {"prefixes": 3, "listed": 4, "copied": 0, "deleted": 4, "errors": 0},
+        )
+        on_progress.assert_called_once_with(progress)
+
+    @mock.patch.object(s3_cleanup_utils, "DELETE_BATCH_SIZE", 2)
+    def test_s3_cleanup_utils_delete_batches(self):
+        """Batches are limited to the size accepted by delete_objects."""
+        s3_client = get_s3_client_mock(
+            {"video1": [["video1/a", "video1/b", "video1/c"]], "video2": [["video2/a"]]}
+        )
+
+        S3PrefixCleanup(s3_client, "bucket").run(["video1", "video2"])
+
+        deleted_keys = get_deleted_keys(s3_client)
+        self.assertEqual([len(keys) for keys in deleted_keys], [2, 2])
+        self.assertCountEqual(
+            sum(deleted_keys, []), ["video1/a", "video1/b", "video1/c", "video2/a"]
+        )
+
+    def test_s3_cleanup_utils_move(self):
+        """Objects moved are copied to the destination folder before their deletion."""
+        s3_client = get_s3_client_mock({"video1": [["video1/a", "video1/b"]]})
+
+        progress = S3PrefixCleanup(s3_client, "bucket", "deleted").run(["video1"])
+
+        self.assertEqual(
+            s3_client.copy.call_args_list,
+            [
+                mock.call(
+                    {"Bucket": "bucket", "Key": "video1/a"},
+                    "bucket",
+                    "deleted/video1/a",
+                ),
+                mock.call(
+                    {"Bucket": "bucket", "Key": "video1/b"},
+                    "bucket",
+                    "deleted/video1/b",
+                ),
+            ],
+        )
+        self.assertEqual(get_deleted_keys(s3_client), [["video1/a", "video1/b"]])
+        self.assertEqual(progress["copied"], 2)
+        self.assertEqual(progress["deleted"], 2)
+
+    def test_s3_cleanup_utils_delete_errors(self):
+        """Objects failing to be deleted are counted in the progress."""
+        s3_client = get_s3_client_mock({"video1": [["video1/a", "video1/b"]]})
+        s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": "video1/b", "Message": "Access Denied"}]
+        }
+
+        progress = S3PrefixCleanup(s3_client, "bucket").run(["video1"])
+
+        self.assertEqual(progress["deleted"], 1)
+        self.assertEqual(progress["errors"], 1)
+
+    def test_s3_cleanup_utils_listing_failure(self):
+        """A listing failing raises its error once the other prefixes are cleaned."""
+        s3_client = get_s3_client_mock({"video2": [["video2/a"]]})
+
+        with self.assertRaises(KeyError):
+            S3PrefixCleanup(s3_client, "bucket").run(["video1", "video2"])
+
+        self.assertEqual(get_deleted_keys(s3_client), [["video2/a"]])
@@ -0,0 +1,165 @@
+"""Test the s3 migration utils of the core app."""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from marsha.core.factories import DocumentFactory
+from marsha.core.models import Document
+from marsha.core.tests.testing_utils import get_s3_client_mock
+from marsha.core.utils import s3_migration_utils
+from marsha.core.utils.s3_migration_utils import S3ObjectMigration
+
+
+def prepare_document(document):
+    """Rename a document to its title and copy its object under this name."""
+    document.filename = f"{document.title}.pdf"
+    return (
+        f"aws/{document.pk}/document/source.pdf",
+        f"aws/{document.pk}/document/{document.filename}",
+    )
+
+
+class S3ObjectMigrationTestCase(TestCase):
+    """Test the bulk migration of S3 objects."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_s3_migration_utils_run(self):
+        """Changed instances are saved by batch and missing objects are copied."""
+        documents = [DocumentFactory(title=f"title{i}") for i in range(3)]
+        objects = {
+            f"aws/{document.pk}/document/source.pdf": 10 for document in documents
+        }
+        # The object of the first document is already copied
+        objects[f"aws/{documents[0].pk}/document/title0.pdf"] = 10
+        s3_client = get_s3_client_mock(objects)
+        migration = S3ObjectMigration("test", s3_client, "bucket")
+
+        # The instances are selected, then saved with a bulk update by batch
+        with self.assertNumQueries(3):
+            migration.run(
+                Document.objects.all(), prepare_document, ["filename"], batch_size=2
+            )
+
+        self.assertCountEqual(
+            [call.kwargs["Key"] for call in s3_client.copy_object.call_args_list],
+            [
+                f"aws/{documents[1].pk}/document/title1.pdf",
+                f"aws/{documents[2].pk}/document/title2.pdf",
+            ],
+        )
+        for document in documents:
+            document.refresh_from_db()
+            self.assertEqual(document.filename, f"{document.title}.pdf")
+        self.assertIsNone(cache.get(migration.checkpoint_key))
+
+    def test_s3_migration_utils_run_missing_source(self):
+        """An instance whose source object does not exist is not copied."""
+        document = DocumentFactory(title="title")
+        s3_client = get_s3_client_mock({})
+
+        S3ObjectMigration("test", s3_client, "bucket").run(
+            Document.objects.all(), prepare_document, ["filename"]
+        )
+
+        s3_client.copy_object.assert_not_called()
+        document.refresh_from_db()
+        self.assertEqual(document.filename, "title.pdf")
+
+    def test_s3_migration_utils_run_resume(self):
+        """A migration interrupted resumes after its checkpoint."""
+        documents = sorted(
+            [DocumentFactory(title=f"title{i}") for i in range(3)],
+            key=lambda document: document.pk,
+        )
+        s3_client = get_s3_client_mock(
+            {f"aws/{document.pk}/document/source.pdf": 10 for document in documents}
+        )
+        s3_client.copy_object.side_effect = [None, Exception("interrupted")]
+        migration = S3ObjectMigration("test", s3_client, "bucket")
+
+        with self.assertRaises(Exception):
+            migration.run(
+                Document.objects.all(), prepare_document, ["filename"], batch_size=1
+            )
+        self.assertEqual(cache.get(migration.checkpoint_key), documents[0].pk)
+
+        s3_client.copy_object.reset_mock(side_effect=True)
+        migration.run(
+            Document.objects.all(), prepare_document, ["filename"], batch_size=1
+        )
+
+        self.assertEqual(
+            [call.kwargs["Key"] for call in s3_client.copy_object.call_args_list],
+            [
+                f"aws/{document.pk}/document/{document.title}.pdf"
+                for document in documents[1:]
+            ],
+        )
+
+    def test_s3_migration_utils_run_restart(self):
+        """A migration restarted ignores its checkpoint."""
+        document = DocumentFactory(title="title")
+        s3_client = get_s3_client_mock({f"aws/{document.pk}/document/source.pdf": 10})
+        migration = S3ObjectMigration("test", s3_client, "bucket")
+        cache.set(migration.checkpoint_key, document.pk)
+
+        migration.reset()
+        migration.run(Document.objects.all(), prepare_document, ["filename"])
+
+        s3_client.copy_object.assert_called_once()
+
+    @mock.patch.object(s3_migration_utils, "MULTIPART_COPY_PART_SIZE", 4)
+    @mock.patch.object(s3_migration_utils, "MULTIPART_COPY_THRESHOLD", 5)
+    def test_s3_migration_utils_copy_multipart(self):
+        """Large objects are copied in parts."""
+        s3_client = get_s3_client_mock({"aws/1/source": 10})
+        s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        s3_client.upload_part_copy.side_effect = lambda **kwargs: {
+            "CopyPartResult": {"ETag": f"etag-{kwargs['PartNumber']}"}
+        }
+
+        S3ObjectMigration("test", s3_client, "bucket").copy(
+            [("aws/1/source", "aws/1/destination")]
+        )
+
+        s3_client.copy_object.assert_not_called()
+        self.assertEqual(
+            [
+                call.kwargs["CopySourceRange"]
+                for call in s3_client.upload_part_copy.call_args_list
+            ],
+            ["bytes=0-3", "bytes=4-7", "bytes=8-9"],
+        )
+        s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="aws/1/destination",
+            UploadId="up-1",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+
+    @mock.patch.object(s3_migration_utils, "MULTIPART_COPY_THRESHOLD", 5)
+    def test_s3_migration_utils_copy_multipart_failure(self):
+        """A multipart copy failing is aborted."""
+        s3_client = get_s3_client_mock({"aws/1/source": 10})
+        s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        s3_client.upload_part_copy.side_effect = Exception("failure")
+
+        with self.assertRaises(Exception):
+            S3ObjectMigration("test", s3_client, "bucket").copy(
+                [("aws/1/source", "aws/1/destination")]
+            )
+
+        s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="aws/1/destination", UploadId="up-1"
+        )
@@ -125,6 +125,7 @@ class S3UtilsTestCase(TestCase):
         copy, and delete files.
         """
         mock_s3_client = mock.Mock()
+        mock_s3_client.delete_objects.return_value = {}
 
         mock_s3_client.list_objects_v2.return_value = {
             "IsTruncated": False,
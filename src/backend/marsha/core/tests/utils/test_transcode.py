@@ -39,6 +39,7 @@ class TranscodingEndedCallbackTestCase(TestCase):
         self.transcoded_video = TranscodedVideo.objects.create(
             state=VideoState.PUBLISHED,
             directory=f"vod/{self.video.pk}/video/1698941501",
+            duration=42,
         )
 
         self.video_playlist = VideoStreamingPlaylist.objects.create(
@@ -56,7 +57,7 @@ class TranscodingEndedCallbackTestCase(TestCase):
             video=self.transcoded_video,
             streamingPlaylist=self.video_playlist,
             resolution=1080,
-            size=123456,
+            size=654321,
             extname="mp4",
         )
 
@@ -70,6 +71,8 @@ class TranscodingEndedCallbackTestCase(TestCase):
         self.assertEqual(self.video.resolutions, [720, 1080])
         self.assertEqual(self.video.upload_state, defaults.READY)
         self.assertEqual(self.video.transcode_pipeline, defaults.PEERTUBE_PIPELINE)
+        self.assertEqual(self.video.duration, 42)
+        self.assertEqual(self.video.size, 654321)
         mock_delete_temp_file.assert_called_once_with(
             self.transcoded_video, f"tmp/{self.video.pk}/video/1698941501"
         )
@@ -0,0 +1,254 @@
+"""Test the transfer utils of the core app."""
+
+# pylint: disable=unexpected-keyword-arg,no-value-for-parameter
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase, override_settings
+
+from botocore.exceptions import ClientError
+import requests
+import responses
+from responses import matchers
+
+from marsha.core.storage.s3 import S3FileStorage
+from marsha.core.utils import transfer_utils
+from marsha.core.utils.transfer_utils import (
+    MIN_PART_SIZE,
+    MultipartTransfer,
+    supports_multipart_transfer,
+)
+
+
+FILE_URL = "https://example.com/video/1234/video-0.m4v"
+FILE_CONTENT = b"".join(bytes([i]) * MIN_PART_SIZE for i in range(2)) + b"end"
+PARTS = [
+    FILE_CONTENT[:MIN_PART_SIZE],
+    FILE_CONTENT[MIN_PART_SIZE : 2 * MIN_PART_SIZE],  # noqa: E203
+    b"end",
+]
+
+
+def add_part_response(number, **kwargs):
+    """Mock the range request of a part of the file."""
+    start = (number - 1) * MIN_PART_SIZE
+    end = start + len(PARTS[number - 1]) - 1
+    kwargs.setdefault("status", 206)
+    kwargs.setdefault("body", PARTS[number - 1])
+    responses.add(
+        responses.GET,
+        FILE_URL,
+        match=[
+            matchers.header_matcher(
+                {"Range": f"bytes={start}-{end}", "Cookie": "recording=xxx"}
+            )
+        ],
+        **kwargs,
+    )
+
+
+@override_settings(RECORDING_TRANSFER_PART_SIZE=MIN_PART_SIZE)
+class MultipartTransferTestCase(TestCase):
+    """Test the transfer of remote files in parts to an S3 storage."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client_mock = mock.Mock()
+        self.client_mock.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        self.client_mock.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f"etag-{kwargs['PartNumber']}"
+        }
+        connection = mock.Mock()
+        connection.meta.client = self.client_mock
+        patcher = mock.patch.object(
+            S3FileStorage, "connection", mock.PropertyMock(return_value=connection)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.storage = S3FileStorage()
+
+    def _get_transfer(self):
+        response = requests.Response()
+        response.url = FILE_URL
+        response.headers["Content-Length"] = str(len(FILE_CONTENT))
+        response.request = requests.Request(
+            "GET", FILE_URL, headers={"Cookie": "recording=xxx"}
+        ).prepare()
+        return MultipartTransfer(self.storage, "tmp/1234/video/1640995200", response)
+
+    def _get_uploaded_parts(self):
+        return {
+            call.kwargs["PartNumber"]: call.kwargs["Body"]
+            for call in self.client_mock.upload_part.call_args_list
+        }
+
+    def test_transfer_utils_supports_multipart_transfer(self):
+        """Only large files served by ranges are transferred in parts to S3."""
+        response = requests.Response()
+        response.headers.update(
+            {"Accept-Ranges": "bytes", "Content-Length": str(len(FILE_CONTENT))}
+        )
+        self.assertTrue(supports_multipart_transfer(self.storage, response))
+        self.assertFalse(
+            supports_multipart_transfer(FileSystemStorage(location="/media"), response)
+        )
+
+        response.headers["Content-Length"] = str(MIN_PART_SIZE)
+        self.assertFalse(supports_multipart_transfer(self.storage, response))
+
+        response.headers["Content-Length"] = str(len(FILE_CONTENT))
+        del response.headers["Accept-Ranges"]
+        self.assertFalse(supports_multipart_transfer(self.storage, response))
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_transfer_utils_multipart_transfer(self):
+        """All the parts are transferred and assembled in order."""
+        for number in range(1, 4):
+            add_part_response(number)
+
+        transfer = self._get_transfer()
+        transfer.run()
+
+        self.client_mock.create_multipart_upload.assert_called_once_with(
+            Bucket=self.storage.bucket_name,
+            Key="tmp/1234/video/1640995200",
+            ContentType="application/octet-stream",
+            **self.storage.object_parameters,
+        )
+        self.assertEqual(self._get_uploaded_parts(), dict(enumerate(PARTS, start=1)))
+        self.client_mock.complete_multipart_upload.assert_called_once_with(
+            Bucket=self.storage.bucket_name,
+            Key="tmp/1234/video/1640995200",
+            UploadId="up-1",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        self.assertIsNone(cache.get(transfer.checkpoint_key))
+
+    @override_settings(RECORDING_TRANSFER_CONCURRENCY=1)
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_transfer_utils_multipart_transfer_checkpoint(self):
+        """Completed parts are checkpointed when the transfer fails."""
+        add_part_response(1)
+        add_part_response(2)
+        add_part_response(3, status=404, body=b"")
+
+        transfer = self._get_transfer()
+        with mock.patch.object(transfer_utils.time, "sleep") as mock_sleep:
+            with self.assertRaises(requests.HTTPError):
+                transfer.run()
+
+        self.assertEqual(mock_sleep.call_count, transfer_utils.PART_ATTEMPTS - 1)
+        self.client_mock.complete_multipart_upload.assert_not_called()
+        checkpoint = cache.get(transfer.checkpoint_key)
+        self.assertEqual(checkpoint["upload_id"], "up-1")
+        self.assertEqual(checkpoint["parts"], {1: "etag-1", 2: "etag-2"})
+        self.assertEqual(checkpoint["transferred"], 2 * MIN_PART_SIZE)
+        self.assertGreater(checkpoint["throughput"], 0)
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_transfer_utils_multipart_transfer_resume(self):
+        """A transfer checkpointed resumes its multipart upload with the missing parts."""
+        transfer = self._get_transfer()
+        cache.set(
+            transfer.checkpoint_key,
+            {
+                "upload_id": "up-0",
+                "size": len(FILE_CONTENT),
+                "part_size": MIN_PART_SIZE,
+                "parts": {1: "etag-0"},
+            },
+        )
+        add_part_response(2)
+        add_part_response(3)
+
+        transfer.run()
+
+        self.client_mock.create_multipart_upload.assert_not_called()
+        self.assertEqual(self._get_uploaded_parts(), {2: PARTS[1], 3: PARTS[2]})
+        self.client_mock.complete_multipart_upload.assert_called_once_with(
+            Bucket=self.storage.bucket_name,
+            Key="tmp/1234/video/1640995200",
+            UploadId="up-0",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-0", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        self.assertIsNone(cache.get(transfer.checkpoint_key))
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_transfer_utils_multipart_transfer_resume_other_size(self):
+        """A checkpoint of a file of another size is aborted and started again."""
+        transfer = self._get_transfer()
+        cache.set(
+            transfer.checkpoint_key,
+            {
+                "upload_id": "up-0",
+                "size": 3 * MIN_PART_SIZE,
+                "part_size": MIN_PART_SIZE,
+                "parts": {1: "etag-0"},
+            },
+        )
+        for number in range(1, 4):
+            add_part_response(number)
+
+        transfer.run()
+
+        self.client_mock.abort_multipart_upload.assert_called_once_with(
+            Bucket=self.storage.bucket_name,
+            Key="tmp/1234/video/1640995200",
+            UploadId="up-0",
+        )
+        self.client_mock.create_multipart_upload.assert_called_once()
+        self.assertEqual(self._get_uploaded_parts(), dict(enumerate(PARTS, start=1)))
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_transfer_utils_multipart_transfer_retry(self):
+        """A part failing to download is retried."""
+        add_part_response(1, status=502, body=b"")
+        add_part_response(1, body=PARTS[0][:10])
+        for number in range(1, 4):
+            add_part_response(number)
+
+        with mock.patch.object(transfer_utils.time, "sleep") as mock_sleep:
+            self._get_transfer().run()
+
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(self._get_uploaded_parts(), dict(enumerate(PARTS, start=1)))
+        self.client_mock.complete_multipart_upload.assert_called_once()
+
+    @responses.activate
+    def test_transfer_utils_multipart_transfer_expired_upload(self):
+        """The checkpoint of an upload expired on S3 is forgotten."""
+        transfer = self._get_transfer()
+        cache.set(
+            transfer.checkpoint_key,
+            {
+                "upload_id": "up-0",
+                "size": len(FILE_CONTENT),
+                "part_size": MIN_PART_SIZE,
+                "parts": {1: "etag-0"},
+            },
+        )
+        add_part_response(2)
+        add_part_response(3)
+        self.client_mock.upload_part.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchUpload"}}, "UploadPart"
+        )
+
+        with self.assertRaises(ClientError):
+            transfer.run()
+
+        self.assertIsNone(cache.get(transfer.checkpoint_key))
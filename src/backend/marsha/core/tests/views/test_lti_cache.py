@@ -12,8 +12,20 @@ from django.test import TestCase
 
 from waffle.testutils import override_switch
 
-from marsha.core.defaults import AWS_PIPELINE, SENTRY, STATE_CHOICES, TRANSCRIPTION
-from marsha.core.factories import ConsumerSiteFactory, LiveSessionFactory, VideoFactory
+from marsha.core.defaults import (
+    AWS_PIPELINE,
+    READY,
+    SENTRY,
+    STATE_CHOICES,
+    TRANSCRIPTION,
+)
+from marsha.core.factories import (
+    ConsumerSiteFactory,
+    LiveSessionFactory,
+    ThumbnailFactory,
+    TimedTextTrackFactory,
+    VideoFactory,
+)
 from marsha.core.lti import LTI
 
 
@@ -126,7 +138,7 @@ class CacheLTIViewTestCase(TestCase):
     @override_switch(SENTRY, active=True)
     @override_switch(TRANSCRIPTION, active=True)
     def test_views_lti_cache_instructor(self, mock_get_consumer_site, mock_verify):
-        """Validate that responses are not cached for instructors."""
+        """Validate that only the serialized resource is cached for instructors."""
         video = VideoFactory(
             upload_state=random.choice([s[0] for s in STATE_CHOICES]),
             uploaded_on="2019-09-24 07:24:40+00",
@@ -151,12 +163,86 @@ class CacheLTIViewTestCase(TestCase):
         self.assertLess(elapsed, 0.1)
 
         # Calling the same resource a second time with the same LTI parameters
-        # should not hit the cache
-        with self.assertNumQueries(4):
+        # should still fetch the resource to check its portability but reuse
+        # its serialization
+        with self.assertNumQueries(1):
             elapsed, resource = self._fetch_lti_request(url, data)
         self.assertEqual(resource, resource_origin)
         self.assertLess(elapsed, 0.1)
 
+        # The serialization is shared by other instructors, even from another playlist
+        # to which the video is portable
+        video.playlist.is_portable_to_consumer_site = True
+        video.playlist.save()
+        resource_origin["playlist"] = resource["playlist"]
+        with self.assertNumQueries(4):
+            self._fetch_lti_request(url, data)
+        with self.assertNumQueries(1):
+            elapsed, resource = self._fetch_lti_request(
+                url, {**data, "context_id": "other_playlist", "user_id": "222"}
+            )
+        self.assertEqual(resource, resource_origin)
+
+        # Updating the video renews the cache
+        video.title = "new title"
+        video.save()
+        with self.assertNumQueries(4):
+            elapsed, resource = self._fetch_lti_request(url, data)
+        self.assertEqual(resource["title"], "new title")
+
+    @mock.patch.object(LTI, "verify")
+    @mock.patch.object(LTI, "get_consumer_site")
+    @override_switch(SENTRY, active=True)
+    @override_switch(TRANSCRIPTION, active=True)
+    def test_views_lti_cache_student_invalidation(
+        self, mock_get_consumer_site, mock_verify
+    ):
+        """Validate that responses cached for students are renewed when the video changes."""
+        video = VideoFactory(
+            upload_state=READY,
+            uploaded_on="2019-09-24 07:24:40+00",
+            resolutions=[144, 240],
+            transcode_pipeline=AWS_PIPELINE,
+        )
+        mock_get_consumer_site.return_value = video.playlist.consumer_site
+
+        url = f"/lti/videos/{video.pk}"
+        data = {
+            "resource_link_id": video.lti_id,
+            "context_id": video.playlist.lti_id,
+            "roles": "student",
+            "user_id": "111",
+        }
+
+        _elapsed, resource = self._fetch_lti_request(url, data)
+        self.assertIsNone(resource["thumbnail"])
+        self.assertEqual(resource["playlist"]["title"], video.playlist.title)
+
+        with self.assertNumQueries(0):
+            self._fetch_lti_request(url, data)
+
+        # Adding a thumbnail renews the cache
+        thumbnail = ThumbnailFactory(video=video)
+        _elapsed, resource = self._fetch_lti_request(url, data)
+        self.assertEqual(resource["thumbnail"]["id"], str(thumbnail.id))
+
+        # Adding a timed text track renews the cache
+        timed_text_track = TimedTextTrackFactory(video=video)
+        _elapsed, resource = self._fetch_lti_request(url, data)
+        self.assertEqual(
+            [track["id"] for track in resource["timed_text_tracks"]],
+            [str(timed_text_track.id)],
+        )
+
+        # Renaming the playlist renews the cache
+        video.playlist.title = "new playlist title"
+        video.playlist.save()
+        _elapsed, resource = self._fetch_lti_request(url, data)
+        self.assertEqual(resource["playlist"]["title"], "new playlist title")
+
+        with self.assertNumQueries(0):
+            self._fetch_lti_request(url, data)
+
     @override_switch(SENTRY, active=True)
     @override_switch(TRANSCRIPTION, active=True)
     def test_views_public_resource(self):
@@ -180,6 +266,13 @@ class CacheLTIViewTestCase(TestCase):
         self.assertEqual(resource_origin["id"], str(video.id))
         self.assertLess(elapsed, 0.1)
 
+        # Updating the video renews the cache
+        video.title = "new title"
+        video.save()
+        with self.assertNumQueries(4):
+            elapsed, resource = self._fetch_lti_request(url)
+        self.assertEqual(resource["title"], "new title")
+
     @override_switch(SENTRY, active=True)
     @override_switch(TRANSCRIPTION, active=True)
     def test_views_direct_access_lti_resource(self):
@@ -11,9 +11,11 @@ from django.conf import settings
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from marsha.core.defaults import ENDED, IDLE, JITSI
+from marsha.core.defaults import AWS_PIPELINE, ENDED, IDLE, JITSI, PENDING, READY
 from marsha.core.factories import DocumentFactory, PlaylistFactory, VideoFactory
+from marsha.core.lti import LTI
 from marsha.core.models import Playlist
+from marsha.core.simple_jwt.factories import InstructorOrAdminLtiTokenFactory
 from marsha.core.simple_jwt.tokens import LTISelectFormAccessToken, PlaylistAccessToken
 from marsha.core.tests.testing_utils import generate_passport_and_signed_lti_parameters
 
@@ -717,3 +719,85 @@ class SelectLTIViewTestCase(TestCase):
         self.assertIsNone(context.get("videos"))
         self.assertIsNone(context.get("webinars"))
         self.assertIsNone(context.get("documents"))
+
+    @mock.patch.object(LTI, "verify")
+    @mock.patch.object(LTI, "get_consumer_site")
+    def test_views_lti_select_cache(self, mock_get_consumer_site, mock_verify):
+        """Listings are cached until a resource of the listed playlists changes."""
+        lti_consumer_parameters = {
+            "roles": random.choice(["instructor", "administrator"]),
+            "content_item_return_url": "https://lti-consumer.site/lti",
+            "context_id": "sent_lti_context_id",
+            "title": "Sent LMS activity title",
+            "text": "Sent LMS activity text",
+        }
+        lti_parameters, passport = generate_passport_and_signed_lti_parameters(
+            url="http://testserver/lti/select/",
+            lti_parameters=lti_consumer_parameters,
+        )
+
+        playlist = PlaylistFactory(
+            lti_id=lti_parameters.get("context_id"),
+            consumer_site=passport.consumer_site,
+        )
+        video = VideoFactory(
+            playlist=playlist,
+            uploaded_on=timezone.now(),
+            resolutions=[144],
+            title="first title",
+            transcode_pipeline=AWS_PIPELINE,
+            upload_state=READY,
+        )
+        mock_get_consumer_site.return_value = passport.consumer_site
+
+        def get_videos_titles():
+            response = self.client.post(
+                "/lti/select/",
+                lti_parameters,
+                HTTP_REFERER="http://testserver",
+            )
+            self.assertEqual(response.status_code, 200)
+            match = re.search(
+                '<div id="marsha-frontend-data" data-context="(.*)">',
+                response.content.decode("utf-8"),
+            )
+            context = json.loads(unescape(match.group(1)))
+            return [
+                (video["title"], video["upload_state"])
+                for video in context.get("videos")
+            ]
+
+        self.assertEqual(get_videos_titles(), [("first title", READY)])
+
+        # Saving a resource of the playlist renews the listing
+        video.title = "second title"
+        video.save()
+        self.assertEqual(get_videos_titles(), [("second title", READY)])
+
+        # Initiating an upload resets the upload state without saving the instance,
+        # the listing is renewed all the same
+        jwt_token = InstructorOrAdminLtiTokenFactory(playlist=playlist)
+        response = self.client.post(
+            f"/api/videos/{video.id}/initiate-upload/",
+            {"filename": "video_file", "mimetype": "", "size": 100},
+            HTTP_AUTHORIZATION=f"Bearer {jwt_token}",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_videos_titles(), [("second title", PENDING)])
+
+        # A resource added to the playlist is listed right away
+        VideoFactory(
+            playlist=playlist,
+            uploaded_on=timezone.now(),
+            resolutions=[144],
+            title="third title",
+            transcode_pipeline=AWS_PIPELINE,
+            upload_state=READY,
+        )
+        self.assertCountEqual(
+            get_videos_titles(), [("second title", PENDING), ("third title", READY)]
+        )
+
+        # Deleting a resource renews the listing too
+        video.delete()
+        self.assertEqual(get_videos_titles(), [("third title", READY)])
@@ -0,0 +1,151 @@
+"""Utils to cache the app data served to the frontend."""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+APP_DATA_VERSION_CACHE_KEY = "app_data|version|{resource_id}"
+APP_DATA_PLAYLIST_CACHE_KEY = "app_data|playlist|{resource_id}"
+APP_DATA_PLAYLIST_VERSION_CACHE_KEY = "app_data|playlist_version|{playlist_id}"
+APP_DATA_LOCK_TIMEOUT = 30  # seconds
+APP_DATA_LOCK_POLL_INTERVAL = 0.1  # seconds
+APP_DATA_LOCK_POLL_COUNT = 20
+
+
+def _get_or_add_version(cache_key, version=None):
+    """Get a version from the cache, adding a new one when it is missing."""
+    if version is None:
+        version = uuid.uuid4().hex
+        # Another request may have set the version meanwhile, keep the first one
+        if not cache.add(cache_key, version, None):
+            version = cache.get(cache_key, version)
+
+    return version
+
+
+def get_app_data_version(resource_id):
+    """Get the current version of the app data cached for a resource.
+
+    Parameters
+    ----------
+    resource_id : Type[uuid.UUID]
+        The resource served by the view.
+
+    Returns
+    -------
+    string
+        A version renewed each time the resource, one of the objects it is
+        serialized with or its playlist changes.
+    """
+    version_key = APP_DATA_VERSION_CACHE_KEY.format(resource_id=resource_id)
+    playlist_key = APP_DATA_PLAYLIST_CACHE_KEY.format(resource_id=resource_id)
+    cached = cache.get_many([version_key, playlist_key])
+
+    version = _get_or_add_version(version_key, cached.get(version_key))
+
+    # The playlist of the resource is known once the resource has been saved
+    if (playlist_id := cached.get(playlist_key)) is None:
+        return version
+
+    playlist_version_key = APP_DATA_PLAYLIST_VERSION_CACHE_KEY.format(
+        playlist_id=playlist_id
+    )
+    playlist_version = _get_or_add_version(
+        playlist_version_key, cache.get(playlist_version_key)
+    )
+    return f"{version}.{playlist_version}"
+
+
+def invalidate_app_data_cache(resource_id, playlist_id=None):
+    """Make the app data cached for a resource stale.
+
+    Parameters
+    ----------
+    resource_id : Type[uuid.UUID]
+        The resource whose serialized representation changed.
+    playlist_id : Type[uuid.UUID]
+        The playlist of the resource, its changes will make the app data stale too.
+    """
+    versions = {
+        APP_DATA_VERSION_CACHE_KEY.format(resource_id=resource_id): uuid.uuid4().hex
+    }
+    if playlist_id is not None:
+        versions[APP_DATA_PLAYLIST_CACHE_KEY.format(resource_id=resource_id)] = (
+            playlist_id
+        )
+
+    cache.set_many(versions, None)
+
+
+def invalidate_playlist_app_data_cache(playlist_id):
+    """Make the app data cached for all the resources of a playlist stale.
+
+    Parameters
+    ----------
+    playlist_id : Type[uuid.UUID]
+        The playlist which changed.
+    """
+    cache.set(
+        APP_DATA_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist_id),
+        uuid.uuid4().hex,
+        None,
+    )
+
+
+def get_or_compute_app_data(cache_key, compute):
+    """Get app data from the cache, computing it once when it is missing or expired.
+
+    Cached data is fresh for `APP_DATA_CACHE_DURATION` seconds, then it is served
+    stale for `APP_DATA_CACHE_STALE_DURATION` more seconds to the concurrent requests
+    while a single request computes it again. When the data is missing, concurrent
+    requests wait for the one computing it instead of all running `compute`.
+
+    Cache keys are expected to embed the version of the resource (see
+    `get_app_data_version`) so an updated resource is never served stale.
+
+    Parameters
+    ----------
+    cache_key : string
+        The key under which the data is cached.
+    compute : Callable
+        Called without argument to compute the data when needed.
+
+    Returns
+    -------
+    The cached or computed data.
+    """
+    cached = cache.get(cache_key)
+    if cached is not None:
+        fresh_until, data = cached
+        if fresh_until > time.time():
+            return data
+
+    lock_key = f"{cache_key}|lock"
+    if not cache.add(lock_key, "1", APP_DATA_LOCK_TIMEOUT):
+        # Another request is already computing the data
+        if cached is not None:
+            return cached[1]
+
+        for _i in range(APP_DATA_LOCK_POLL_COUNT):
+            time.sleep(APP_DATA_LOCK_POLL_INTERVAL)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached[1]
+
+        # The other request is too slow or failed, don't wait any longer
+        return compute()
+
+    try:
+        data = compute()
+        cache.set(
+            cache_key,
+            (time.time() + settings.APP_DATA_CACHE_DURATION, data),
+            settings.APP_DATA_CACHE_DURATION + settings.APP_DATA_CACHE_STALE_DURATION,
+        )
+    finally:
+        cache.delete(lock_key)
+
+    return data
@@ -1,11 +1,17 @@
 """Utils for working with lti_select modules."""
 
 from functools import cache
+from hashlib import sha256
+import uuid
 
 import django
+from django.core.cache import cache as django_cache
 from django.utils.module_loading import import_string
 
 
+LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY = "lti_select|playlist_version|{playlist_id}"
+
+
 @cache
 def get_lti_select_resources():
     """Look for all available lti select resources."""
@@ -28,3 +34,63 @@ def get_lti_select_resources():
     flatten_result = [item for sublist in result for item in sublist]
 
     return {config["name"]: config for config in flatten_result}
+
+
+def invalidate_lti_select_cache(playlist_id):
+    """Invalidate the cached LTI select listings including resources from a playlist.
+
+    Listings cache keys embed the version of each playlist they list resources from,
+    renewing the version of the playlist is enough to make all of them stale.
+
+    Parameters
+    ----------
+    playlist_id : Type[uuid.UUID]
+        The playlist whose resources changed.
+    """
+    django_cache.set(
+        LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist_id),
+        uuid.uuid4().hex,
+        None,
+    )
+
+
+def get_lti_select_cache_key(resource_kind, playlist_ids, *keys):
+    """Build the cache key of an LTI select listing.
+
+    Parameters
+    ----------
+    resource_kind : string
+        The name of the lti select resource, as found in `get_lti_select_resources`.
+    playlist_ids : List[uuid.UUID]
+        The playlists the listing fetches resources from.
+    keys : List
+        Extra context the listing depends on (consumer site, context id, base url...)
+
+    Returns
+    -------
+    string
+        A cache key changing each time a resource of one of the playlists changes.
+    """
+    version_keys = {
+        LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist_id): str(
+            playlist_id
+        )
+        for playlist_id in playlist_ids
+    }
+    versions = django_cache.get_many(version_keys.keys())
+
+    # A missing version must not fall back to a listing cached before its eviction
+    missing_versions = {
+        key: uuid.uuid4().hex for key in version_keys if key not in versions
+    }
+    if missing_versions:
+        django_cache.set_many(missing_versions, None)
+        versions.update(missing_versions)
+
+    digest = sha256(
+        "|".join(
+            f"{version_keys[key]}:{versions[key]}" for key in sorted(version_keys)
+        ).encode()
+    ).hexdigest()
+
+    return "|".join(str(key) for key in ("lti_select", resource_kind, *keys, digest))
@@ -5,4 +5,5 @@ from .medialive_action_utils import *  # noqa isort:skip
 from .medialive_client_utils import *  # noqa isort:skip
 from .medialive_create_utils import *  # noqa isort:skip
 from .medialive_delete_utils import *  # noqa isort:skip
+from .medialive_inventory_utils import *  # noqa isort:skip
 from .medialive_list_utils import *  # noqa isort:skip
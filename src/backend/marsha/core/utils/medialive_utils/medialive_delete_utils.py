@@ -40,9 +40,15 @@ def delete_aws_element_stack(video):
         capture_exception(exception)
 
 
-def delete_mediapackage_channel(channel_id):
-    """Delete a mediapackage channel and related endpoints."""
-    origin_endpoints = list_mediapackage_channel_origin_endpoints(channel_id=channel_id)
+def delete_mediapackage_channel(channel_id, origin_endpoints=None):
+    """Delete a mediapackage channel and related endpoints.
+
+    The endpoints of the channel are listed unless they were listed beforehand.
+    """
+    if origin_endpoints is None:
+        origin_endpoints = list_mediapackage_channel_origin_endpoints(
+            channel_id=channel_id
+        )
     deleted_endpoints = []
     for origin_endpoint in origin_endpoints:
         mediapackage_client.delete_origin_endpoint(Id=origin_endpoint.get("Id"))
@@ -0,0 +1,118 @@
+"""Utils to inventory the AWS elemental resources in housekeeping commands."""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+from marsha.core.models import Video
+from marsha.core.utils.medialive_utils.medialive_client_utils import mediapackage_client
+from marsha.core.utils.medialive_utils.medialive_list_utils import _get_items
+
+
+AWS_ELEMENTAL_WORKERS = 8
+AWS_ELEMENTAL_COMMAND_LOCK_TIMEOUT = 3600  # 1 hour
+
+
+def list_environment_medialive_channels(medialive_channels):
+    """
+    Pair the medialive channels of the current environment with their live.
+
+    Parameters
+    ----------
+    medialive_channels : list
+        The medialive channels, as listed by `list_medialive_channels`.
+
+    Returns
+    -------
+    list
+        A tuple for each channel tagged with the current environment, holding the channel,
+        the primary key of its live and the live itself, or None if it does not exist.
+        All the lives are loaded in a single query.
+    """
+    channels = []
+    for medialive_channel in medialive_channels:
+        # Don't work with stack not belonging to the current environment
+        if (
+            medialive_channel.get("Tags", {}).get("environment")
+            != settings.AWS_BASE_NAME
+        ):
+            continue
+
+        # the channel name contains the environment, the primary key and the created_at
+        # stamp. Here we want to use the primary key
+        _environment, live_pk, _stamp = medialive_channel["Name"].split("_")
+        channels.append((medialive_channel, live_pk))
+
+    lives = {
+        str(live.pk): live
+        for live in Video.objects.filter(
+            pk__in=[live_pk for _channel, live_pk in channels]
+        )
+    }
+    return [
+        (medialive_channel, live_pk, lives.get(live_pk))
+        for medialive_channel, live_pk in channels
+    ]
+
+
+def _index_by_channel(items):
+    """Index mediapackage items by the id of their channel."""
+    indexed_items = defaultdict(list)
+    for item in items:
+        indexed_items[item.get("ChannelId")].append(item)
+    return indexed_items
+
+
+def list_indexed_mediapackage_harvest_jobs():
+    """List all harvest jobs once, indexed by the id of their mediapackage channel."""
+    return _index_by_channel(
+        _get_items(mediapackage_client.list_harvest_jobs, items_key="HarvestJobs")
+    )
+
+
+def list_indexed_mediapackage_origin_endpoints():
+    """List all origin endpoints once, indexed by the id of their mediapackage channel."""
+    return _index_by_channel(
+        _get_items(
+            mediapackage_client.list_origin_endpoints, items_key="OriginEndpoints"
+        )
+    )
+
+
+def run_concurrently(function, items):
+    """
+    Call a function on each item in a bounded pool of threads.
+
+    Only AWS calls must run in the pool, the database is used from the calling thread.
+
+    Returns
+    -------
+    list
+        The results of the function, in the order of the items.
+    """
+    with ThreadPoolExecutor(max_workers=AWS_ELEMENTAL_WORKERS) as executor:
+        return list(executor.map(function, items))
+
+
+@contextmanager
+def exclusive_command(name):
+    """
+    Prevent two runs of a housekeeping command from overlapping.
+
+    Yields
+    ------
+    bool
+        True if the command can run, False if another run is in progress.
+    """
+    lock_key = f"aws_elemental_command:{name}"
+    if not cache.add(lock_key, "1", AWS_ELEMENTAL_COMMAND_LOCK_TIMEOUT):
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        cache.delete(lock_key)
@@ -0,0 +1,64 @@
+"""Utils to probe video files with ffprobe."""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+import ffmpeg
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of bytes ffprobe reads to analyze the streams of a file. Over HTTP,
+# it fetches the headers it needs with range requests instead of the whole file.
+PROBE_SIZE = 5 * 2**20
+PROBE_WORKERS = 10
+
+
+def probe(url):
+    """Probe a video file, reading at most `PROBE_SIZE` bytes of it.
+
+    Parameters
+    ----------
+    url : str
+        The url or path of the video file.
+
+    Returns
+    -------
+    dict
+        The format and streams of the file as returned by ffprobe.
+    """
+    return ffmpeg.probe(url, probesize=PROBE_SIZE)
+
+
+def probe_many(urls, workers=PROBE_WORKERS):
+    """Probe video files concurrently, with at most `workers` probes at once.
+
+    Parameters
+    ----------
+    urls : Iterable[str]
+        The urls or paths of the video files.
+    workers : int
+        The maximum number of probes running at once.
+
+    Returns
+    -------
+    dict
+        The probe of each url, None for the files that could not be probed.
+    """
+    urls = list(urls)
+
+    def safe_probe(url):
+        try:
+            return probe(url)
+        except ffmpeg.Error as error:
+            logger.warning("Probing %s failed: %s", url, error.stderr)
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(urls, executor.map(safe_probe, urls)))
+
+
+def get_format_information(probe_result):
+    """Return the duration and size of a file from its probe."""
+    video_format = probe_result.get("format", {})
+    return {"duration": video_format.get("duration"), "size": video_format.get("size")}
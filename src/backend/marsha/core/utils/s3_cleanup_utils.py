@@ -0,0 +1,150 @@
+"""Utils to delete or move all the objects under many prefixes of an S3 bucket."""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import queue
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+LIST_WORKERS = 4
+BATCH_WORKERS = 8
+# delete_objects accepts at most 1000 keys, moves are spread over smaller batches
+# because each of their objects is copied before the batch is deleted
+DELETE_BATCH_SIZE = 1000
+MOVE_BATCH_SIZE = 100
+
+
+class S3PrefixCleanup:
+    """
+    Delete, or move to a destination folder, all the objects under many prefixes.
+
+    The prefixes are listed concurrently and the keys they hold are coalesced into
+    shared batches, processed concurrently while the listing goes on: a batch is
+    copied to the destination folder if any, then removed with a single
+    `delete_objects` request.
+
+    The progress of the cleanup is kept in `progress`, a dict counting the prefixes
+    listed, and the objects listed, copied, deleted or in error. It is passed to
+    `on_progress` after each batch.
+    """
+
+    def __init__(self, s3_client, bucket_name, destination=None, on_progress=None):
+        """Prepare a cleanup of `bucket_name` moving its objects to `destination`."""
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.destination = destination
+        self.on_progress = on_progress
+        self.batch_size = MOVE_BATCH_SIZE if destination else DELETE_BATCH_SIZE
+        self.progress = {
+            "prefixes": 0,
+            "listed": 0,
+            "copied": 0,
+            "deleted": 0,
+            "errors": 0,
+        }
+        self._lock = threading.Lock()
+
+    def run(self, prefixes):
+        """
+        Clean up all the objects under the prefixes.
+
+        Parameters
+        ----------
+        prefixes : Iterable[str]
+            The prefixes of the objects to delete or move.
+
+        Returns
+        -------
+        dict
+            The progress of the cleanup once completed.
+        """
+        prefixes = list(prefixes)
+        # Bounded, so that the listing waits for the batches instead of holding
+        # the keys of huge prefixes in memory
+        pages = queue.Queue(maxsize=2 * BATCH_WORKERS)
+        with ThreadPoolExecutor(
+            max_workers=LIST_WORKERS
+        ) as list_executor, ThreadPoolExecutor(
+            max_workers=BATCH_WORKERS
+        ) as batch_executor:
+            listings = [
+                list_executor.submit(self._list_prefix, prefix, pages)
+                for prefix in prefixes
+            ]
+
+            batches = []
+            keys = []
+            remaining_listings = len(prefixes)
+            while remaining_listings:
+                page = pages.get()
+                if page is None:
+                    remaining_listings -= 1
+                    continue
+                keys.extend(page)
+                while len(keys) >= self.batch_size:
+                    batches.append(
+                        batch_executor.submit(
+                            self._process_batch, keys[: self.batch_size]
+                        )
+                    )
+                    keys = keys[self.batch_size :]  # noqa: E203
+            if keys:
+                batches.append(batch_executor.submit(self._process_batch, keys))
+
+            # Raise the errors of the listings and of the batches
+            for future in listings + batches:
+                future.result()
+
+        return self.progress
+
+    def _list_prefix(self, prefix, pages):
+        """Put the keys of each page listed under a prefix in the pages queue."""
+        try:
+            params = {"Bucket": self.bucket_name, "Prefix": prefix}
+            while True:
+                data = self.s3_client.list_objects_v2(**params)
+                page = [s3_object["Key"] for s3_object in data.get("Contents", [])]
+                if page:
+                    self._count("listed", len(page))
+                    pages.put(page)
+                if not data.get("IsTruncated"):
+                    break
+                params["ContinuationToken"] = data["NextContinuationToken"]
+            self._count("prefixes", 1)
+        finally:
+            # Always signal the end of the listing, the cleanup would wait forever
+            pages.put(None)
+
+    def _process_batch(self, keys):
+        """Copy a batch of objects to the destination if any, then delete them."""
+        if self.destination:
+            for key in keys:
+                self.s3_client.copy(
+                    {"Bucket": self.bucket_name, "Key": key},
+                    self.bucket_name,
+                    f"{self.destination}/{key}",
+                )
+            self._count("copied", len(keys))
+
+        response = self.s3_client.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={"Objects": [{"Key": key} for key in keys]},
+        )
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.error(
+                "Deleting %s failed: %s", error.get("Key"), error.get("Message")
+            )
+        self._count("errors", len(errors))
+        self._count("deleted", len(keys) - len(errors))
+
+        if self.on_progress:
+            with self._lock:
+                self.on_progress(dict(self.progress))
+
+    def _count(self, metric, value):
+        """Increase a metric of the progress, from any thread."""
+        with self._lock:
+            self.progress[metric] += value
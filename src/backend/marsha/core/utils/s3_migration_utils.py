@@ -0,0 +1,171 @@
+"""Utils to migrate the S3 objects of model instances in bulk."""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import posixpath
+
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+COPY_WORKERS = 10
+# copy_object is limited to 5GB, larger objects are copied in parts
+MULTIPART_COPY_THRESHOLD = 1024 * 2**20  # 1GB
+MULTIPART_COPY_PART_SIZE = 256 * 2**20  # 256MB
+
+
+class S3ObjectMigration:
+    """
+    Copy the S3 objects of model instances to new keys, in bulk.
+
+    Instances are processed by batches, in primary key order. For each batch:
+    - the instances are prepared and the fields they changed are saved with a
+      single `bulk_update`,
+    - the folders of the destination keys are listed once, concurrently, to skip
+      the objects already copied and learn the size of the sources,
+    - the missing objects are copied concurrently, in parts when they are too large
+      for a single copy,
+    - the last primary key processed is checkpointed in the cache, a migration
+      interrupted resumes after it.
+    """
+
+    def __init__(self, name, s3_client, bucket):
+        """Prepare the migration `name` of objects of `bucket` with `s3_client`."""
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.checkpoint_key = f"s3_object_migration:{name}"
+
+    def reset(self):
+        """Forget the checkpoint to start the migration again from the first instance."""
+        cache.delete(self.checkpoint_key)
+
+    def run(self, queryset, prepare, update_fields, batch_size=100):
+        """
+        Migrate the objects of the instances of a queryset.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            The instances whose objects are copied.
+        prepare : Callable
+            Called with each instance, it returns a tuple with the source and the
+            destination keys of its object, or None if it has nothing to copy. It may
+            change the `update_fields` of the instance.
+        update_fields : List[str]
+            The fields saved for the instances changed by `prepare`.
+        batch_size : int
+            The number of instances processed at once.
+        """
+        checkpoint = cache.get(self.checkpoint_key)
+        queryset = queryset.order_by("pk")
+        if checkpoint is not None:
+            logger.info("Resuming after %s", checkpoint)
+            queryset = queryset.filter(pk__gt=checkpoint)
+
+        batch = []
+        for instance in queryset.iterator(chunk_size=batch_size):
+            batch.append(instance)
+            if len(batch) == batch_size:
+                self._migrate_batch(batch, prepare, update_fields)
+                batch = []
+        if batch:
+            self._migrate_batch(batch, prepare, update_fields)
+
+        cache.delete(self.checkpoint_key)
+
+    def _migrate_batch(self, instances, prepare, update_fields):
+        """Save the changes of a batch of instances and copy their objects."""
+        copies = []
+        changed_instances = []
+        for instance in instances:
+            values = [getattr(instance, field) for field in update_fields]
+            copy = prepare(instance)
+            if copy:
+                copies.append(copy)
+            if values != [getattr(instance, field) for field in update_fields]:
+                changed_instances.append(instance)
+
+        if changed_instances:
+            queryset = type(instances[0]).objects
+            queryset.bulk_update(changed_instances, update_fields)
+
+        self.copy(copies)
+        cache.set(self.checkpoint_key, instances[-1].pk, None)
+
+    def copy(self, copies):
+        """Copy concurrently the objects whose destination key does not exist yet.
+
+        Parameters
+        ----------
+        copies : List[Tuple[str, str]]
+            The source and destination keys of each object.
+        """
+        folders = {posixpath.dirname(destination) + "/" for _, destination in copies}
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            sizes = {}
+            for folder_sizes in executor.map(self._list_sizes, folders):
+                sizes.update(folder_sizes)
+
+            missing_copies = []
+            for source, destination in copies:
+                if destination in sizes:
+                    logger.info("Object %s already exists", destination)
+                elif source not in sizes:
+                    logger.warning("Object %s does not exist", source)
+                else:
+                    missing_copies.append((source, destination, sizes[source]))
+
+            # Consume the results to raise the errors of the copies
+            list(executor.map(lambda copy: self._copy_object(*copy), missing_copies))
+
+    def _list_sizes(self, prefix):
+        """List the keys under a prefix, with the size of their object."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return {
+            item["Key"]: item["Size"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for item in page.get("Contents", [])
+        }
+
+    def _copy_object(self, source, destination, size):
+        """Copy an object, in parts if it is too large for a single copy."""
+        logger.info("Copying %s to %s", source, destination)
+        copy_source = {"Bucket": self.bucket, "Key": source}
+        if size <= MULTIPART_COPY_THRESHOLD:
+            self.s3_client.copy_object(
+                Bucket=self.bucket, CopySource=copy_source, Key=destination
+            )
+            return
+
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket, Key=destination
+        )["UploadId"]
+        try:
+            parts = []
+            for number, start in enumerate(
+                range(0, size, MULTIPART_COPY_PART_SIZE), start=1
+            ):
+                end = min(start + MULTIPART_COPY_PART_SIZE, size) - 1
+                response = self.s3_client.upload_part_copy(
+                    Bucket=self.bucket,
+                    Key=destination,
+                    CopySource=copy_source,
+                    CopySourceRange=f"bytes={start}-{end}",
+                    PartNumber=number,
+                    UploadId=upload_id,
+                )
+                parts.append(
+                    {"ETag": response["CopyPartResult"]["ETag"], "PartNumber": number}
+                )
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=destination,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=destination, UploadId=upload_id
+            )
+            raise
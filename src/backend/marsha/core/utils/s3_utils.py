@@ -7,6 +7,8 @@ from django.conf import settings
 import boto3
 from botocore.client import Config
 
+from marsha.core.utils.s3_cleanup_utils import S3PrefixCleanup
+
 
 def get_aws_s3_client():
     """Return a boto3 s3 client connected to AWS."""
@@ -143,23 +145,30 @@ def move_s3_directory(
         `/` at the end.
         s3_client (boto3.client): The type of client to use.
         bucket_name (str): The name of the bucket.
+
+    Returns:
+        dict: The progress of the move, see `S3PrefixCleanup`.
     """
-    s3_client = get_s3_client(client_type)
+    return move_s3_directories([key], destination, client_type, bucket_name)
 
-    # First, we ned to get the list of objects in the folder
-    objects = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=key)
 
-    if "Contents" not in objects:
-        # No need to copy or delete anything
-        return
+def move_s3_directories(
+    keys: list, destination: str, client_type: ClientType, bucket_name: str
+):
+    """
+    Move the content of many directories to a "destination" folder in an S3 bucket.
+    Their objects are coalesced into shared batches of copies and deletions.
 
-    # Second, we need to copy each object to the "to_delete" folder
-    for obj in objects["Contents"]:
-        copy_source = {"Bucket": bucket_name, "Key": obj["Key"]}
-        s3_client.copy(copy_source, bucket_name, f"{destination}/{obj['Key']}")
+    Parameters:
+        keys (list): The keys of the folders in the S3 bucket.
+        destination (str): The destination folder in the S3 bucket without a
+        `/` at the end.
+        client_type (ClientType): The type of client to use.
+        bucket_name (str): The name of the bucket.
 
-    # Finally, we need to bulk delete each files in the folder
-    s3_client.delete_objects(
-        Bucket=bucket_name,
-        Delete={"Objects": [{"Key": obj["Key"]} for obj in objects["Contents"]]},
+    Returns:
+        dict: The progress of the move, see `S3PrefixCleanup`.
+    """
+    return S3PrefixCleanup(get_s3_client(client_type), bucket_name, destination).run(
+        keys
     )
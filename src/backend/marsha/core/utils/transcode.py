@@ -15,6 +15,32 @@ from marsha.core.signals import signal_object_uploaded
 from marsha.core.utils.time_utils import to_datetime
 
 
+def get_transcoded_video_information(transcoded_video: TranscodedVideo):
+    """
+    Return the duration and size of a video from the results of the Peertube runners.
+
+    Parameters
+    ----------
+    transcoded_video : Type[TranscodedVideo]
+        The transcoded video, its streaming playlist files can be prefetched.
+
+    Returns
+    -------
+    dict
+        The duration in seconds of the video and the size of its file in the highest
+        resolution, the one served for download.
+    """
+    highest_file = max(
+        transcoded_video.streamingPlaylist.videoFiles.all(),
+        key=lambda video_file: video_file.resolution,
+        default=None,
+    )
+    return {
+        "duration": transcoded_video.duration or None,
+        "size": highest_file.size if highest_file else None,
+    }
+
+
 def transcoding_ended_callback(transcoded_video: TranscodedVideo):
     """
     Callback used when a Peertube runner has finished
@@ -45,7 +71,11 @@ def transcoding_ended_callback(transcoded_video: TranscodedVideo):
         x.resolution for x in transcoded_video.streamingPlaylist.videoFiles.all()
     ]
     video.transcode_pipeline = PEERTUBE_PIPELINE
-    video.save(update_fields=["transcode_pipeline"])
+    # Duration and size come from the runner results, the files are never probed
+    information = get_transcoded_video_information(transcoded_video)
+    video.duration = information["duration"]
+    video.size = information["size"]
+    video.save(update_fields=["transcode_pipeline", "duration", "size"])
 
     video.update_upload_state(
         READY,
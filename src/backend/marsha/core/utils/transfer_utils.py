@@ -0,0 +1,269 @@
+"""Utils to transfer remote files to the Marsha S3 storage in parallel parts."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from botocore.exceptions import ClientError
+import requests
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+
+logger = logging.getLogger(__name__)
+
+# S3 refuses parts smaller than 5 MiB, except for the last one
+MIN_PART_SIZE = 5 * 2**20
+PART_ATTEMPTS = 3
+PART_RETRY_DELAY = 1  # seconds, multiplied by the attempt number
+CHECKPOINT_TIMEOUT = 24 * 3600  # 1 day
+
+
+class TransferError(Exception):
+    """Error raised when a part of a remote file can not be transferred."""
+
+
+def supports_multipart_transfer(storage, response):
+    """Check if a remote file can be transferred in parts to the storage.
+
+    Parameters
+    ----------
+    storage : Storage
+        The storage where the file is saved, only S3 storages support multipart uploads.
+    response : requests.Response
+        The streamed response of the remote file, its headers must advertise byte ranges
+        and a size larger than one part.
+
+    Returns
+    -------
+    bool
+        True if the file must be transferred with a `MultipartTransfer`.
+    """
+    try:
+        size = int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return False
+
+    return (
+        isinstance(storage, S3Storage)
+        and response.headers.get("Accept-Ranges") == "bytes"
+        and size > get_part_size()
+    )
+
+
+def get_part_size():
+    """Return the size of the parts transferred, S3 refuses parts smaller than 5 MiB."""
+    return max(settings.RECORDING_TRANSFER_PART_SIZE, MIN_PART_SIZE)
+
+
+class MultipartTransfer:
+    """
+    Transfer a remote file to an S3 storage with HTTP range requests.
+
+    Parts are downloaded and uploaded concurrently to an S3 multipart upload. Completed
+    parts are checkpointed in the cache: when the transfer is interrupted, for example by
+    a worker restart, running it again resumes the same multipart upload and only
+    transfers the missing parts. Progress and throughput are logged and kept in the
+    checkpoint along the way.
+    """
+
+    def __init__(self, storage, name, response):
+        """Prepare the transfer to `name` of the file streamed by `response`.
+
+        The range requests are sent to the url of the response, with its cookie.
+        """
+        self.storage = storage
+        # pylint: disable=protected-access
+        self.key = storage._normalize_name(clean_name(name))
+        self.url = response.url
+        self.size = int(response.headers["Content-Length"])
+        cookie = response.request.headers.get("Cookie")
+        self.headers = {"Cookie": cookie} if cookie else {}
+        self.part_size = get_part_size()
+        self.checkpoint_key = f"multipart_transfer:{storage.bucket_name}:{self.key}"
+
+    @property
+    def client(self):
+        """The S3 client of the storage, it can be shared between threads."""
+        return self.storage.connection.meta.client
+
+    @property
+    def parts_count(self):
+        """Number of parts of the file."""
+        return math.ceil(self.size / self.part_size)
+
+    def run(self):
+        """Transfer the missing parts and complete the multipart upload."""
+        checkpoint = self._get_checkpoint()
+        missing_parts = [
+            number
+            for number in range(1, self.parts_count + 1)
+            if number not in checkpoint["parts"]
+        ]
+        logger.info(
+            "Transferring %s parts of %s to %s, %s already transferred.",
+            len(missing_parts),
+            self.url,
+            self.key,
+            len(checkpoint["parts"]),
+        )
+
+        started_at = time.monotonic()
+        transferred = 0
+        with ThreadPoolExecutor(
+            max_workers=settings.RECORDING_TRANSFER_CONCURRENCY
+        ) as executor:
+            futures = {
+                executor.submit(self._transfer_part, checkpoint["upload_id"], number): (
+                    number
+                )
+                for number in missing_parts
+            }
+            try:
+                # The checkpoint is only updated from the calling thread
+                for future in as_completed(futures):
+                    number = futures[future]
+                    checkpoint["parts"][number] = future.result()
+                    transferred += self._get_part_length(number)
+                    self._save_progress(
+                        checkpoint, transferred, time.monotonic() - started_at
+                    )
+            except Exception as error:
+                for future in futures:
+                    future.cancel()
+                self._forget_expired_upload(error)
+                raise
+
+        self._complete(checkpoint)
+
+    def _get_checkpoint(self):
+        """Return the checkpoint of a previous transfer or start a new multipart upload."""
+        checkpoint = cache.get(self.checkpoint_key)
+        if checkpoint:
+            if (checkpoint["size"], checkpoint["part_size"]) == (
+                self.size,
+                self.part_size,
+            ):
+                return checkpoint
+            # The remote file or the part size changed, its parts can not be reused
+            self._abort(checkpoint["upload_id"])
+
+        upload = self.client.create_multipart_upload(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            # pylint: disable=protected-access
+            **self.storage._get_write_parameters(self.key),
+        )
+        checkpoint = {
+            "upload_id": upload["UploadId"],
+            "size": self.size,
+            "part_size": self.part_size,
+            "parts": {},
+        }
+        cache.set(self.checkpoint_key, checkpoint, CHECKPOINT_TIMEOUT)
+        return checkpoint
+
+    def _get_part_length(self, number):
+        """Return the length in bytes of a part, the last one may be shorter."""
+        return min(self.part_size, self.size - (number - 1) * self.part_size)
+
+    def _download_part(self, number):
+        """Download a part of the remote file with a range request, retrying on errors."""
+        start = (number - 1) * self.part_size
+        length = self._get_part_length(number)
+        headers = {**self.headers, "Range": f"bytes={start}-{start + length - 1}"}
+
+        for attempt in range(1, PART_ATTEMPTS + 1):
+            try:
+                response = requests.get(
+                    self.url,
+                    headers=headers,
+                    timeout=settings.RECORDING_TRANSFER_TIMEOUT,
+                )
+                response.raise_for_status()
+                if response.status_code != 206 or len(response.content) != length:
+                    raise TransferError(
+                        f"Part {number} of {self.url} was not served as requested."
+                    )
+                return response.content
+            except (requests.RequestException, TransferError) as error:
+                if attempt == PART_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "Downloading part %s of %s failed, retrying: %s",
+                    number,
+                    self.url,
+                    error,
+                )
+                time.sleep(PART_RETRY_DELAY * attempt)
+
+        # Not reachable, the last attempt returns or raises
+        raise TransferError(f"Part {number} of {self.url} was not downloaded.")
+
+    def _transfer_part(self, upload_id, number):
+        """Download a part and upload it to the multipart upload, return its ETag."""
+        response = self.client.upload_part(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=self._download_part(number),
+        )
+        return response["ETag"]
+
+    def _save_progress(self, checkpoint, transferred, duration):
+        """Checkpoint the completed parts and report the progress of the transfer."""
+        checkpoint["transferred"] = sum(
+            self._get_part_length(number) for number in checkpoint["parts"]
+        )
+        checkpoint["throughput"] = transferred / duration if duration else None
+        cache.set(self.checkpoint_key, checkpoint, CHECKPOINT_TIMEOUT)
+        logger.info(
+            "%s: %s/%s parts transferred (%.1f%%, %.1f MiB/s).",
+            self.key,
+            len(checkpoint["parts"]),
+            self.parts_count,
+            checkpoint["transferred"] * 100 / self.size,
+            (checkpoint["throughput"] or 0) / 2**20,
+        )
+
+    def _complete(self, checkpoint):
+        """Assemble the parts in the destination file and forget the checkpoint."""
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=self.storage.bucket_name,
+                Key=self.key,
+                UploadId=checkpoint["upload_id"],
+                MultipartUpload={
+                    "Parts": [
+                        {"ETag": checkpoint["parts"][number], "PartNumber": number}
+                        for number in sorted(checkpoint["parts"])
+                    ]
+                },
+            )
+        except ClientError as error:
+            self._forget_expired_upload(error)
+            raise
+        cache.delete(self.checkpoint_key)
+
+    def _forget_expired_upload(self, error):
+        """Forget the checkpoint of an expired upload, the next run starts it again."""
+        if (
+            isinstance(error, ClientError)
+            and error.response.get("Error", {}).get("Code") == "NoSuchUpload"
+        ):
+            cache.delete(self.checkpoint_key)
+
+    def _abort(self, upload_id):
+        """Abort a multipart upload, its parts are not billed anymore."""
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.storage.bucket_name, Key=self.key, UploadId=upload_id
+            )
+        except ClientError as error:
+            logger.warning("Aborting upload %s failed: %s", upload_id, error)
+        cache.delete(self.checkpoint_key)
@@ -57,6 +57,7 @@ from marsha.core.lti.utils import (
     ResourceException,
     get_or_create_resource,
     get_resource_closest_owners_and_playlist,
+    get_selectable_playlist_ids,
     get_selectable_resources,
 )
 from marsha.core.models import (
@@ -77,7 +78,14 @@ from marsha.core.simple_jwt.tokens import (
     LTIUserToken,
     PlaylistRefreshToken,
 )
-from marsha.core.utils.lti_select_utils import get_lti_select_resources
+from marsha.core.utils.app_data_utils import (
+    get_app_data_version,
+    get_or_compute_app_data,
+)
+from marsha.core.utils.lti_select_utils import (
+    get_lti_select_cache_key,
+    get_lti_select_resources,
+)
 
 
 # pylint: disable=too-many-lines,too-many-locals
@@ -400,7 +408,11 @@ class BaseLTIView(BaseModelResourceView, ABC):
 
     @property
     def cache_key(self):
-        """Cache key from view context."""
+        """Cache key from view context.
+
+        Students launches are served from the cache without fetching the resource,
+        the key includes the LTI context from which the resource was reached.
+        """
 
         return self.build_cache_key(
             "app_data",
@@ -408,6 +420,21 @@ class BaseLTIView(BaseModelResourceView, ABC):
             self.lti.get_consumer_site().domain,
             self.lti.context_id,
             self.lti.resource_id,
+            get_app_data_version(self.lti.resource_id),
+        )
+
+    def get_instructor_cache_key(self, resource):
+        """Cache key of a resource serialized for instructors and administrators.
+
+        The resource is always fetched for instructors, which checks its portability,
+        so its serialization can be shared by all their LTI contexts.
+        """
+        return self.build_cache_key(
+            "app_data",
+            self.model.__name__,
+            "instructor",
+            resource.pk,
+            get_app_data_version(resource.pk),
         )
 
     def _get_resource(self):
@@ -466,20 +493,25 @@ class BaseLTIView(BaseModelResourceView, ABC):
             - jwt_token: a short-lived JWT token linked to the resource ID that will be
                 used for authentication and authorization on the API.
         """
-        app_data = None
-        if self.lti.is_student:
-            app_data = cache.get(self.cache_key)
-
         permissions = {"can_access_dashboard": False, "can_update": False}
         session_id = str(uuid.uuid4())
+        is_instructor_or_admin = self.lti.is_instructor or self.lti.is_admin
 
         frontend_home_url = settings.FRONTEND_HOME_URL
         if frontend_home_url.endswith("/"):
             frontend_home_url = frontend_home_url[:-1]
 
-        if app_data is None:
-            is_instructor_or_admin = self.lti.is_instructor or self.lti.is_admin
-
+        if self.lti.is_student and not is_instructor_or_admin:
+            app_data = self._get_base_app_data()
+            app_data["resource"] = get_or_compute_app_data(
+                self.cache_key,
+                lambda: self._get_resource_data(
+                    self._get_resource(),
+                    session_id,
+                    user_id=getattr(self.lti, "user_id", None),
+                ),
+            )
+        else:
             try:
                 resource = self._get_resource()
             except ResourceException:
@@ -544,15 +576,23 @@ class BaseLTIView(BaseModelResourceView, ABC):
             }
 
             app_data = self._get_base_app_data()
-            app_data["resource"] = self._get_resource_data(
-                resource,
-                session_id,
-                is_admin=is_instructor_or_admin,
-                user_id=getattr(self.lti, "user_id", None),
-            )
-
-            if self.lti.is_student:
-                cache.set(self.cache_key, app_data, settings.APP_DATA_CACHE_DURATION)
+            if resource and is_instructor_or_admin:
+                app_data["resource"] = get_or_compute_app_data(
+                    self.get_instructor_cache_key(resource),
+                    lambda: self._get_resource_data(
+                        resource,
+                        session_id,
+                        is_admin=True,
+                        user_id=getattr(self.lti, "user_id", None),
+                    ),
+                )
+            else:
+                app_data["resource"] = self._get_resource_data(
+                    resource,
+                    session_id,
+                    is_admin=is_instructor_or_admin,
+                    user_id=getattr(self.lti, "user_id", None),
+                )
 
         if app_data["resource"] is not None:
             refresh_token = PlaylistRefreshToken.for_lti(
@@ -609,6 +649,7 @@ class BaseView(BaseModelResourceView, ABC):
             "public",
             self.model.__name__,
             self.kwargs["uuid"],
+            get_app_data_version(self.kwargs["uuid"]),
         )
 
     def _get_app_data(self):
@@ -623,30 +664,32 @@ class BaseView(BaseModelResourceView, ABC):
             - resource: representation of the targeted resource including urls for the resource
                 file (e.g. for a video: all resolutions, thumbnails and timed text tracks).
         """
-        app_data = cache.get(self.cache_key)
-
         session_id = str(uuid.uuid4())
 
-        if app_data is None:
+        def get_resource_data():
             resource = self._get_resource()
 
-            app_data = self._get_base_app_data()
-            app_data["resource"] = self._get_resource_data(
-                resource,
-                session_id,
-            )
-
-            cache.set(self.cache_key, app_data, settings.APP_DATA_CACHE_DURATION)
             # if a consumer exists, we save the domain in a dedicated cache in order to use it
             # on every request made to determine if the response headers should be changed in the
-            # get method.
+            # get method. It must outlive the cached app data.
             if resource.playlist.consumer_site:
                 cache.set(
                     self.cache_key_domain,
                     resource.playlist.consumer_site.domain,
-                    settings.PUBLIC_RESOURCE_DOMAIN_CACHE_DURATION,
+                    max(
+                        settings.PUBLIC_RESOURCE_DOMAIN_CACHE_DURATION,
+                        settings.APP_DATA_CACHE_DURATION
+                        + settings.APP_DATA_CACHE_STALE_DURATION,
+                    ),
                 )
 
+            return self._get_resource_data(resource, session_id)
+
+        app_data = self._get_base_app_data()
+        app_data["resource"] = get_or_compute_app_data(
+            self.cache_key, get_resource_data
+        )
+
         if app_data["resource"] is not None:
             refresh_token = PlaylistRefreshToken.for_playlist_id(
                 playlist_id=app_data["resource"]["playlist"]["id"],
@@ -758,20 +801,21 @@ class VideoView(BaseView):
             "direct_access",
             self.model.__name__,
             video_pk,
+            get_app_data_version(video_pk),
         )
-        app_data = cache.get(cache_key)
 
         # activate language depending on livesession
         translation.activate(livesession.language)
 
-        if app_data is None:
-            app_data = self._get_base_app_data()
-            app_data["resource"] = self._get_resource_data(
+        app_data = self._get_base_app_data()
+        app_data["resource"] = get_or_compute_app_data(
+            cache_key,
+            lambda: self._get_resource_data(
                 livesession.video,
                 session_id,
                 user_id=livesession.lti_id,
-            )
-            cache.set(cache_key, app_data, settings.APP_DATA_CACHE_DURATION)
+            ),
+        )
 
         refresh_token = PlaylistRefreshToken.for_live_session(livesession, session_id)
         jwt_token = refresh_token.access_token
@@ -942,17 +986,33 @@ class LTISelectView(BaseResourceView):
             defaults={"title": self.lti.context_title},
         )
 
+        selectable_playlist_ids = get_selectable_playlist_ids(self.lti)
         for resource_kind in lti_select_resources_kind:
             resource_config = lti_select_resources_config[resource_kind]
-            resources = get_selectable_resources(resource_config["model"], self.lti)
-            if resource_config.get("extra_filter"):
-                resources = resource_config["extra_filter"](resources)
-
-            serialized_data = resource_config["serializer"](
-                resources,
-                many=True,
-                context={"request": self.request},
-            ).data
+            # Listings are shared by all instructors of a playlist and are renewed
+            # as soon as a resource of one of the listed playlists changes.
+            cache_key = get_lti_select_cache_key(
+                resource_kind,
+                selectable_playlist_ids,
+                self.lti.get_consumer_site().id,
+                self.lti.context_id,
+                self.request.build_absolute_uri("/"),
+            )
+            serialized_data = cache.get(cache_key)
+
+            if serialized_data is None:
+                resources = get_selectable_resources(resource_config["model"], self.lti)
+                if resource_config.get("extra_filter"):
+                    resources = resource_config["extra_filter"](resources)
+
+                serialized_data = resource_config["serializer"](
+                    resources,
+                    many=True,
+                    context={"request": self.request},
+                ).data
+                cache.set(
+                    cache_key, serialized_data, settings.LTI_SELECT_CACHE_DURATION
+                )
 
             app_data.update(
                 {
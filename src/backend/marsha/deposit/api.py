@@ -12,6 +12,7 @@ from rest_framework.response import Response
 from marsha.core import defaults, permissions as core_permissions, storage
 from marsha.core.api import APIViewMixin, ObjectPkMixin, ObjectRelatedMixin
 from marsha.core.models import ADMINISTRATOR, LTI_ROLES, STUDENT
+from marsha.core.pagination import CursorLimitOffsetPagination
 from marsha.core.utils.time_utils import to_datetime, to_timestamp
 from marsha.deposit import permissions, serializers
 from marsha.deposit.defaults import LTI_ROUTE
@@ -223,6 +224,14 @@ class DepositedFileViewSet(
     queryset = DepositedFile.objects.all()
     serializer_class = serializers.DepositedFileSerializer
     metadata_class = DepositedFileMetadata
+    # The default ordering on the upload date is paginated by offset, cursors are
+    # used when ordering on the creation date
+    filter_backends = [
+        filters.OrderingFilter,
+        django_filters.rest_framework.DjangoFilterBackend,
+    ]
+    ordering_fields = ["created_on"]
+    pagination_class = CursorLimitOffsetPagination
 
     permission_classes = [
         permissions.IsTokenResourceRouteObjectRelatedFileDepository
@@ -10,3 +10,8 @@ class DepositConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "marsha.deposit"
     verbose_name = _("File depository")
+
+    def ready(self):
+        # Signals must be imported and connected once the app is ready.
+        # pylint: disable=import-outside-toplevel, unused-import
+        import marsha.deposit.signals  # noqa
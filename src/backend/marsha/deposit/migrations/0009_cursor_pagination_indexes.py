@@ -0,0 +1,19 @@
+# Generated by Django 5.0.9 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("deposit", "0008_depositedfile_fix_storage_location"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="depositedfile",
+            index=models.Index(
+                fields=["created_on", "id"], name="deposited_file_created_on_idx"
+            ),
+        ),
+    ]
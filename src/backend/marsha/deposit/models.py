@@ -173,6 +173,11 @@ class DepositedFile(UploadableFileMixin, BaseModel):
         ordering = ["-uploaded_on", "-created_on"]
         verbose_name = _("Deposited file")
         verbose_name_plural = _("Deposited files")
+        indexes = [
+            models.Index(
+                fields=["created_on", "id"], name="deposited_file_created_on_idx"
+            ),
+        ]
 
     def get_storage_key(
         self,
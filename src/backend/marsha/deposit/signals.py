@@ -0,0 +1,18 @@
+"""Defines the django signals for the ``deposit`` app."""
+
+from django.db.models.signals import post_delete, post_save
+
+from marsha.core.models.base import post_cascade_softdelete
+from marsha.core.signals import (
+    resource_changed_callback,
+    resources_cascade_softdeleted_callback,
+)
+from marsha.deposit.models import FileDepository
+
+
+# File depositories are served by LTI views and listed by the LTI select view
+post_save.connect(resource_changed_callback, sender=FileDepository)
+post_delete.connect(resource_changed_callback, sender=FileDepository)
+post_cascade_softdelete.connect(
+    resources_cascade_softdeleted_callback, sender=FileDepository
+)
@@ -0,0 +1,388 @@
+"""For development purpose only, benchmark the main API endpoints against budgets."""
+
+import json
+import math
+from pathlib import Path
+import time
+import tracemalloc
+import uuid
+
+from django.conf import settings
+from django.core.management import CommandError
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from asgiref.sync import async_to_sync
+from channels.testing import WebsocketCommunicator
+from oauthlib import oauth1
+
+from marsha.core.defaults import JITSI, RUNNING
+from marsha.core.factories import (
+    AnonymousLiveSessionFactory,
+    ConsumerSiteFactory,
+    ConsumerSiteLTIPassportFactory,
+    PlaylistAccessFactory,
+    PlaylistFactory,
+    VideoFactory,
+    WebinarVideoFactory,
+)
+from marsha.core.models import ADMINISTRATOR, STUDENT, LiveSession, Video
+from marsha.core.simple_jwt.factories import (
+    StudentLtiTokenFactory,
+    UserAccessTokenFactory,
+)
+from marsha.core.utils.time_utils import to_timestamp
+from marsha.websocket.application import base_application
+
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "benchmark_baseline.json"
+BULK_CREATE_BATCH_SIZE = 1000
+BENCHMARK_DOMAIN = "benchmark.marsha.local"
+
+
+def percentile(durations, rank):
+    """Return the duration under which `rank` percent of the durations are.
+
+    Parameters
+    ----------
+    durations : List[float]
+        The durations measured, in any order.
+    rank : int
+        The percentile to compute, between 1 and 100.
+
+    Returns
+    -------
+    float
+        The smallest duration greater than or equal to `rank` percent of the durations.
+    """
+    durations = sorted(durations)
+    return durations[max(math.ceil(len(durations) * rank / 100) - 1, 0)]
+
+
+class Command(BaseCommand):
+    """
+    Benchmark the main API endpoints on realistic data volumes.
+
+    Query counts, p50/p99 latencies and peak memory are measured for each endpoint
+    and compared to a baseline, the command fails when one of them exceeds its
+    budget. Datasets are created in the database, run it on a dedicated database.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        """Add arguments to management command."""
+        parser.add_argument(
+            "--videos",
+            type=int,
+            default=2000,
+            help="Number of videos in the benchmarked playlist",
+        )
+        parser.add_argument(
+            "--live-sessions",
+            type=int,
+            default=20000,
+            help="Number of live sessions of the benchmarked webinar",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Number of requests measured for each endpoint",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(BASELINE_PATH),
+            help="Path of the JSON file holding the baseline",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Ratio by which latencies and memory may exceed the baseline",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            default=False,
+            help="Write the results as the new baseline instead of checking them",
+        )
+
+    def handle(self, *args, **options):
+        """Execute management command."""
+        if not settings.DEBUG:
+            raise CommandError(
+                "This command can only be executed when settings.DEBUG is True."
+            )
+
+        datasets = {
+            "videos": options["videos"],
+            "live_sessions": options["live_sessions"],
+        }
+        baseline = None
+        if not options["update_baseline"]:
+            try:
+                with open(options["baseline"], encoding="utf-8") as baseline_file:
+                    baseline = json.load(baseline_file)
+            except FileNotFoundError as error:
+                raise CommandError(
+                    f"No baseline found at {options['baseline']}, "
+                    "run the command with --update-baseline first."
+                ) from error
+            if baseline["datasets"] != datasets:
+                raise CommandError(
+                    f"The baseline was measured on other datasets: {baseline['datasets']}."
+                )
+
+        self.stdout.write("Creating datasets...")
+        dataset = self._create_datasets(**datasets)
+        self.stdout.write(" - done.")
+
+        results = {}
+        for name, scenario in self._get_scenarios(dataset).items():
+            self.stdout.write(f"Benchmarking {name}...")
+            results[name] = self._measure(scenario, options["iterations"])
+            self.stdout.write(
+                " - {queries} queries, p50 {p50_ms} ms, p99 {p99_ms} ms, "
+                "peak memory {peak_memory_kib} KiB.".format(**results[name])
+            )
+
+        if options["update_baseline"]:
+            with open(options["baseline"], "w", encoding="utf-8") as baseline_file:
+                json.dump(
+                    {"datasets": datasets, "endpoints": results},
+                    baseline_file,
+                    indent=2,
+                    sort_keys=True,
+                )
+                baseline_file.write("\n")
+            self.stdout.write(f"Baseline written to {options['baseline']}.")
+            return
+
+        exceeded = self._check_budgets(
+            results, baseline["endpoints"], options["tolerance"]
+        )
+        if exceeded:
+            raise CommandError(
+                "Budgets exceeded:\n" + "\n".join(f" - {error}" for error in exceeded)
+            )
+        self.stdout.write("All budgets are respected.")
+
+    @staticmethod
+    def _create_datasets(videos, live_sessions):
+        """Create a playlist of videos and a webinar with its live sessions."""
+        consumer_site = ConsumerSiteFactory(
+            domain=f"{uuid.uuid4().hex}.{BENCHMARK_DOMAIN}"
+        )
+        playlist = PlaylistFactory(consumer_site=consumer_site)
+
+        # Save them in bulk, they need no behavior of their `save` method
+        Video.objects.bulk_create(
+            VideoFactory.build_batch(videos, playlist=playlist),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        webinar = WebinarVideoFactory(
+            playlist=playlist,
+            live_state=RUNNING,
+            live_type=JITSI,
+            live_info={"started_at": to_timestamp(timezone.now())},
+        )
+        started_at = int(to_timestamp(timezone.now()))
+        LiveSession.objects.bulk_create(
+            AnonymousLiveSessionFactory.build_batch(
+                live_sessions,
+                video=webinar,
+                is_registered=True,
+                live_attendance={
+                    str(started_at + 30 * i): {"onStage": 0, "playing": 1}
+                    for i in range(10)
+                },
+            ),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        return {
+            "passport": ConsumerSiteLTIPassportFactory(consumer_site=consumer_site),
+            "playlist": playlist,
+            "video": VideoFactory(playlist=playlist),
+            "webinar": webinar,
+            "admin": PlaylistAccessFactory(playlist=playlist, role=ADMINISTRATOR).user,
+            "student": PlaylistAccessFactory(playlist=playlist, role=STUDENT).user,
+        }
+
+    @staticmethod
+    def _get_scenarios(dataset):
+        """Return the requests to benchmark with their expected result.
+
+        Each scenario prepares a request, its tokens and signature are generated
+        out of the measures and cannot expire while the benchmark runs.
+        """
+        passport = dataset["passport"]
+        playlist = dataset["playlist"]
+        video = dataset["video"]
+        webinar = dataset["webinar"]
+        admin = dataset["admin"]
+        student = dataset["student"]
+        client = Client()
+
+        def get(url, user):
+            token = UserAccessTokenFactory(user=user)
+            return lambda: client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        def post(url, data, token):
+            return lambda: client.post(
+                url,
+                data,
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {token}",
+            )
+
+        def lti_launch():
+            # Each launch request is signed with its own nonce and timestamp
+            url = f"http://testserver/lti/videos/{video.id}"
+            _uri, _headers, body = oauth1.Client(
+                client_key=passport.oauth_consumer_key,
+                client_secret=passport.shared_secret,
+                signature_type=oauth1.SIGNATURE_TYPE_BODY,
+            ).sign(
+                url,
+                http_method="POST",
+                body={
+                    "resource_link_id": "benchmark",
+                    "context_id": playlist.lti_id,
+                    "roles": "student",
+                    "user_id": "benchmark",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            return lambda: client.post(
+                url,
+                body,
+                content_type="application/x-www-form-urlencoded",
+                HTTP_REFERER=f"https://{passport.consumer_site.domain}/",
+            )
+
+        def websocket_connect():
+            token = UserAccessTokenFactory(user=admin)
+
+            @async_to_sync
+            async def connect():
+                communicator = WebsocketCommunicator(
+                    base_application, f"ws/video/{video.id}/?jwt={token}"
+                )
+                connected, _subprotocol = await communicator.connect()
+                await communicator.disconnect()
+                return connected
+
+            return connect
+
+        return {
+            "video_list": (
+                lambda: get(f"/api/videos/?playlist={playlist.id}", admin),
+                200,
+            ),
+            "video_retrieve": (lambda: get(f"/api/videos/{video.id}/", admin), 200),
+            "lti_launch": (lti_launch, 200),
+            "list_attendances": (
+                lambda: get(
+                    f"/api/videos/{webinar.id}/livesessions/list_attendances/", admin
+                ),
+                200,
+            ),
+            "push_attendance": (
+                lambda: post(
+                    f"/api/videos/{webinar.id}/livesessions/push_attendance/",
+                    {
+                        "live_attendance": {
+                            to_timestamp(timezone.now()): {"playing": 1}
+                        },
+                        "language": "fr",
+                    },
+                    UserAccessTokenFactory(user=student),
+                ),
+                200,
+            ),
+            "xapi_statement": (
+                lambda: post(
+                    f"/xapi/video/{video.id}/",
+                    {
+                        "id": str(uuid.uuid4()),
+                        "verb": {
+                            "id": "http://adlnet.gov/expapi/verbs/initialized",
+                            "display": {"en-US": "initialized"},
+                        },
+                        "context": {
+                            "extensions": {
+                                "https://w3id.org/xapi/video/extensions/volume": 1
+                            }
+                        },
+                    },
+                    StudentLtiTokenFactory(playlist=playlist),
+                ),
+                200,
+            ),
+            "websocket_connect": (websocket_connect, True),
+        }
+
+    def _measure(self, scenario, iterations):
+        """Run a scenario and measure its query count, latencies and peak memory."""
+        prepare, expected = scenario
+        durations = []
+        queries = 0
+
+        for _i in range(iterations):
+            request = prepare()
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = request()
+                durations.append(time.perf_counter() - start)
+
+            result = getattr(response, "status_code", response)
+            if result != expected:
+                raise CommandError(f"Unexpected result {result}, expected {expected}.")
+            queries = max(queries, len(context.captured_queries))
+
+        # Memory is traced apart, tracing slows down the measured requests
+        request = prepare()
+        tracemalloc.start()
+        try:
+            request()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "queries": queries,
+            "p50_ms": round(percentile(durations, 50) * 1000, 1),
+            "p99_ms": round(percentile(durations, 99) * 1000, 1),
+            "peak_memory_kib": math.ceil(peak / 1024),
+        }
+
+    @staticmethod
+    def _check_budgets(results, baseline, tolerance):
+        """List the measures exceeding the baseline.
+
+        Query counts must not exceed the baseline, latencies and peak memory may
+        exceed it by the `tolerance` ratio.
+        """
+        exceeded = []
+        for name, result in results.items():
+            if name not in baseline:
+                exceeded.append(f"{name}: missing from the baseline")
+                continue
+
+            for measure, value in result.items():
+                budget = baseline[name][measure]
+                if measure != "queries":
+                    budget = budget * (1 + tolerance)
+                if value > budget:
+                    exceeded.append(
+                        f"{name}: {measure} {value} exceeds {budget:g} "
+                        f"(baseline {baseline[name][measure]})"
+                    )
+
+        return exceeded
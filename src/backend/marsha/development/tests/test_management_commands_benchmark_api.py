@@ -0,0 +1,113 @@
+"""Test the development ``benchmark_api`` management command."""
+
+from io import StringIO
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase, override_settings
+
+
+@override_settings(DEBUG=True)
+class BenchmarkApiTestCase(TransactionTestCase):
+    """Test the ``benchmark_api`` management command."""
+
+    maxDiff = None
+
+    def setUp(self):
+        super().setUp()
+        baseline_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, baseline_dir)
+        self.baseline = os.path.join(baseline_dir, "baseline.json")
+        self.options = {
+            "videos": 3,
+            "live_sessions": 5,
+            "iterations": 2,
+            "baseline": self.baseline,
+        }
+
+    def _get_baseline(self):
+        with open(self.baseline, encoding="utf-8") as baseline_file:
+            return json.load(baseline_file)
+
+    def _set_baseline(self, baseline):
+        with open(self.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file)
+
+    @override_settings(DEBUG=False)
+    def test_command_not_debug(self):
+        """The command creates data, it only runs in DEBUG mode."""
+        with self.assertRaises(CommandError):
+            call_command("benchmark_api", stdout=StringIO(), **self.options)
+
+    def test_command_update_baseline(self):
+        """The results are written as the new baseline."""
+        out = StringIO()
+
+        call_command("benchmark_api", update_baseline=True, stdout=out, **self.options)
+
+        baseline = self._get_baseline()
+        self.assertEqual(baseline["datasets"], {"videos": 3, "live_sessions": 5})
+        self.assertEqual(
+            sorted(baseline["endpoints"]),
+            [
+                "list_attendances",
+                "lti_launch",
+                "push_attendance",
+                "video_list",
+                "video_retrieve",
+                "websocket_connect",
+                "xapi_statement",
+            ],
+        )
+        for result in baseline["endpoints"].values():
+            self.assertEqual(
+                sorted(result), ["p50_ms", "p99_ms", "peak_memory_kib", "queries"]
+            )
+            self.assertGreater(result["queries"], 0)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertIn(f"Baseline written to {self.baseline}.", out.getvalue())
+
+    def test_command_no_baseline(self):
+        """The baseline must be written before being checked."""
+        with self.assertRaises(CommandError) as context:
+            call_command("benchmark_api", stdout=StringIO(), **self.options)
+
+        self.assertIn("--update-baseline", str(context.exception))
+
+    def test_command_other_datasets(self):
+        """The baseline is only checked on the datasets it was measured on."""
+        self._set_baseline(
+            {"datasets": {"videos": 2000, "live_sessions": 20000}, "endpoints": {}}
+        )
+
+        with self.assertRaises(CommandError) as context:
+            call_command("benchmark_api", stdout=StringIO(), **self.options)
+
+        self.assertIn("other datasets", str(context.exception))
+
+    def test_command_budgets(self):
+        """The command fails when a measure exceeds its budget."""
+        call_command(
+            "benchmark_api", update_baseline=True, stdout=StringIO(), **self.options
+        )
+        baseline = self._get_baseline()
+
+        # Generous budgets are respected
+        for result in baseline["endpoints"].values():
+            result.update(p50_ms=10**6, p99_ms=10**6, peak_memory_kib=10**6)
+        self._set_baseline(baseline)
+        out = StringIO()
+        call_command("benchmark_api", stdout=out, **self.options)
+        self.assertIn("All budgets are respected.", out.getvalue())
+
+        # One query more than the baseline exceeds the budget
+        baseline["endpoints"]["video_retrieve"]["queries"] -= 1
+        self._set_baseline(baseline)
+        with self.assertRaises(CommandError) as context:
+            call_command("benchmark_api", stdout=StringIO(), **self.options)
+
+        self.assertIn("video_retrieve: queries", str(context.exception))
+        self.assertNotIn("video_list", str(context.exception))
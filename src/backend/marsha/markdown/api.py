@@ -1,7 +1,13 @@
 """Declare API endpoints with Django RestFramework viewsets."""
 
+import hashlib
+import json
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Q
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 
 import django_filters
 from rest_framework import filters, mixins, viewsets
@@ -12,6 +18,8 @@ from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
 from marsha.core import defaults, permissions as core_permissions, storage
 from marsha.core.api import APIViewMixin, ObjectPkMixin, ObjectRelatedMixin
 from marsha.core.models import ADMINISTRATOR
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
 from marsha.core.utils.time_utils import to_datetime
 from marsha.markdown import permissions as markdown_permissions, serializers
 from marsha.markdown.defaults import LTI_ROUTE
@@ -58,7 +66,7 @@ class MarkdownDocumentViewSet(
     """Viewset for the API of the Markdown document object."""
 
     queryset = (
-        MarkdownDocument.objects.prefetch_related("translations")
+        MarkdownDocument.objects.prefetch_related("translations", "images")
         .select_related("playlist")
         .all()
     )
@@ -116,6 +124,11 @@ class MarkdownDocumentViewSet(
             ]
         elif self.action in ["list"]:
             permission_classes = [core_permissions.UserIsAuthenticated]
+        elif self.action in ["rendered"]:
+            permission_classes = [
+                core_permissions.IsPlaylistTokenMatchingRouteObject
+                | markdown_permissions.IsMarkdownDocumentPlaylistOrOrganizationAdmin
+            ]
         else:
             permission_classes = self.permission_classes
         return [permission() for permission in permission_classes]
@@ -145,6 +158,14 @@ class MarkdownDocumentViewSet(
         if self.action in ["list"]:
             return self._get_list_queryset()
 
+        if self.action in ["rendered"] and not (
+            core_permissions.IsTokenInstructor().has_permission(self.request, self)
+            or core_permissions.IsTokenAdmin().has_permission(self.request, self)
+            or core_permissions.UserIsAuthenticated().has_permission(self.request, self)
+        ):
+            # Students only read the documents published
+            return super().get_queryset().filter(MarkdownDocument.get_ready_clause())
+
         return super().get_queryset()
 
     def create(self, request, *args, **kwargs):
@@ -187,7 +208,9 @@ class MarkdownDocumentViewSet(
         markdown_documents = serializers.MarkdownDocumentSelectLTISerializer(
             MarkdownDocument.objects.filter(
                 playlist__id=request.resource.id,
-            ),
+            )
+            .prefetch_related("translations", "images")
+            .select_related("playlist"),
             many=True,
             context={"request": self.request},
         ).data
@@ -199,6 +222,45 @@ class MarkdownDocumentViewSet(
             }
         )
 
+    @action(methods=["get"], detail=True)
+    # pylint: disable=unused-argument
+    def rendered(self, request, *args, **kwargs):
+        """Get the rendered content of a Markdown document in a single language.
+
+        The language is resolved from the `language` query parameter, defaulting to the
+        locale of the token. The response carries an ETag hashed from its content and
+        conditional requests get a 304 response while the content does not change.
+
+        Parameters
+        ----------
+        request : Type[django.http.request.HttpRequest]
+            The request on the API endpoint
+
+        Returns
+        -------
+        Type[rest_framework.response.Response]
+            HttpResponse carrying the rendered document as a JSON object.
+
+        """
+        language = request.query_params.get("language")
+        if not language and request.resource:
+            language = request.resource.token.payload.get("locale")
+
+        data = serializers.MarkdownDocumentRenderedSerializer(
+            self.get_object(),
+            context={"request": request, "language": language},
+        ).data
+
+        etag = quote_etag(
+            hashlib.sha256(
+                json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        )
+        response = get_conditional_response(request, etag=etag) or Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
     @action(
         methods=["post"],
         detail=True,  # Add the markdown document ID, not used for now
@@ -375,6 +437,9 @@ class MarkdownImageViewSet(
             upload_state=defaults.PENDING,
             extension=serializer.validated_data["extension"],
         )
+        # `update` sends no signal, the cached app data and LTI select listings are renewed here
+        invalidate_app_data_cache(markdown_image.markdown_document_id)
+        invalidate_lti_select_cache(markdown_image.markdown_document.playlist_id)
 
         return Response(presigned_post)
 
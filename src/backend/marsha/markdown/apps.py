@@ -10,3 +10,9 @@ class MarkdownConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "marsha.markdown"
     verbose_name = _("Markdown")
+
+    def ready(self):
+        # Signals must be imported and connected once the app is ready.
+        # Callbacks are connected thanks to the "receiver" decorator.
+        # pylint: disable=import-outside-toplevel, unused-import
+        import marsha.markdown.signals  # noqa
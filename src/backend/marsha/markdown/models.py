@@ -7,8 +7,9 @@ checks and validation that go further than what Django is doing.
 
 import logging
 
+from django.conf import settings
 from django.db import models
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_lazy as _, to_language
 
 from parler.managers import TranslatableManager
 from parler.models import TranslatableModelMixin, TranslatedFields
@@ -157,6 +158,36 @@ class MarkdownDocument(TranslatableModelMixin, BaseModel):
         """Return the consumer site linked to this file via the playlist."""
         return self.playlist.consumer_site
 
+    def get_translation_for(self, language):
+        """
+        Return the translation best matching a language, from the prefetched translations.
+
+        Parameters
+        ----------
+        language : str
+            A language code or a locale (e.g. `fr` or `fr_FR`), may be None.
+
+        Returns
+        -------
+        MarkdownDocumentTranslation
+            The translation in the language, else in the same language without its region,
+            else in the default language, else the first one. None if the document is not
+            translated at all.
+        """
+        translations = {
+            translation.language_code: translation
+            for translation in self.translations.all()
+        }
+        candidates = [settings.PARLER_DEFAULT_LANGUAGE_CODE]
+        if language:
+            language = to_language(language)
+            candidates = [language, language.split("-")[0], *candidates]
+
+        for candidate in candidates:
+            if candidate in translations:
+                return translations[candidate]
+        return next(iter(translations.values()), None)
+
 
 class MarkdownImage(AbstractImage):
     """Model for image included in a Markdown document.
@@ -198,6 +198,19 @@ class MarkdownDocumentTranslationsSerializer(serializers.ModelSerializer):
         )
 
 
+class MarkdownDocumentRenderedTranslationsSerializer(serializers.ModelSerializer):
+    """A serializer to display documents' translations without their Markdown source."""
+
+    class Meta:  # noqa
+        # pylint: disable-next=protected-access
+        model = MarkdownDocument._parler_meta.root.model
+        fields = (
+            "language_code",
+            "title",
+            "rendered_content",
+        )
+
+
 class MarkdownDocumentSerializer(serializers.ModelSerializer):
     """A serializer to display a MarkdownDocument resource."""
 
@@ -230,6 +243,35 @@ class MarkdownDocumentSerializer(serializers.ModelSerializer):
     images = MarkdownImageSerializer(many=True, read_only=True)
 
 
+class MarkdownDocumentRenderedSerializer(MarkdownDocumentSerializer):
+    """
+    A serializer to display a MarkdownDocument resource to students.
+
+    Students only read the rendered content: the Markdown sources are left out and,
+    when a `language` is given in the context, only the translation best matching
+    it is kept.
+    """
+
+    class Meta:  # noqa
+        model = MarkdownDocument
+        fields = MarkdownDocumentSerializer.Meta.fields
+        read_only_fields = MarkdownDocumentSerializer.Meta.read_only_fields
+
+    translations = serializers.SerializerMethodField()
+
+    def get_translations(self, obj):
+        """Rendered translations of the document, in the requested language if any."""
+        if "language" not in self.context:
+            translations = obj.translations.all()
+        else:
+            translation = obj.get_translation_for(self.context["language"])
+            translations = [translation] if translation else []
+
+        return MarkdownDocumentRenderedTranslationsSerializer(
+            translations, many=True
+        ).data
+
+
 class MarkdownDocumentSelectLTISerializer(MarkdownDocumentSerializer):
     """A serializer to display a MarkdownDocument resource for LTI select content request."""
 
@@ -0,0 +1,56 @@
+"""Defines the django signals for the ``markdown`` app."""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from marsha.core.models.base import post_cascade_softdelete
+from marsha.core.signals import (
+    resource_changed_callback,
+    resources_cascade_softdeleted_callback,
+)
+from marsha.core.utils.app_data_utils import invalidate_app_data_cache
+from marsha.core.utils.lti_select_utils import invalidate_lti_select_cache
+from marsha.markdown.models import MarkdownDocument, MarkdownImage
+
+
+# Markdown documents are served by LTI views and listed by the LTI select view
+post_save.connect(resource_changed_callback, sender=MarkdownDocument)
+post_delete.connect(resource_changed_callback, sender=MarkdownDocument)
+post_cascade_softdelete.connect(
+    resources_cascade_softdeleted_callback, sender=MarkdownDocument
+)
+
+
+@receiver(post_save, sender=MarkdownImage)
+@receiver(post_delete, sender=MarkdownImage)
+def markdown_image_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a Markdown image.
+    The cached app data of its document and the cached LTI select listings including
+    the playlist of its document must be renewed.
+    """
+    if raw:
+        return
+
+    invalidate_app_data_cache(instance.markdown_document_id)
+    try:
+        invalidate_lti_select_cache(instance.markdown_document.playlist_id)
+    except ObjectDoesNotExist:
+        pass
+
+
+@receiver(post_save, sender=MarkdownDocument.translations.rel.related_model)
+@receiver(post_delete, sender=MarkdownDocument.translations.rel.related_model)
+def markdown_document_translation_changed_callback(instance, raw=False, **kwargs):
+    """
+    Callback answering the save and delete of a Markdown document translation.
+    Translations are saved apart from their document, which is serialized with them.
+    """
+    if raw:
+        return
+
+    try:
+        resource_changed_callback(instance.master)
+    except ObjectDoesNotExist:
+        pass
@@ -0,0 +1,167 @@
+"""Tests for the Markdown application rendered API."""
+
+import json
+
+from django.test import TestCase, override_settings
+
+from marsha.core.factories import PlaylistAccessFactory
+from marsha.core.models import ADMINISTRATOR
+from marsha.core.simple_jwt.factories import (
+    InstructorOrAdminLtiTokenFactory,
+    StudentLtiTokenFactory,
+    UserAccessTokenFactory,
+)
+from marsha.markdown.factories import (
+    MarkdownDocumentFactory,
+    MarkdownDocumenTranslationFactory,
+)
+
+
+# We don't enforce arguments documentation in tests
+# pylint: disable=unused-argument
+
+
+@override_settings(MARKDOWN_ENABLED=True)
+class MarkdownRenderedAPITest(TestCase):
+    """Test for the Markdown document rendered API."""
+
+    maxDiff = None
+
+    def setUp(self):
+        """Create a document translated in english and french."""
+        super().setUp()
+        self.markdown_document = MarkdownDocumentFactory(
+            pk="4c51f469-f91e-4998-b438-e31ee3bd3ea6",
+            is_draft=False,
+            translations__title="Amazing title",
+            translations__content="# Heading1\nSome content",
+            translations__rendered_content="<h1>Heading1</h1>\n<p>Some content</p>",
+        )
+        MarkdownDocumenTranslationFactory(
+            master=self.markdown_document,
+            language_code="fr",
+            title="Titre incroyable",
+            content="# Titre1\nDu contenu",
+            rendered_content="<h1>Titre1</h1>\n<p>Du contenu</p>",
+        )
+
+    def _get_rendered(self, jwt_token, query="", **extra):
+        """Get the rendered document."""
+        return self.client.get(
+            f"/api/markdown-documents/{self.markdown_document.pk}/rendered/{query}",
+            HTTP_AUTHORIZATION=f"Bearer {jwt_token}",
+            **extra,
+        )
+
+    def test_api_document_rendered_anonymous(self):
+        """Anonymous users should not be able to get a rendered document."""
+        response = self.client.get(
+            f"/api/markdown-documents/{self.markdown_document.pk}/rendered/"
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_api_document_rendered_student(self):
+        """A student gets the rendered content in the locale of the token."""
+        jwt_token = StudentLtiTokenFactory(
+            playlist=self.markdown_document.playlist, locale="fr_FR"
+        )
+
+        response = self._get_rendered(jwt_token)
+
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(
+            content["translations"],
+            [
+                {
+                    "language_code": "fr",
+                    "title": "Titre incroyable",
+                    "rendered_content": "<h1>Titre1</h1>\n<p>Du contenu</p>",
+                }
+            ],
+        )
+        self.assertEqual(content["id"], "4c51f469-f91e-4998-b438-e31ee3bd3ea6")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_api_document_rendered_student_language(self):
+        """The language requested overrides the locale, with a fallback on the default."""
+        jwt_token = StudentLtiTokenFactory(
+            playlist=self.markdown_document.playlist, locale="fr_FR"
+        )
+
+        response = self._get_rendered(jwt_token, "?language=en")
+        self.assertEqual(
+            json.loads(response.content)["translations"][0]["language_code"], "en"
+        )
+
+        response = self._get_rendered(jwt_token, "?language=de")
+        self.assertEqual(
+            json.loads(response.content)["translations"][0]["language_code"], "en"
+        )
+
+    def test_api_document_rendered_not_modified(self):
+        """A conditional request gets a 304 until the content changes."""
+        jwt_token = StudentLtiTokenFactory(playlist=self.markdown_document.playlist)
+        etag = self._get_rendered(jwt_token)["ETag"]
+
+        response = self._get_rendered(jwt_token, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        translation = self.markdown_document.translations.get(language_code="en")
+        translation.rendered_content = "<p>Updated</p>"
+        translation.save()
+
+        response = self._get_rendered(jwt_token, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_api_document_rendered_student_draft(self):
+        """A student can not read a draft document."""
+        self.markdown_document.is_draft = True
+        self.markdown_document.save()
+        jwt_token = StudentLtiTokenFactory(playlist=self.markdown_document.playlist)
+
+        response = self._get_rendered(jwt_token)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_api_document_rendered_instructor_draft(self):
+        """An instructor can preview a draft document."""
+        self.markdown_document.is_draft = True
+        self.markdown_document.save()
+        jwt_token = InstructorOrAdminLtiTokenFactory(
+            playlist=self.markdown_document.playlist
+        )
+
+        response = self._get_rendered(jwt_token)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_api_document_rendered_other_playlist(self):
+        """A student can not read a document of another playlist."""
+        jwt_token = StudentLtiTokenFactory()
+
+        response = self._get_rendered(jwt_token)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_api_document_rendered_playlist_admin(self):
+        """A playlist administrator gets the rendered document."""
+        playlist_access = PlaylistAccessFactory(
+            playlist=self.markdown_document.playlist, role=ADMINISTRATOR
+        )
+        jwt_token = UserAccessTokenFactory(user=playlist_access.user)
+
+        with self.assertNumQueries(5):
+            response = self._get_rendered(jwt_token, "?language=fr")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content)["translations"][0]["language_code"], "fr"
+        )
@@ -0,0 +1,38 @@
+"""Tests for the signals of the ``markdown`` app of the Marsha project."""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from marsha.core.utils.lti_select_utils import LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY
+from marsha.markdown.factories import MarkdownDocumentFactory, MarkdownImageFactory
+
+
+class MarkdownSignalsTestCase(TestCase):
+    """Test the cached LTI select listings are renewed when a Markdown document changes."""
+
+    def _get_version(self, playlist):
+        return cache.get(
+            LTI_SELECT_PLAYLIST_VERSION_CACHE_KEY.format(playlist_id=playlist.id)
+        )
+
+    def test_signals_markdown_document(self):
+        """Saving a Markdown document renews the version of its playlist."""
+        markdown_document = MarkdownDocumentFactory()
+        version = self._get_version(markdown_document.playlist)
+
+        markdown_document.save()
+
+        self.assertNotEqual(self._get_version(markdown_document.playlist), version)
+
+    def test_signals_markdown_image(self):
+        """Saving or deleting a Markdown image renews the version of its document playlist."""
+        markdown_document = MarkdownDocumentFactory()
+        playlist = markdown_document.playlist
+        version = self._get_version(playlist)
+
+        markdown_image = MarkdownImageFactory(markdown_document=markdown_document)
+        self.assertNotEqual(self._get_version(playlist), version)
+
+        version = self._get_version(playlist)
+        markdown_image.delete()
+        self.assertNotEqual(self._get_version(playlist), version)
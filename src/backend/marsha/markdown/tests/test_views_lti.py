@@ -70,6 +70,17 @@ class MarkdownLTIViewTestCase(TestCase):
         jwt_token = PlaylistAccessToken(context.get("jwt"))
         self.assertEqual(context.get("state"), "success")
         self.assertIsNotNone(context.get("resource"))
+        # Students only get the rendered content, not the Markdown sources
+        self.assertEqual(
+            context["resource"]["translations"],
+            [
+                {
+                    "language_code": "en",
+                    "title": markdown_document.title,
+                    "rendered_content": markdown_document.rendered_content,
+                }
+            ],
+        )
         self.assertEqual(context.get("modelName"), "markdown-documents")
         self.assertEqual(
             jwt_token.payload["user"],
@@ -2,7 +2,10 @@
 
 from marsha.core.views import BaseLTIView
 from marsha.markdown.models import MarkdownDocument
-from marsha.markdown.serializers import MarkdownDocumentSerializer
+from marsha.markdown.serializers import (
+    MarkdownDocumentRenderedSerializer,
+    MarkdownDocumentSerializer,
+)
 
 
 class MarkdownDocumentView(BaseLTIView):
@@ -10,3 +13,19 @@ class MarkdownDocumentView(BaseLTIView):
 
     model = MarkdownDocument
     serializer_class = MarkdownDocumentSerializer
+
+    def _get_resource_data(self, resource, session_id, is_admin=False, user_id=None):
+        """Students only get the rendered content of the document, in all its languages."""
+        if not resource or is_admin:
+            return super()._get_resource_data(
+                resource, session_id, is_admin=is_admin, user_id=user_id
+            )
+
+        return MarkdownDocumentRenderedSerializer(
+            resource,
+            context={
+                "is_admin": is_admin,
+                "user_id": user_id,
+                "session_id": session_id,
+            },
+        ).data
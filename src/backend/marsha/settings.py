@@ -299,6 +299,7 @@ class Base(Configuration):
     ]
 
     JWT_SIGNING_KEY = values.Value(SECRET_KEY)
+    JWT_VALIDATED_TOKEN_CACHE_SIZE = values.PositiveIntegerValue(1000)
 
     # Internationalization
     # https://docs.djangoproject.com/en/2.0/topics/i18n/
@@ -426,10 +427,17 @@ class Base(Configuration):
     BBB_API_SECRET = values.Value(None)
     BBB_API_CALLBACK_SECRET = values.Value(None)
     BBB_API_TIMEOUT = values.PositiveIntegerValue(10)
+    BBB_API_POOL_SIZE = values.PositiveIntegerValue(10)
+    # Below the lifetime of the signed urls of the documents the payload contains
+    BBB_CREATE_PAYLOAD_CACHE_TIMEOUT = values.PositiveIntegerValue(600)
     ALLOWED_CLASSROOM_DOCUMENT_MIME_TYPES = values.ListValue(["application/pdf"])
     BBB_INVITE_JWT_DEFAULT_DAYS_DURATION = values.PositiveIntegerValue(30)
     BBB_INVITE_JWT_INSTRUCTOR_DAYS_DURATION = values.PositiveIntegerValue(30)
     RECORDINGS_URL_CACHE_TIMEOUT = values.PositiveIntegerValue(3000)
+    # Recordings are copied to the video storage in parts transferred concurrently
+    RECORDING_TRANSFER_PART_SIZE = values.PositiveIntegerValue(16 * (2**20))  # 16MB
+    RECORDING_TRANSFER_CONCURRENCY = values.PositiveIntegerValue(4)
+    RECORDING_TRANSFER_TIMEOUT = values.PositiveIntegerValue(30)
     BBB_INVITE_TOKEN_BANNED_LIST = values.ListValue([])
 
     # deposit application
@@ -453,7 +461,11 @@ class Base(Configuration):
     BYPASS_LTI_VERIFICATION = values.BooleanValue(False)
 
     # Cache
-    APP_DATA_CACHE_DURATION = values.Value(60)  # 60 seconds
+    APP_DATA_CACHE_DURATION = values.Value(300)  # 5 minutes
+    APP_DATA_CACHE_STALE_DURATION = values.Value(60)  # 60 seconds
+    CURSOR_PAGINATION_COUNT_CACHE_TIMEOUT = values.Value(60)  # 60 seconds
+    LTI_SELECT_CACHE_DURATION = values.Value(3600)  # 1 hour
+    PORTABILITY_CACHE_DURATION = values.Value(3600)  # 1 hour
     PUBLIC_RESOURCE_DOMAIN_CACHE_DURATION = values.Value(90)  # 90 seconds
     VIDEO_ATTENDANCES_CACHE_DURATION = values.Value(300)  # 5 minutes
     XAPI_STATEMENT_ID_CACHE_TIMEOUT = values.Value(120)  # 2 minutes
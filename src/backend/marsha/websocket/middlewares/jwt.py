@@ -4,9 +4,12 @@ import logging
 from urllib.parse import parse_qs
 
 from channels.generic.websocket import AsyncWebsocketConsumer
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
 
+from marsha.core.simple_jwt.authentication import (
+    JWTStatelessUserOrPlaylistAuthentication,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +68,10 @@ class JWTMiddleware:
 
         try:
             # Try to validate token against all accepted token types defined in
-            # `api_settings.AUTH_TOKEN_CLASSES`.
-            return JWTAuthentication().get_validated_token(raw_token[0])
+            # `api_settings.AUTH_TOKEN_CLASSES`, unless it was already validated.
+            return JWTStatelessUserOrPlaylistAuthentication().get_validated_token(
+                raw_token[0]
+            )
         except InvalidToken as err:
             logger.debug("Invalid jwt token")
             raise err
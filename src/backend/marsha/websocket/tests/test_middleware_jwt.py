@@ -8,6 +8,7 @@ from django.utils import timezone
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.testing import WebsocketCommunicator
 
+from marsha.core.simple_jwt.authentication import validated_token_cache
 from marsha.core.simple_jwt.factories import PlaylistAccessTokenFactory
 from marsha.websocket.middlewares import JWTMiddleware
 
@@ -59,6 +60,19 @@ class JWTMiddlewareTest(TestCase):
         self.assertTrue(connected)
         await communicator.disconnect()
 
+    def test_validate_jwt_cached(self):
+        """A token already validated is served from the cache."""
+        validated_token_cache.clear()
+        token = PlaylistAccessTokenFactory()
+        middleware = JWTMiddleware(AsyncWebsocketConsumer())
+        scope = {"query_string": f"jwt={token}".encode("utf-8")}
+
+        validated_token = middleware.validate_jwt(scope)
+
+        self.assertEqual(validated_token.payload, token.payload)
+        self.assertIs(middleware.validate_jwt(scope), validated_token)
+        validated_token_cache.clear()
+
     async def test_invalid_scope_type(self):
         """Only websocket scope type is accepted."""
 